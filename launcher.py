@@ -1,30 +1,80 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import subprocess
 import threading
-import time
 import os
-from PIL import Image, ImageTk
-import pygame
 import sys
-import psutil
+import argparse
 import json
+import queue
+import bisect
 import logging
 from datetime import datetime, timedelta
 import shutil
 from utils import (
+    get_default_store,
     GameTimeTracker, 
     SettingsManager, 
     StatsManager, 
     AddonManager,
+    ClientCacheManager,
+    DataPrefetcher,
+    find_data_files,
+    LauncherPriority,
+    apply_launch_profile,
+    affinity_slice,
+    parse_cpu_list,
+    format_cpu_list,
+    PRIORITY_LEVELS,
+    IO_PRIORITY_LEVELS,
     BackgroundTracker,
     LanguageManager,
-    is_wow_running
+    SessionJournal,
+    SessionStore,
+    ProcessMonitor,
+    WakePipe,
+    LaunchTimeline,
+    TelemetrySampler,
+    DirectoryWatcher,
+    addon_sort_key,
+    ViewModel,
+    ImageCache,
+    StartupProfiler,
+    SingleInstance,
+    format_duration,
+    format_size,
+    PERFORMANCE_PROFILES,
+    apply_config_values,
+    get_config_path,
+    setup_logging,
+    shutdown_logging
 )
 
+logger = logging.getLogger('launcher')
+
+# Lignes visibles d'une liste d'addons et taille des tranches de remplissage
+ADDON_LIST_ROWS = 10
+ADDON_LIST_CHUNK = 200
+# Scrutation de la file des tâches Tk quand aucun tube de réveil n'est disponible (ms)
+UI_POLL_ACTIVE = 100
+UI_POLL_IDLE = 1000
+
 class SoundManager:
+    """
+    Joue les effets sonores depuis la mémoire.
+    
+    pygame et le mixeur ne sont initialisés qu'au premier besoin, dans un
+    thread d'arrière-plan lancé après l'affichage de la fenêtre ; chaque son
+    est décodé une seule fois puis conservé en cache.
+    """
     def __init__(self):
         self.sounds = {}
+        self._cache = {}
+        self._mixer = None
+        self._lock = threading.Lock()
         try:
             if getattr(sys, 'frozen', False):
                 base_path = sys._MEIPASS
@@ -42,14 +92,50 @@ class SoundManager:
         except Exception as e:
             print(f"Erreur lors de l'initialisation du gestionnaire de sons: {e}")
 
+    def _get_mixer(self):
+        """Importe pygame et initialise le mixeur au premier besoin."""
+        if self._mixer is None:
+            import pygame
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self._mixer = pygame.mixer
+        return self._mixer
+
+    def _get_sound(self, sound_name):
+        """Retourne le son décodé, en le chargeant une seule fois."""
+        with self._lock:
+            sound = self._cache.get(sound_name)
+            if sound is None and sound_name in self.sounds:
+                sound = self._get_mixer().Sound(self.sounds[sound_name])
+                self._cache[sound_name] = sound
+            return sound
+
+    def preload(self):
+        """Décode tous les sons dans un thread d'arrière-plan."""
+        def load_all():
+            for sound_name in list(self.sounds):
+                try:
+                    self._get_sound(sound_name)
+                except Exception as e:
+                    logger.error(f"Erreur lors du préchargement du son {sound_name}: {e}")
+        threading.Thread(target=load_all, name="SoundPreload", daemon=True).start()
+
     def play(self, sound_name):
         try:
-            if sound_name in self.sounds:
-                sound = pygame.mixer.Sound(self.sounds[sound_name])
+            sound = self._get_sound(sound_name)
+            if sound is not None:
                 sound.play()
         except Exception as e:
             print(f"Erreur lors de la lecture du son {sound_name}: {e}")
 
+    def close(self):
+        """Libère le mixeur s'il a été initialisé."""
+        with self._lock:
+            self._cache.clear()
+            if self._mixer is not None:
+                self._mixer.quit()
+                self._mixer = None
+
 class EventNotification(tk.Toplevel):
     def __init__(self, parent, title, time, description=None, version=None):
         super().__init__(parent)
@@ -202,25 +288,6 @@ class NotificationWindow:
         y = (self.window.winfo_screenheight() - height) // 2
         self.window.geometry(f"+{x}+{y}")
 
-def check_single_instance():
-    try:
-        current_pid = os.getpid()
-        for proc in psutil.process_iter(['name', 'pid']):
-            try:
-                if proc.info['name'] == 'Tri-Legacy Launcher.exe' and proc.pid != current_pid:
-                    try:
-                        old_process = psutil.Process(proc.pid)
-                        old_process.terminate()
-                        old_process.wait(timeout=3)
-                    except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                        pass
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return True
-    except Exception as e:
-        logging.error(f"Erreur lors de la vérification d'instance unique: {e}")
-        return False
-
 def ensure_required_folders():
     """Vérifie et crée les dossiers requis pour l'application et copie les fichiers nécessaires."""
     required_folders = ['assets', 'data', 'Sounds']
@@ -230,7 +297,7 @@ def ensure_required_folders():
         folder_path = os.path.join(base_path, folder)
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
-            logging.info(f"Dossier créé : {folder_path}")
+            logger.info(f"Dossier créé : {folder_path}")
     
     # Copier les sons par défaut
     default_sounds = {
@@ -252,50 +319,87 @@ def ensure_required_folders():
                 
                 if os.path.exists(source_path):
                     shutil.copy2(source_path, target_path)
-                    logging.info(f"Son copié : {sound_file}")
+                    logger.info(f"Son copié : {sound_file}")
             except Exception as e:
-                logging.error(f"Erreur lors de la copie du son {sound_file}: {e}")
+                logger.error(f"Erreur lors de la copie du son {sound_file}: {e}")
+
+def parse_args(argv=None):
+    """Analyse les arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Tri-Legacy Launcher")
+    parser.add_argument('--launch', choices=['vanilla', 'tbc', 'wotlk'],
+                        help="Lance directement la version indiquée")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="Affiche la durée de chaque étape du démarrage")
+    return parser.parse_args(argv)
 
 def main():
-    if not check_single_instance():
-        messagebox.showwarning(
-            LanguageManager().get_text('warning'),
-            LanguageManager().get_text('instance_warning')
-        )
-        sys.exit(0)
+    args = parse_args()
+    profiler = StartupProfiler(enabled=args.startup_profile, origin=_IMPORT_START)
+    profiler.record('imports', _IMPORT_START, time.perf_counter())
 
     if getattr(sys, 'frozen', False):
         app_dir = os.path.dirname(sys.executable)
     else:
         app_dir = os.path.dirname(os.path.abspath(__file__))
 
+    # Instance unique : une seconde instance transmet sa commande à la première et se termine
+    command = f"launch {args.launch}" if args.launch else "show"
+    with profiler.stage('single_instance'):
+        instance = SingleInstance(os.path.join(app_dir, 'data'))
+        is_primary = instance.acquire()
+    if not is_primary:
+        if not instance.send(command):
+            messagebox.showwarning(
+                LanguageManager().get_text('warning'),
+                LanguageManager().get_text('instance_warning')
+            )
+        sys.exit(0)
+
+    # Écoute immédiate : les commandes reçues avant la construction de l'interface sont mises en attente
+    instance.serve()
+
+    # Journalisation asynchrone : les threads de l'interface et du suivi ne bloquent jamais sur le disque
     log_file = os.path.join(app_dir, 'launcher.log')
-    logging.basicConfig(
-        filename=log_file,
-        level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    with profiler.stage('logging'):
+        setup_logging(log_file, level=logging.DEBUG)
 
+    app = None
     try:
-        ensure_required_folders()  # Vérification des dossiers requis
-        pygame.init()
-        pygame.mixer.init()
-        root = tk.Tk()
-        app = TriLegacyLauncher(root)
+        with profiler.stage('folders'):
+            ensure_required_folders()  # Vérification des dossiers requis
+        with profiler.stage('tk_init'):
+            root = tk.Tk()
+        app = TriLegacyLauncher(root, profiler)
+        instance.set_handler(lambda cmd: app.ui_tasks.put(lambda: app.handle_command(cmd)))
+        if args.launch:
+            app.ui_tasks.put(lambda: app.handle_command(command))
         app.run()
     except Exception as e:
-        logging.critical(f"Erreur critique: {e}", exc_info=True)
+        logger.critical(f"Erreur critique: {e}", exc_info=True)
         messagebox.showerror(
             LanguageManager().get_text('critical_error'),
             f"{LanguageManager().get_text('error_occurred')}\n\n{str(e)}"
         )
     finally:
         try:
-            pygame.mixer.quit()
-            pygame.quit()
+            if app is not None:
+                app.sound_manager.close()
         except:
             pass
-        logging.info("Application terminée")
+        instance.release()
+        logger.info("Application terminée")
+        shutdown_logging()
+
+class UiTaskQueue(queue.Queue):
+    """File des tâches destinées au thread Tk ; chaque dépôt réveille la boucle Tk."""
+
+    def __init__(self, wakeup):
+        super().__init__()
+        self.wakeup = wakeup
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.wakeup()
 
 class WindowManager:
     def __init__(self, parent, title, geometry, theme_colors):
@@ -322,9 +426,172 @@ class WindowManager:
         y = parent.winfo_y() + (parent.winfo_height() // 2) - (height // 2)
         self.window.geometry(f"+{x}+{y}")
 
+class VirtualList:
+    """
+    Liste virtualisée : seules les lignes visibles existent sous forme de widgets.
+
+    Un nombre fixe de lignes (titre à gauche, détail à droite) est créé une
+    fois puis réaffecté aux éléments visibles à chaque défilement ; le coût
+    d'affichage ne dépend pas du nombre d'éléments. Les éléments sont des
+    tuples (identifiant, texte, détail). Un filtre optionnel (ensemble
+    d'identifiants) restreint les éléments affichés sans modifier la liste.
+    La molette n'est liée qu'aux widgets de la liste.
+    """
+
+    def __init__(self, parent, colors, visible_rows=10, row_height=22):
+        self.colors = colors
+        self.visible_rows = visible_rows
+        self.items = []
+        self.selection = set()
+        self.first = 0
+        self._anchor = None
+        self._filter = None
+        self._shown = None
+        
+        self.frame = tk.Frame(parent, bg=colors['button_bg'])
+        self.body = tk.Frame(self.frame, bg=colors['button_bg'], height=visible_rows * row_height)
+        self.body.pack_propagate(False)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.body.pack(side='left', fill='both', expand=True)
+        
+        self.rows = []
+        for i in range(visible_rows):
+            row = tk.Frame(self.body, bg=colors['button_bg'])
+            row.place(x=0, y=i * row_height, relwidth=1, height=row_height)
+            title = tk.Label(row, anchor='w', font=('Segoe UI', 10), bg=colors['button_bg'], fg=colors['text'])
+            title.pack(side='left', fill='x', expand=True, padx=(6, 0))
+            detail = tk.Label(row, anchor='e', font=('Segoe UI', 9), bg=colors['button_bg'], fg=colors['gold'])
+            detail.pack(side='right', padx=6)
+            for widget in (row, title, detail):
+                widget.bind('<Button-1>', lambda e, i=i: self._on_click(i, e))
+                widget.bind('<MouseWheel>', self._on_mousewheel)
+                widget.bind('<Button-4>', lambda e: self.scroll(-3))
+                widget.bind('<Button-5>', lambda e: self.scroll(3))
+            self.rows.append((row, title, detail))
+        for widget in (self.frame, self.body):
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+            widget.bind('<Button-4>', lambda e: self.scroll(-3))
+            widget.bind('<Button-5>', lambda e: self.scroll(3))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def winfo_exists(self):
+        return self.frame.winfo_exists()
+
+    @property
+    def shown(self):
+        """Éléments affichés (tous, ou ceux retenus par le filtre)."""
+        if self._filter is None:
+            return self.items
+        if self._shown is None:
+            self._shown = [item for item in self.items if item[0] in self._filter]
+        return self._shown
+
+    def set_filter(self, item_ids):
+        """Restreint l'affichage aux identifiants donnés (None pour tout afficher)."""
+        self._filter = item_ids
+        self._shown = None
+        self.first = 0
+        self.redraw()
+
+    def clear(self):
+        self.items = []
+        self._shown = None
+        self.selection.clear()
+        self.first = 0
+        self.redraw()
+
+    def extend(self, items):
+        previous = len(self.shown)
+        self.items.extend(items)
+        self._shown = None
+        # Seules les lignes visibles dépendent des nouveaux éléments
+        if previous < self.first + self.visible_rows:
+            self.redraw()
+        else:
+            self._update_scrollbar()
+
+    def insert(self, index, item):
+        self.items.insert(index, item)
+        self._shown = None
+        self.redraw()
+
+    def delete(self, index):
+        item_id = self.items.pop(index)[0]
+        self._shown = None
+        self.selection.discard(item_id)
+        self.first = max(0, min(self.first, len(self.shown) - self.visible_rows))
+        self.redraw()
+
+    def selected(self):
+        """Identifiants sélectionnés et affichés, dans l'ordre de la liste."""
+        return [item[0] for item in self.shown if item[0] in self.selection]
+
+    def scroll(self, delta):
+        last = max(0, len(self.shown) - self.visible_rows)
+        first = max(0, min(last, self.first + delta))
+        if first != self.first:
+            self.first = first
+            self.redraw()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, command, value, unit=None):
+        if command == 'moveto':
+            self.scroll(int(float(value) * len(self.shown)) - self.first)
+        elif command == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll(int(value) * step)
+
+    def _on_click(self, row_index, event):
+        shown = self.shown
+        index = self.first + row_index
+        if index >= len(shown):
+            return
+        item_id = shown[index][0]
+        if event.state & 0x0001 and self._anchor is not None:  # Maj : plage
+            low, high = sorted((self._anchor, index))
+            self.selection.update(item[0] for item in shown[low:high + 1])
+        elif event.state & 0x0004:  # Ctrl : bascule
+            self.selection.symmetric_difference_update({item_id})
+            self._anchor = index
+        else:
+            self.selection = {item_id}
+            self._anchor = index
+        self.redraw()
+
+    def _update_scrollbar(self):
+        total = len(self.shown)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.visible_rows) / total)
+
+    def redraw(self):
+        """Réaffecte les lignes existantes aux éléments visibles."""
+        shown = self.shown
+        for offset, (row, title, detail) in enumerate(self.rows):
+            index = self.first + offset
+            if index < len(shown):
+                item_id, text, extra = shown[index]
+                bg = self.colors['button_hover'] if item_id in self.selection else self.colors['button_bg']
+                fg = self.colors['gold'] if item_id in self.selection else self.colors['text']
+            else:
+                text, extra = '', ''
+                bg, fg = self.colors['button_bg'], self.colors['text']
+            row.config(bg=bg)
+            title.config(text=text, bg=bg, fg=fg)
+            detail.config(text=extra, bg=bg)
+        self._update_scrollbar()
+
 class TriLegacyLauncher:
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         self.root = root
+        self.profiler = profiler or StartupProfiler()
         
         # Définition d'une seule palette de couleurs
         self.colors = {
@@ -339,6 +606,45 @@ class TriLegacyLauncher:
         # Initialisation du dictionnaire des processus en cours
         self.running_processes = {}
         
+        # Services créés par load_managers et _load_deferred_services ; ils restent
+        # à None si leur initialisation échoue et chaque utilisation le vérifie
+        self.process_monitor = None
+        self.prefetch_cancel = threading.Event()
+        self.prefetch_thread = None
+        self.session_journal = None
+        self.session_store = None
+        self.stats_manager = None
+        self.dir_watcher = None
+        self.addon_manager = None
+        self.background_tracker = None
+        self.launch_timeline = None
+        self.telemetry_sampler = None
+        # Actions demandées avant la fin de l'initialisation différée
+        self._deferred_actions = []
+        
+        # État affiché de la fenêtre principale (seuls les changements sont appliqués aux widgets)
+        self.main_view = ViewModel()
+        self.version_widgets = {}
+        self.addon_views = {}
+        self.addon_search_var = None
+        self._refresh_job = None
+        self.pending_launches = set()
+        self.cache_views = {}
+        
+        # Tâches à exécuter dans le thread Tk, déposées par les threads d'arrière-plan.
+        # Ces threads n'appellent jamais Tk : sous POSIX, chaque dépôt écrit dans un
+        # tube surveillé par la boucle Tk (createfilehandler), qui ne se réveille que
+        # lorsqu'il y a quelque chose à traiter. Ailleurs, la file est scrutée par after().
+        self._wake_pending = threading.Event()
+        self._wake_pipe = None
+        self._poll_job = None
+        if hasattr(self.root.tk, 'createfilehandler'):
+            self._wake_pipe = WakePipe()
+            self.root.tk.createfilehandler(self._wake_pipe.fileno(), tk.READABLE, self._on_wake)
+        self.ui_tasks = UiTaskQueue(self.wake_ui)
+        self._services_ready = threading.Event()
+        self._startup_pending = 2  # Premier affichage + services différés
+        
         # Configuration de la fenêtre principale
         self.root.configure(bg=self.colors['bg'])
         self.root.geometry("1200x800")
@@ -367,17 +673,21 @@ class TriLegacyLauncher:
                         if os.path.exists(icon_small_path):
                             self.root.iconbitmap(icon_small_path)
                     except Exception as e:
-                        logging.warning(f"Impossible de définir l'icône de la barre des tâches: {e}")
+                        logger.warning(f"Impossible de définir l'icône de la barre des tâches: {e}")
             else:
-                logging.warning(f"Icône introuvable: {icon_path}")
+                logger.warning(f"Icône introuvable: {icon_path}")
         except Exception as e:
-            logging.warning(f"Impossible de charger l'icône: {e}")
+            logger.warning(f"Impossible de charger l'icône: {e}")
         
-        # Initialisation des gestionnaires
-        self.load_managers()
+        # Initialisation des gestionnaires nécessaires au premier affichage,
+        # puis des autres services en arrière-plan
+        with self.profiler.stage('managers'):
+            self.load_managers()
+        self.start_deferred_services()
         
         # Création de l'interface
-        self.setup_interface()
+        with self.profiler.stage('interface'):
+            self.setup_interface()
         
         # Configuration de la fermeture
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -385,36 +695,172 @@ class TriLegacyLauncher:
         # Centrer la fenêtre
         self.center_window()
         
-        # Démarrer la mise à jour de l'interface
+        # Premier rendu de l'interface et réception des événements de processus ;
+        # un second passage traite ce qui a été déposé avant le démarrage de la boucle Tk
         self.update_ui()
+        self.process_events()
+        self.root.after_idle(self.process_events)
 
         self.sound_manager = SoundManager()
-        self.language_manager = LanguageManager()
+        
+        # Décoder les sons une fois la fenêtre affichée
+        self.root.after_idle(self.sound_manager.preload)
+        self.root.after_idle(self.on_first_frame)
 
     def load_managers(self):
-        """Initialise les différents gestionnaires."""
+        """Initialise les gestionnaires nécessaires au premier affichage."""
         try:
-            # Création du dossier data s'il n'existe pas
-            if not os.path.exists('data'):
-                os.makedirs('data')
+            # Magasin de données unique partagé par tous les gestionnaires
+            self.data_store = get_default_store()
 
             # Initialisation des gestionnaires
-            self.settings_manager = SettingsManager()
-            self.game_tracker = GameTimeTracker()
-            self.stats_manager = StatsManager()
-            self.addon_manager = AddonManager()
-            self.language_manager = LanguageManager()
+            self.settings_manager = SettingsManager(self.data_store)
+            self.game_tracker = GameTimeTracker(self.data_store)
+            self.language_manager = LanguageManager(self.data_store)
+            
+            # Moniteur unique des processus de jeu (son thread ne démarre qu'au premier lancement)
+            self.process_monitor = ProcessMonitor(wakeup=self.wake_ui)
             
-            # Initialisation du tracker en arrière-plan
-            self.background_tracker = BackgroundTracker(self.game_tracker)
+            # Maintenance des dossiers Cache/WDB des clients
+            self.client_cache = ClientCacheManager()
+            
+            # Préchargement des archives du jeu (un seul à la fois)
+            self.data_prefetcher = DataPrefetcher()
+            
+            # Priorité du launcher, abaissée tant qu'un jeu tourne
+            self.launcher_priority = LauncherPriority()
 
         except Exception as e:
-            logging.error(f"Erreur lors de l'initialisation des gestionnaires: {e}")
+            logger.error(f"Erreur lors de l'initialisation des gestionnaires: {e}")
             messagebox.showerror(
                 self.language_manager.get_text('error') if hasattr(self, 'language_manager') else "Erreur",
                 str(e)
             )
 
+    def start_deferred_services(self):
+        """Démarre l'initialisation des services non nécessaires au premier affichage."""
+        thread = threading.Thread(target=self._load_deferred_services, name="DeferredServices", daemon=True)
+        thread.start()
+
+    def _load_deferred_services(self):
+        """Initialise l'historique, la récupération des sessions et le suivi (thread d'arrière-plan)."""
+        try:
+            with self.profiler.stage('session_journal'):
+                # Journal des sessions : reconstruit les totaux après un crash
+                self.session_journal = SessionJournal(
+                    self.game_tracker.data_dir,
+                    seed_totals={v: self.game_tracker.get_time(v) for v in ['vanilla', 'tbc', 'wotlk']}
+                )
+            
+            with self.profiler.stage('session_store'):
+                # Historique des sessions (import unique des anciens fichiers JSON)
+                self.session_store = SessionStore(self.game_tracker.data_dir)
+                self.session_store.import_totals(self.data_store.section('game_time'),
+                                                 self.data_store.section('stats'))
+                self.recover_sessions()
+            
+            with self.profiler.stage('stats_addons'):
+                self.stats_manager = StatsManager(self.data_store)
+                # Surveillance des dossiers AddOns et WTF une fois l'index construit
+                self.dir_watcher = DirectoryWatcher()
+                self.addon_manager = AddonManager(self.data_store, watcher=self.dir_watcher)
+                self.addon_manager.add_listener(
+                    lambda event: self.ui_tasks.put(lambda: self.on_addon_event(event)))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'initialisation des services: {e}")
+            self.ui_tasks.put(lambda: messagebox.showerror(self.language_manager.get_text('error'), str(e)))
+        
+        try:
+            # Le suivi du temps de jeu ne dépend pas des services ci-dessus
+            # (journal et historique facultatifs)
+            self.background_tracker = BackgroundTracker(self.game_tracker, self.session_journal,
+                                                        self.session_store, self.process_monitor)
+            if self.process_monitor is None:
+                self.process_monitor = self.background_tracker.monitor
+                self.process_monitor.wakeup = self.wake_ui
+            # Chronologie des lancements (délais avant la fenêtre et la fin du chargement)
+            self.launch_timeline = LaunchTimeline(self.session_store)
+            # Télémétrie facultative des clients (résumé enregistré à la fin de chaque session)
+            self.telemetry_sampler = TelemetrySampler(self.session_store, self.process_monitor,
+                                                      self.settings_manager.get_telemetry()['interval'])
+        except Exception as e:
+            logger.error(f"Erreur lors de l'initialisation du suivi des parties: {e}")
+            self.ui_tasks.put(lambda: messagebox.showerror(self.language_manager.get_text('error'), str(e)))
+        finally:
+            self._services_ready.set()
+            self.ui_tasks.put(self.on_services_ready)
+
+    def defer_until_ready(self, action):
+        """
+        Met une action en attente si l'initialisation différée n'est pas terminée.
+
+        Le thread Tk n'est jamais bloqué : l'action est rejouée par
+        on_services_ready.
+
+        Args:
+            action (Callable[[], None]): Action à rejouer
+
+        Returns:
+            bool: True si l'action a été mise en attente
+        """
+        if self._services_ready.is_set():
+            return False
+        self._deferred_actions.append(action)
+        return True
+
+    def require_services(self, *names):
+        """Vérifie que les services nommés sont disponibles ; sinon prévient l'utilisateur."""
+        if all(getattr(self, name) is not None for name in names):
+            return True
+        messagebox.showerror(self.language_manager.get_text('error'),
+                             self.language_manager.get_text('services_unavailable'))
+        return False
+
+    def on_services_ready(self):
+        """Rafraîchit l'affichage une fois les services différés prêts et rejoue les actions en attente."""
+        self.update_ui()
+        self._startup_stage_done()
+        actions, self._deferred_actions = self._deferred_actions, []
+        for action in actions:
+            action()
+
+    def on_first_frame(self):
+        """Appelé à la première inactivité de la boucle Tk, une fois la fenêtre affichée."""
+        self.profiler.mark('first_frame')
+        self._startup_stage_done()
+
+    def _startup_stage_done(self):
+        self._startup_pending -= 1
+        if self._startup_pending == 0:
+            self.profiler.mark('startup_complete')
+            if self.profiler.enabled:
+                report = self.profiler.report()
+                logger.info(report)
+                print(report)
+            # Préchargement des archives une fois le démarrage terminé
+            self.start_prefetch()
+
+    def recover_sessions(self):
+        """Récupère le temps de jeu des sessions interrompues par un crash."""
+        try:
+            for session in self.session_journal.recover():
+                version = session['version']
+                logger.info(f"Session {version} interrompue récupérée: {session['elapsed']}s")
+                if session['elapsed'] > 0:
+                    self.session_store.record_session(version, session['start'], session['elapsed'])
+                if session['base'] is None:
+                    continue
+                
+                # Seule la part du dernier battement que game_time.json n'a pas
+                # enregistrée avant le crash est créditée
+                credited = max(0, self.game_tracker.get_time(version) - session['base'])
+                missing = session['elapsed'] - credited
+                if missing > 0:
+                    self.game_tracker.increment_time(version, missing)
+                    logger.info(f"Temps de jeu restauré depuis le journal pour {version}: +{missing}s")
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des sessions: {e}")
+
     def setup_interface(self):
         """Configure l'interface principale."""
         try:
@@ -426,10 +872,16 @@ class TriLegacyLauncher:
             
             bg_path = os.path.join(base_path, 'assets', 'background.jpg')
             if os.path.exists(bg_path):
-                bg_image = Image.open(bg_path)
-                # Redimensionner l'image à la taille de la fenêtre
-                bg_image = bg_image.resize((1200, 800), Image.Resampling.LANCZOS)
-                self.bg_photo = ImageTk.PhotoImage(bg_image)
+                # Image déjà redimensionnée à la taille de la fenêtre, chargée sans décodage JPEG
+                image_cache = ImageCache(os.path.join(self.game_tracker.data_dir, 'cache'))
+                cached_bg = image_cache.get_scaled(bg_path, (1200, 800))
+                if cached_bg:
+                    self.bg_photo = tk.PhotoImage(file=cached_bg)
+                else:
+                    from PIL import Image, ImageTk
+                    bg_image = Image.open(bg_path)
+                    bg_image = bg_image.resize((1200, 800), Image.Resampling.LANCZOS)
+                    self.bg_photo = ImageTk.PhotoImage(bg_image)
                 
                 # Création d'un canvas pour le fond
                 self.bg_canvas = tk.Canvas(self.root, width=1200, height=800, highlightthickness=0)
@@ -484,9 +936,9 @@ class TriLegacyLauncher:
                                         **button_style)
                 launch_button.pack()
 
-                # Effet de survol pour le bouton de lancement
-                launch_button.bind('<Enter>', lambda e, b=launch_button: b.configure(bg=self.colors['button_hover']))
-                launch_button.bind('<Leave>', lambda e, b=launch_button: b.configure(bg=self.colors['button_bg']))
+                # Effet de survol pour le bouton de lancement (sauf pendant le jeu)
+                launch_button.bind('<Enter>', lambda e, b=launch_button: b.cget('state') == tk.NORMAL and b.configure(bg=self.colors['button_hover']))
+                launch_button.bind('<Leave>', lambda e, b=launch_button: b.cget('state') == tk.NORMAL and b.configure(bg=self.colors['button_bg']))
 
                 # Label pour le temps de jeu
                 time_label = tk.Label(frame,
@@ -495,6 +947,8 @@ class TriLegacyLauncher:
                                     bg=self.colors['bg'],
                                     fg=self.colors['gold'])
                 time_label.pack(pady=5)
+                
+                self.version_widgets[version] = {'button': launch_button, 'time': time_label}
 
             # Bouton Options avec son
             options_button = tk.Button(self.main_frame,
@@ -508,7 +962,7 @@ class TriLegacyLauncher:
             options_button.bind('<Leave>', lambda e: options_button.configure(bg=self.colors['button_bg']))
 
         except Exception as e:
-            logging.error(f"Erreur lors de la configuration de l'interface: {e}")
+            logger.error(f"Erreur lors de la configuration de l'interface: {e}")
             # Fallback en cas d'erreur
             self.main_frame = tk.Frame(self.root, bg=self.colors['bg'])
             self.main_frame.pack(expand=True, padx=20, pady=20)
@@ -534,12 +988,30 @@ class TriLegacyLauncher:
                              command=lambda: [self.sound_manager.play('toggle'), self.open_addon_manager()])
         tools_menu.add_command(label=self.language_manager.get_text('stats'), 
                              command=lambda: [self.sound_manager.play('toggle'), self.open_stats()])
-
-    def launch_game(self, version):
-        """Lance le jeu spécifié."""
+        tools_menu.add_command(label=self.language_manager.get_text('saved_variables'), 
+                             command=lambda: [self.sound_manager.play('toggle'), self.open_saved_variables()])
+        tools_menu.add_command(label=self.language_manager.get_text('client_cache'), 
+                             command=lambda: [self.sound_manager.play('toggle'), self.open_client_cache()])
+
+    def is_running(self, version):
+        """Indique si au moins un client de la version est en cours d'exécution."""
+        return any(info['version'] == version for info in self.running_processes.values())
+
+    def launch_game(self, version, count=None):
+        """
+        Lance le jeu spécifié.
+        
+        Args:
+            version (str): Version du jeu
+            count (Optional[int]): Nombre de clients (par défaut celui du lancement multiple de la version)
+        """
+        if self.defer_until_ready(lambda: self.launch_game(version, count)):
+            return
         try:
-            # Vérifier si le jeu est déjà en cours d'exécution
-            if version in self.running_processes and self.running_processes[version]['process'].poll() is None:
+            # Vérifier si le jeu est déjà en cours d'exécution (ou en cours de lancement)
+            if version in self.pending_launches:
+                return
+            if self.is_running(version):
                 messagebox.showinfo(
                     self.language_manager.get_text('information'),
                     self.language_manager.get_text('game_already_running')
@@ -555,21 +1027,100 @@ class TriLegacyLauncher:
                 )
                 return
 
-            # Lancer le jeu
+            if count is None:
+                count = self.settings_manager.get_multibox(version)['clients']
+            count = max(1, int(count))
+            self.pending_launches.add(version)
+
+            policy = self.settings_manager.get_cache_policy(version)
+            if policy['auto_clear']:
+                # Purge du cache hors du thread Tk, puis lancement
+                def run():
+                    try:
+                        self.purge_client_cache(version, game_path, policy)
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la purge du cache {version}: {e}")
+                    self.ui_tasks.put(lambda: self.start_clients(version, game_path, count))
+                
+                threading.Thread(target=run, name="CachePurge", daemon=True).start()
+                return
+
+            self.start_clients(version, game_path, count)
+
+        except Exception as e:
+            messagebox.showerror(
+                self.language_manager.get_text('error'),
+                f"{self.language_manager.get_text('launch_error')}\n{str(e)}"
+            )
+
+    def start_clients(self, version, game_path, count):
+        """
+        Démarre `count` clients d'une version, espacés du délai du lancement
+        multiple pour qu'ils ne lisent pas tous les archives en même temps.
+        Les démarrages sont planifiés dans la boucle Tk (aucun thread par client).
+        """
+        self.apply_config_profile(version, game_path)
+        # Le launcher et ses threads de suivi passent après les clients, une fois pour
+        # tout le lancement ; sa priorité est rétablie à la fin du dernier client suivi
+        self.launcher_priority.lower()
+        stagger_ms = int(self.settings_manager.get_multibox(version)['stagger'] * 1000)
+        for slot in range(count):
+            self.root.after(slot * stagger_ms,
+                            lambda slot=slot: self.start_game(version, game_path, slot, count))
+
+    def start_game(self, version, game_path, slot=0, count=1):
+        """
+        Démarre un processus du jeu et son suivi.
+        
+        Args:
+            version (str): Version du jeu
+            game_path (str): Chemin de l'exécutable
+            slot (int): Rang du client dans un lancement multiple
+            count (int): Nombre de clients du lancement multiple
+        """
+        if slot == count - 1:
+            self.pending_launches.discard(version)
+        try:
+            # Profil de lancement ; en lancement multiple, chaque client reçoit sa tranche de cœurs
+            profile = self.settings_manager.get_launch_profile(version)
+            if count > 1:
+                cpus = profile['affinity'] or list(range(os.cpu_count() or 1))
+                profile = dict(profile, affinity=affinity_slice(cpus, slot, count))
+            
+            # Le client hérite de la priorité basse du launcher : lui rendre la priorité
+            # d'origine puis appliquer aussitôt son profil, avant le pic de chargement
+            launched = time.monotonic()
             process = subprocess.Popen([game_path])
-            self.running_processes[version] = {
+            popen_returned = time.monotonic()
+            self.launcher_priority.restore_child(process.pid)
+            apply_launch_profile(process.pid, profile)
+            if self.launch_timeline:
+                self.launch_timeline.track(version, process.pid, launched, popen_returned)
+            if self.telemetry_sampler and self.settings_manager.get_telemetry()['enabled']:
+                self.telemetry_sampler.watch(version, process.pid)
+            self.running_processes[process.pid] = {
+                'version': version,
+                'slot': slot,
                 'process': process,
-                'start_time': datetime.now()
+                'start_time': datetime.now(),
+                'start_monotonic': time.monotonic()
             }
             
             # Incrémenter le compteur de lancements dans game_tracker
             self.game_tracker.increment_launches(version)
             
             # Mettre à jour les statistiques avec un temps initial de 0
-            self.stats_manager.update_stats(version, 0)
+            if self.stats_manager:
+                self.stats_manager.update_stats(version, 0)
 
             # Démarrer le suivi du processus
-            self.background_tracker.start_tracking(version, process)
+            if self.background_tracker:
+                self.background_tracker.start_tracking(version, process)
+            else:
+                logger.warning(f"Suivi indisponible, le temps de jeu de {version} (PID: {process.pid}) ne sera pas compté")
+
+            # Afficher l'état « en cours »
+            self.update_ui()
 
             # Jouer le son de lancement
             self.sound_manager.play('launch')
@@ -579,75 +1130,160 @@ class TriLegacyLauncher:
                 self.language_manager.get_text('error'),
                 f"{self.language_manager.get_text('launch_error')}\n{str(e)}"
             )
-
-    def update_ui(self):
+        finally:
+            # Aucun client à suivre après l'échec du dernier lancement
+            if not self.running_processes and not self.pending_launches:
+                self.launcher_priority.restore()
+
+    def apply_config_profile(self, version, game_path):
+        """Écrit les réglages du profil Config.wtf de la version (un échec n'empêche pas le lancement)."""
+        profile = self.settings_manager.get_config_profile(version)
+        if not profile:
+            return
+        try:
+            apply_config_values(get_config_path(game_path), self.settings_manager.get_config_profiles()[profile])
+        except OSError as e:
+            logger.error(f"Impossible d'appliquer le profil {profile} à {version}: {e}")
+
+    def wake_ui(self):
+        """Demande le traitement des tâches et événements en attente (appelable depuis tout thread, sans appel Tk)."""
+        wake_pipe = self._wake_pipe
+        if wake_pipe is None or self._wake_pending.is_set():
+            return
+        self._wake_pending.set()
+        try:
+            wake_pipe.wake()
+        except OSError as e:
+            # Tube fermé (fermeture en cours)
+            logger.debug(f"Réveil de l'interface impossible: {e}")
+
+    def _on_wake(self, fd, mask):
+        """Vide le tube de réveil puis traite les tâches en attente (thread Tk)."""
+        self._wake_pipe.drain()
+        self.process_events()
+
+    def process_events(self):
+        """Exécute les tâches des threads d'arrière-plan et traite les événements du moniteur de processus dans le thread Tk."""
+        changed = False
+        # Un dépôt pendant le traitement déclenchera un nouveau réveil
+        self._wake_pending.clear()
         try:
-            # Récupérer tous les frames des versions (en ignorant le titre et le bouton options)
-            version_frames = [frame for frame in self.main_frame.winfo_children() 
-                             if isinstance(frame, tk.Frame)][:3]  # Les 3 premiers frames sont pour les versions
+            while True:
+                try:
+                    task = self.ui_tasks.get_nowait()
+                except queue.Empty:
+                    break
+                task()
             
-            for version, frame in zip(['vanilla', 'tbc', 'wotlk'], version_frames):
-                launch_button = frame.winfo_children()[0]  # Premier widget: bouton de lancement
-                time_label = frame.winfo_children()[1]     # Deuxième widget: label de temps
+            while self.process_monitor is not None:
+                try:
+                    event = self.process_monitor.events.get_nowait()
+                except queue.Empty:
+                    break
+                
+                version = event['tag']
+                process_info = self.running_processes.get(event['pid'])
+                if not process_info or process_info['version'] != version:
+                    continue
+                
+                changed = True
+                if event['type'] == 'heartbeat':
+                    # Le temps jusqu'ici est crédité au game_tracker
+                    process_info['last_beat'] = time.monotonic()
+                    continue
+                
+                # Processus terminé
+                logger.info(f"Processus {version} (PID: {event['pid']}) terminé, mise à jour des statistiques")
                 
-                if version in self.running_processes:
-                    process_info = self.running_processes[version]
-                    if process_info['process'].poll() is not None or not is_wow_running(process_info['process'].pid):
-                        # Processus terminé
-                        logging.info(f"Processus {version} terminé, mise à jour des statistiques")
-                        
-                        # Calculer le temps final
-                        end_time = datetime.now()
-                        elapsed = int((end_time - process_info['start_time']).total_seconds())
-                        
-                        # Mettre à jour les statistiques une seule fois
-                        self.stats_manager.update_stats(version, elapsed)
-                        
-                        # Supprimer le processus de la liste
-                        del self.running_processes[version]
-                        
-                        # Mettre à jour l'affichage avec le temps sauvegardé uniquement
-                        formatted_time = self.game_tracker.get_formatted_time(version)
-                        time_label.config(text=self.language_manager.get_text('game_time', formatted_time))
-                        launch_button.config(
-                            text=self.language_manager.get_text('launch_button', version.upper()),
-                            state=tk.NORMAL,
-                            bg=self.colors['button_bg']
-                        )
-                    else:
-                        # Jeu en cours, mise à jour du temps
-                        current_time = datetime.now()
-                        elapsed = int((current_time - process_info['start_time']).total_seconds())
-                        # Calculer le temps total : temps sauvegardé + temps de la session en cours non encore sauvegardé
-                        saved_time = self.game_tracker.get_time(version)
-                        # Le temps sauvegardé par le BackgroundTracker (par tranches de 10 secondes)
-                        saved_session_time = (elapsed // 10) * 10
-                        # Le temps restant non encore sauvegardé (moins de 10 secondes)
-                        unsaved_time = elapsed - saved_session_time
-                        total_time = saved_time + unsaved_time
-                        hours = total_time // 3600
-                        minutes = (total_time % 3600) // 60
-                        formatted_time = f"{hours}h {minutes}min"
-                        time_label.config(text=self.language_manager.get_text('game_time', formatted_time))
-                        launch_button.config(
-                            text=self.language_manager.get_text('game_running'),
-                            state=tk.DISABLED,
-                            bg=self.colors['button_hover']
-                        )
+                # Calculer le temps final et mettre à jour les statistiques une seule fois
+                elapsed = int((datetime.now() - process_info['start_time']).total_seconds())
+                if self.stats_manager:
+                    self.stats_manager.update_stats(version, elapsed)
+                
+                # Supprimer le processus de la liste
+                del self.running_processes[event['pid']]
+                if not self.running_processes and not self.pending_launches:
+                    self.launcher_priority.restore()
+            
+            if changed:
+                self.update_ui()
+        except Exception as e:
+            logger.error(f"Erreur lors du traitement des événements de processus: {e}")
+        finally:
+            if self._wake_pipe is None:
+                # Sans tube de réveil, la file est scrutée, plus souvent pendant l'activité
+                if self._poll_job is not None:
+                    self.root.after_cancel(self._poll_job)
+                active = self._startup_pending or self.running_processes or self.pending_launches
+                self._poll_job = self.root.after(UI_POLL_ACTIVE if active else UI_POLL_IDLE,
+                                                 self.process_events)
+
+    def update_ui(self):
+        """
+        Recalcule l'état affiché et n'applique aux widgets que ce qui a changé.
+        
+        Aucun rafraîchissement périodique n'a lieu au repos : l'interface est
+        mise à jour sur événement (lancement, battement, fin de processus,
+        changement de langue). Pendant une partie, le prochain rafraîchissement
+        est planifié au moment où la minute affichée change.
+        """
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        
+        next_refresh = None
+        try:
+            now = time.monotonic()
+            for version in ['vanilla', 'tbc', 'wotlk']:
+                clients = [info for info in self.running_processes.values() if info['version'] == version]
+                if clients:
+                    # Temps sauvegardé + temps écoulé depuis le dernier battement d'un des clients
+                    last_beat = max(info.get('last_beat', info['start_monotonic']) for info in clients)
+                    total_time = self.game_tracker.get_time(version) + int(now - last_beat)
+                    self.main_view.set((version, 'time'), self.language_manager.get_text('game_time', format_duration(total_time)))
+                    running_text = self.language_manager.get_text('game_running') if len(clients) == 1 \
+                        else self.language_manager.get_text('clients_running', len(clients))
+                    self.main_view.set((version, 'button'), (running_text, tk.DISABLED, self.colors['button_hover']))
+                    
+                    # Prochain changement de minute affichée
+                    until_next_minute = 60 - (total_time % 60)
+                    next_refresh = until_next_minute if next_refresh is None else min(next_refresh, until_next_minute)
                 else:
                     # Jeu non lancé, afficher uniquement le temps sauvegardé
-                    formatted_time = self.game_tracker.get_formatted_time(version)
-                    time_label.config(text=self.language_manager.get_text('game_time', formatted_time))
-                    launch_button.config(
-                        text=self.language_manager.get_text('launch_button', version.upper()),
-                        state=tk.NORMAL,
-                        bg=self.colors['button_bg']
-                    )
+                    self.main_view.set((version, 'time'), self.language_manager.get_text('game_time', format_duration(self.game_tracker.get_time(version))))
+                    self.main_view.set((version, 'button'), (self.language_manager.get_text('launch_button', version.upper()),
+                                                             tk.NORMAL, self.colors['button_bg']))
+            
+            for (version, field), value in self.main_view.pop_changes().items():
+                widgets = self.version_widgets.get(version)
+                if not widgets:
+                    continue
+                if field == 'time':
+                    widgets['time'].config(text=value)
+                elif field == 'button':
+                    text, state, bg = value
+                    widgets['button'].config(text=text, state=state, bg=bg)
         except Exception as e:
-            logging.error(f"Erreur lors de la mise à jour de l'interface: {e}")
+            logger.error(f"Erreur lors de la mise à jour de l'interface: {e}")
         finally:
-            # Mettre à jour toutes les secondes
-            self.root.after(1000, self.update_ui)
+            if next_refresh is not None:
+                self._refresh_job = self.root.after(int(next_refresh * 1000), self.update_ui)
+
+    def handle_command(self, command):
+        """Exécute une commande transmise par une autre instance du launcher."""
+        try:
+            logger.info(f"Commande reçue: {command}")
+            action, _, argument = command.partition(' ')
+            
+            # Ramener la fenêtre au premier plan
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+            
+            if action == 'launch' and argument in ('vanilla', 'tbc', 'wotlk'):
+                self.launch_game(argument)
+        except Exception as e:
+            logger.error(f"Erreur lors du traitement de la commande {command}: {e}")
 
     def get_version_number(self, version):
         """Retourne le numéro de version pour chaque version du jeu."""
@@ -662,7 +1298,7 @@ class TriLegacyLauncher:
         try:
             self.root.mainloop()
         except Exception as e:
-            logging.error(f"Erreur dans la boucle principale: {e}", exc_info=True)
+            logger.error(f"Erreur dans la boucle principale: {e}", exc_info=True)
             raise
 
     def create_settings_content(self, window):
@@ -727,6 +1363,25 @@ class TriLegacyLauncher:
         
         language_menu.bind('<<ComboboxSelected>>', language_selected)
 
+        # Télémétrie des clients (CPU, mémoire, E/S échantillonnés pendant la partie)
+        telemetry = self.settings_manager.get_telemetry()
+        telemetry_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+        telemetry_frame.pack(fill='x', pady=5)
+        self.telemetry_var = tk.BooleanVar(value=telemetry['enabled'])
+        tk.Checkbutton(telemetry_frame,
+                      text=self.language_manager.get_text('telemetry_enabled'),
+                      variable=self.telemetry_var,
+                      bg=self.colors['bg'],
+                      fg=self.colors['text'],
+                      selectcolor=self.colors['frame_bg'],
+                      activebackground=self.colors['bg'],
+                      activeforeground=self.colors['text']).pack(side='left')
+        tk.Label(telemetry_frame, text=self.language_manager.get_text('telemetry_interval'), **label_style).pack(side='left', padx=(20, 5))
+        self.telemetry_interval_entry = tk.Entry(telemetry_frame, width=4, bg=self.colors['frame_bg'], fg=self.colors['text'],
+                                                insertbackground=self.colors['text'])
+        self.telemetry_interval_entry.insert(0, str(telemetry['interval']))
+        self.telemetry_interval_entry.pack(side='left')
+
         # Chemins des jeux
         paths = [
             (f"Chemin Vanilla (1.12.1):", 'vanilla'),
@@ -735,6 +1390,16 @@ class TriLegacyLauncher:
         ]
 
         self.path_entries = {}
+        self.profile_vars = {}
+        self.launch_profile_vars = {}
+        self.multibox_entries = {}
+        
+        # Profils Config.wtf : nom affiché <-> identifiant
+        profile_names = {'': self.language_manager.get_text('profile_none')}
+        for profile in self.settings_manager.get_config_profiles():
+            profile_names[profile] = self.language_manager.get_text(f'profile_{profile}') \
+                if profile in PERFORMANCE_PROFILES else profile
+        self.profile_ids = {name: profile for profile, name in profile_names.items()}
         
         for label_text, version in paths:
             frame = tk.Frame(main_frame, bg=self.colors['bg'])
@@ -755,6 +1420,56 @@ class TriLegacyLauncher:
                                  command=lambda v=version: self.browse_path(v),
                                  **button_style)
             browse_btn.pack(side='left')
+            
+            # Profil Config.wtf appliqué au lancement
+            profile_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+            profile_frame.pack(fill='x', pady=(0, 5))
+            profile_label = tk.Label(profile_frame, text=self.language_manager.get_text('config_profile'), **label_style)
+            profile_label.pack(side='left', padx=(20, 10))
+            profile_var = tk.StringVar(value=profile_names[self.settings_manager.get_config_profile(version)])
+            profile_menu = ttk.Combobox(profile_frame,
+                                      textvariable=profile_var,
+                                      values=list(profile_names.values()),
+                                      state='readonly',
+                                      width=30)
+            profile_menu.pack(side='left')
+            self.profile_vars[version] = profile_var
+            
+            # Lancement multiple : nombre de clients et délai entre deux démarrages
+            multibox = self.settings_manager.get_multibox(version)
+            tk.Label(profile_frame, text=self.language_manager.get_text('multibox_clients'), **label_style).pack(side='left', padx=(20, 5))
+            clients_spin = tk.Spinbox(profile_frame, from_=1, to=10, width=3, bg=self.colors['frame_bg'],
+                                    fg=self.colors['text'], buttonbackground=self.colors['button_bg'])
+            clients_spin.delete(0, tk.END)
+            clients_spin.insert(0, str(multibox['clients']))
+            clients_spin.pack(side='left')
+            tk.Label(profile_frame, text=self.language_manager.get_text('multibox_stagger'), **label_style).pack(side='left', padx=(20, 5))
+            stagger_entry = tk.Entry(profile_frame, width=4, bg=self.colors['frame_bg'], fg=self.colors['text'],
+                                   insertbackground=self.colors['text'])
+            stagger_entry.insert(0, str(multibox['stagger']))
+            stagger_entry.pack(side='left')
+            self.multibox_entries[version] = (clients_spin, stagger_entry)
+            
+            # Profil de lancement : priorités CPU et E/S, cœurs autorisés
+            launch_profile = self.settings_manager.get_launch_profile(version)
+            launch_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+            launch_frame.pack(fill='x', pady=(0, 5))
+            launch_vars = {}
+            for key, text_key, levels in (('priority', 'cpu_priority', PRIORITY_LEVELS),
+                                          ('io_priority', 'io_priority', IO_PRIORITY_LEVELS)):
+                tk.Label(launch_frame, text=self.language_manager.get_text(text_key), **label_style).pack(side='left', padx=(20, 5))
+                names = {level: self.language_manager.get_text(f'level_{level}') for level in levels}
+                var = tk.StringVar(value=names.get(launch_profile[key], names['normal']))
+                ttk.Combobox(launch_frame, textvariable=var, values=list(names.values()),
+                           state='readonly', width=12).pack(side='left')
+                launch_vars[key] = (var, {name: level for level, name in names.items()})
+            tk.Label(launch_frame, text=self.language_manager.get_text('cpu_affinity'), **label_style).pack(side='left', padx=(20, 5))
+            affinity_entry = tk.Entry(launch_frame, width=10, bg=self.colors['frame_bg'], fg=self.colors['text'],
+                                    insertbackground=self.colors['text'])
+            affinity_entry.insert(0, format_cpu_list(launch_profile['affinity']))
+            affinity_entry.pack(side='left')
+            launch_vars['affinity'] = affinity_entry
+            self.launch_profile_vars[version] = launch_vars
 
         # Frame pour les boutons Sauvegarder et Annuler
         button_frame = tk.Frame(main_frame, bg=self.colors['bg'])
@@ -781,10 +1496,56 @@ class TriLegacyLauncher:
     def save_settings(self):
         """Sauvegarde les paramètres."""
         try:
+            # Vérification des profils de lancement avant toute sauvegarde
+            launch_profiles = {}
+            for version, launch_vars in self.launch_profile_vars.items():
+                text = launch_vars['affinity'].get()
+                try:
+                    affinity = parse_cpu_list(text)
+                except ValueError:
+                    messagebox.showerror(self.language_manager.get_text('error'),
+                                         self.language_manager.get_text('invalid_number', text))
+                    return
+                launch_profiles[version] = {'affinity': affinity}
+                for key in ('priority', 'io_priority'):
+                    var, levels = launch_vars[key]
+                    launch_profiles[version][key] = levels.get(var.get(), 'normal')
+            multiboxes = {}
+            for version, (clients_spin, stagger_entry) in self.multibox_entries.items():
+                try:
+                    clients = int(clients_spin.get())
+                    stagger = float(stagger_entry.get().replace(',', '.'))
+                    if not 1 <= clients <= 10 or stagger < 0:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror(self.language_manager.get_text('error'),
+                                         self.language_manager.get_text('invalid_number',
+                                                                        f"{clients_spin.get()} / {stagger_entry.get()}"))
+                    return
+                multiboxes[version] = {'clients': clients, 'stagger': stagger}
+            try:
+                telemetry_interval = float(self.telemetry_interval_entry.get().replace(',', '.'))
+                if telemetry_interval < 0.5:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror(self.language_manager.get_text('error'),
+                                     self.language_manager.get_text('invalid_number', self.telemetry_interval_entry.get()))
+                return
+            
             # Sauvegarde des chemins
             for version, entry in self.path_entries.items():
                 path = entry.get().strip()
                 self.settings_manager.set_path(version, path)
+            for version, profile_var in self.profile_vars.items():
+                self.settings_manager.set_config_profile(version, self.profile_ids.get(profile_var.get(), ''))
+            for version, profile in launch_profiles.items():
+                self.settings_manager.set_launch_profile(version, profile)
+            for version, multibox in multiboxes.items():
+                self.settings_manager.set_multibox(version, multibox)
+            self.settings_manager.set_telemetry({'enabled': self.telemetry_var.get(), 'interval': telemetry_interval})
+            if self.telemetry_sampler:
+                self.telemetry_sampler.interval = telemetry_interval
+            self.settings_manager.save_settings()
             
             # Sauvegarde de la langue
             selected_language = self.language_var.get()
@@ -843,6 +1604,24 @@ class TriLegacyLauncher:
                          bg=self.colors['frame_bg'],
                          fg=self.colors['gold'])
         header.pack(pady=10)
+        
+        # Recherche instantanée dans les addons de toutes les versions
+        search_frame = tk.Frame(main_frame, bg=self.colors['frame_bg'])
+        search_frame.pack(fill='x', pady=(0, 10))
+        tk.Label(search_frame,
+                text="🔍",
+                font=('Segoe UI Emoji', 12),
+                bg=self.colors['frame_bg'],
+                fg=self.colors['gold']).pack(side='left', padx=(5, 5))
+        self.addon_search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame,
+                              textvariable=self.addon_search_var,
+                              font=('Segoe UI', 11),
+                              bg=self.colors['button_bg'],
+                              fg=self.colors['text'],
+                              insertbackground=self.colors['gold'])
+        search_entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
+        self.addon_search_var.trace_add('write', lambda *args: self.apply_addon_filter())
 
         # Style des boutons
         button_style = {
@@ -865,6 +1644,9 @@ class TriLegacyLauncher:
             ('Wrath of the Lich King (3.3.5)', 'wotlk')
         ]
 
+        # Listes d'addons remplies par l'indexation puis tenues à jour par le surveillant
+        self.addon_views = {}
+
         for title, version in versions:
             # Frame avec bordure dorée pour chaque version
             version_frame = tk.Frame(main_frame, 
@@ -908,6 +1690,30 @@ class TriLegacyLauncher:
                                     fg=self.colors['text'])
                 path_label.pack(side='left', fill='x', expand=True)
                 
+                # Nombre d'addons et liste (titre, version) issus de l'index
+                count_label = tk.Label(version_frame,
+                                     text=self.language_manager.get_text('indexing_addons'),
+                                     font=('Morpheus', 10),
+                                     bg=self.colors['frame_bg'],
+                                     fg=self.colors['text'])
+                count_label.pack(anchor='w', padx=10)
+                
+                addon_list = VirtualList(version_frame, self.colors, visible_rows=ADDON_LIST_ROWS)
+                addon_list.pack(fill='x', padx=10, pady=5)
+                
+                # Activation / désactivation de la sélection pour tous les personnages
+                toggle_frame = tk.Frame(version_frame, bg=self.colors['frame_bg'])
+                toggle_frame.pack(pady=(0, 5))
+                for text_key, enabled in (('enable_addons', True), ('disable_addons', False)):
+                    toggle_btn = tk.Button(toggle_frame,
+                                         text=self.language_manager.get_text(text_key),
+                                         command=lambda v=version, p=path, e=enabled: [self.sound_manager.play('toggle'), self.toggle_selected_addons(v, p, e)],
+                                         **dict(button_style, width=18, pady=4))
+                    toggle_btn.pack(side='left', padx=5)
+                self.addon_views[version] = {'path': path, 'count_label': count_label,
+                                             'list': addon_list, 'rows': [], 'keys': {},
+                                             'populating': False}
+                
                 # Bouton pour ouvrir le dossier
                 btn = tk.Button(version_frame,
                               text=self.language_manager.get_text('open_addons'),
@@ -924,6 +1730,15 @@ class TriLegacyLauncher:
                 
                 btn.bind('<Enter>', lambda e, b=btn: on_enter(e, b))
                 btn.bind('<Leave>', lambda e, b=btn: on_leave(e, b))
+                
+                # Bouton d'installation depuis des archives .zip
+                install_btn = tk.Button(version_frame,
+                                      text=self.language_manager.get_text('install_addons'),
+                                      command=lambda v=version, p=path: [self.sound_manager.play('toggle'), self.install_addons(v, p)],
+                                      **button_style)
+                install_btn.pack(pady=(0, 10))
+                install_btn.bind('<Enter>', lambda e, b=install_btn: on_enter(e, b))
+                install_btn.bind('<Leave>', lambda e, b=install_btn: on_leave(e, b))
             else:
                 # Message d'erreur avec icône
                 error_frame = tk.Frame(version_frame, bg=self.colors['frame_bg'])
@@ -954,11 +1769,171 @@ class TriLegacyLauncher:
                 settings_btn.bind('<Enter>', lambda e, b=settings_btn: on_enter(e, b))
                 settings_btn.bind('<Leave>', lambda e, b=settings_btn: on_leave(e, b))
 
-        # Configurer le défilement avec la molette de la souris
+        # Défilement à la molette limité à cette fenêtre (les listes gèrent le leur)
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        window.bind("<MouseWheel>", _on_mousewheel)
+        window.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+        window.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        
+        self.start_addon_indexing(self.addon_views)
+
+    def start_addon_indexing(self, addon_views):
+        """Indexe les addons des versions configurées sans bloquer l'interface."""
+        def index_addons():
+            for version, view in addon_views.items():
+                try:
+                    self.addon_manager.refresh(version, view['path'])
+                    addons = self.addon_manager.get_addons(version)
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'indexation des addons de {version}: {e}")
+                    continue
+                self.ui_tasks.put(lambda a=addons, v=view: self.show_addon_list(a, v))
+        
+        threading.Thread(target=index_addons, name="AddonIndexing", daemon=True).start()
+
+    @staticmethod
+    def format_addon_row(addon):
+        """Élément de la liste des addons : (nom, titre, version)."""
+        return (addon['name'], addon['title'], addon['version'])
+
+    def show_addon_list(self, addons, view):
+        """Remplit la liste par tranches pour ne jamais bloquer l'interface."""
+        if not view['list'].winfo_exists():
+            return
+        view['rows'] = []
+        view['keys'] = {}
+        view['populating'] = True
+        view['list'].clear()
+        
+        def populate(start):
+            if not view['list'].winfo_exists():
+                return
+            chunk = addons[start:start + ADDON_LIST_CHUNK]
+            for addon in chunk:
+                key = addon_sort_key(addon)
+                view['rows'].append(key)
+                view['keys'][addon['name']] = key
+            view['list'].extend([self.format_addon_row(addon) for addon in chunk])
+            if start + ADDON_LIST_CHUNK < len(addons):
+                self.root.after(1, populate, start + ADDON_LIST_CHUNK)
+            else:
+                view['populating'] = False
+                view['count_label'].config(text=self.language_manager.get_text('addons_count', len(addons)))
+                self.apply_addon_filter()
+        
+        populate(0)
+
+    def apply_addon_filter(self):
+        """Filtre les listes d'addons selon la recherche en cours (index de trigrammes)."""
+        query = self.addon_search_var.get().strip() if self.addon_search_var is not None else ''
+        results = self.addon_manager.search(query) if query else {}
+        for version, view in self.addon_views.items():
+            if view['list'].winfo_exists():
+                view['list'].set_filter(results.get(version, set()) if query else None)
+
+    def on_addon_event(self, event):
+        """Répercute un lot de modifications sur la liste affichée, ligne par ligne."""
+        view = self.addon_views.get(event['version'])
+        if event['type'] != 'addons' or view is None or not view['list'].winfo_exists():
+            return
+        if view['populating']:
+            # Appliquer le lot une fois la liste complète
+            self.root.after(50, self.on_addon_event, event)
+            return
+        rows, keys, addon_list = view['rows'], view['keys'], view['list']
+        for name in list(event['removed']) + list(event['changed']):
+            key = keys.pop(name, None)
+            if key is not None:
+                index = bisect.bisect_left(rows, key)
+                del rows[index]
+                addon_list.delete(index)
+        for name, addon in event['changed'].items():
+            key = addon_sort_key(addon)
+            index = bisect.bisect_left(rows, key)
+            rows.insert(index, key)
+            keys[name] = key
+            addon_list.insert(index, self.format_addon_row(addon))
+        view['count_label'].config(text=self.language_manager.get_text('addons_count', len(rows)))
+        if self.addon_search_var is not None and self.addon_search_var.get().strip():
+            self.apply_addon_filter()
+
+    def toggle_selected_addons(self, version, path, enabled):
+        """Active ou désactive les addons sélectionnés (et leurs dépendances) pour tous les personnages."""
+        view = self.addon_views.get(version)
+        if view is None:
+            return
+        names = view['list'].selected()
+        if not names:
+            return
+        
+        def run():
+            try:
+                result = self.addon_manager.set_enabled(version, path, names, enabled)
+            except Exception as e:
+                logger.error(f"Erreur lors de la modification des addons: {e}")
+                self.ui_tasks.put(lambda: messagebox.showerror(self.language_manager.get_text('error'), str(e)))
+                return
+            self.ui_tasks.put(lambda: self.on_addons_toggled(result, enabled))
+        
+        threading.Thread(target=run, name="AddonToggle", daemon=True).start()
+
+    def on_addons_toggled(self, result, enabled):
+        """Affiche le bilan d'une activation ou désactivation groupée."""
+        title = self.language_manager.get_text('enable_addons' if enabled else 'disable_addons')
+        message = self.language_manager.get_text('addons_enabled' if enabled else 'addons_disabled',
+                                                 len(result['addons']), result['characters'])
+        warnings = []
+        if result['missing']:
+            warnings.append(self.language_manager.get_text('missing_dependencies', ', '.join(result['missing'])))
+        if result['cycles']:
+            warnings.append(self.language_manager.get_text(
+                'dependency_cycles', '; '.join(' → '.join(cycle) for cycle in result['cycles'])))
+        if warnings:
+            messagebox.showwarning(title, '\n\n'.join([message] + warnings))
+        else:
+            messagebox.showinfo(title, message)
+
+    def install_addons(self, version, path):
+        """Installe des archives d'addons choisies par l'utilisateur, hors du thread Tk."""
+        archives = filedialog.askopenfilenames(
+            title=self.language_manager.get_text('install_addons'),
+            filetypes=[("Archives ZIP", "*.zip")]
+        )
+        if not archives:
+            return
+        view = self.addon_views.get(version)
+        
+        def show_progress(done, total):
+            if view is not None and view['count_label'].winfo_exists():
+                view['count_label'].config(text=self.language_manager.get_text('installing_addons', done, total))
+        
+        def run():
+            try:
+                result = self.addon_manager.install(
+                    path, archives,
+                    progress=lambda done, total: self.ui_tasks.put(lambda: show_progress(done, total)))
+            except Exception as e:
+                logger.error(f"Erreur lors de l'installation des addons: {e}")
+                result = {'installed': [], 'errors': {'': str(e)}}
+            self.ui_tasks.put(lambda: self.on_addons_installed(version, result))
+        
+        threading.Thread(target=run, name="AddonInstall", daemon=True).start()
+
+    def on_addons_installed(self, version, result):
+        """Affiche le bilan d'une installation d'addons."""
+        view = self.addon_views.get(version)
+        if view is not None and view['count_label'].winfo_exists():
+            view['count_label'].config(text=self.language_manager.get_text('addons_count', len(view['rows'])))
+        message = self.language_manager.get_text('addons_installed', len(result['installed']),
+                                                 ', '.join(result['installed']))
+        if result['errors']:
+            failed = ', '.join(os.path.basename(name) for name in result['errors'] if name)
+            message += '\n\n' + self.language_manager.get_text('install_failed', failed or '?')
+            messagebox.showwarning(self.language_manager.get_text('install_addons'), message)
+        else:
+            messagebox.showinfo(self.language_manager.get_text('install_addons'), message)
 
     def open_addon_folder(self, path):
         try:
@@ -977,7 +1952,9 @@ class TriLegacyLauncher:
 
     def open_stats(self):
         """Ouvre la fenêtre des statistiques."""
-        window = WindowManager(self.root, self.language_manager.get_text('stats'), "400x600", self.colors)
+        if self.defer_until_ready(self.open_stats) or not self.require_services('session_store', 'background_tracker'):
+            return
+        window = WindowManager(self.root, self.language_manager.get_text('stats'), "450x800", self.colors)
         self.create_stats_content(window.window)
 
     def create_stats_content(self, window):
@@ -1000,6 +1977,10 @@ class TriLegacyLauncher:
             (self.language_manager.get_text('wotlk_title'), "wotlk")
         ]
 
+        # Une seule requête indexée pour toutes les versions
+        version_stats = self.session_store.get_version_stats()
+        launch_stats = self.session_store.get_launch_stats()
+
         for name, version in versions:
             # Titre de la version
             version_label = tk.Label(main_frame,
@@ -1013,37 +1994,50 @@ class TriLegacyLauncher:
             stats_frame = tk.Frame(main_frame, bg=self.colors['bg'])
             stats_frame.pack(fill='x', padx=10)
 
+            version_summary = version_stats.get(version, {})
+            streaks = version_summary.get('streaks', {'current': 0, 'best': 0})
+
             # Temps de jeu
             total_time = self.game_tracker.get_time(version)  # Utiliser uniquement le temps du game_tracker
-            hours = total_time // 3600
-            minutes = (total_time % 3600) // 60
-            time_text = f"{hours}h {minutes}min"
-
-            time_label = tk.Label(stats_frame,
-                                text=self.language_manager.get_text('game_time', time_text),
-                                font=('Segoe UI', 12),
-                                bg=self.colors['bg'],
-                                fg='white')
-            time_label.pack(anchor='w', pady=2)
-
-            # Nombre de lancements
-            launches = self.game_tracker.get_launches(version)  # Utiliser les lancements du game_tracker
-            launches_label = tk.Label(stats_frame,
-                                    text=self.language_manager.get_text('launches_count', launches),
-                                    font=('Segoe UI', 12),
-                                    bg=self.colors['bg'],
-                                    fg='white')
-            launches_label.pack(anchor='w', pady=2)
+            lines = [
+                self.language_manager.get_text('game_time', format_duration(total_time)),
+                self.language_manager.get_text('launches_count', self.game_tracker.get_launches(version)),
+                self.language_manager.get_text('week_time', format_duration(version_summary.get('week', 0))),
+                self.language_manager.get_text('month_time', format_duration(version_summary.get('month', 0))),
+                self.language_manager.get_text('longest_session', format_duration(version_summary.get('longest', 0))),
+                self.language_manager.get_text('current_streak', streaks['current'], streaks['best'])
+            ]
+
+            # Télémétrie de la dernière session mesurée
+            telemetry = version_summary.get('telemetry')
+            if telemetry:
+                lines.append(self.language_manager.get_text(
+                    'last_session_telemetry', format_size(telemetry['peak_rss']), f"{telemetry['mean_cpu']:.0f}",
+                    format_size(telemetry['read_bytes'] + telemetry['write_bytes'])))
+
+            # Délais de lancement (p50 / p95 des derniers lancements)
+            version_launches = launch_stats.get(version)
+            if version_launches:
+                lines.append(self.language_manager.get_text(
+                    'launch_latency',
+                    *(self.format_latency(value) for key in ('window', 'idle') for value in version_launches[key]),
+                    version_launches['count']))
+
+            for text in lines:
+                label = tk.Label(stats_frame,
+                               text=text,
+                               font=('Segoe UI', 12),
+                               bg=self.colors['bg'],
+                               fg='white')
+                label.pack(anchor='w', pady=2)
 
             # Dernière utilisation
-            if version in self.running_processes:
+            if self.is_running(version):
                 last_used = self.language_manager.get_text('game_running')
+            elif version_summary.get('last_start'):
+                last_used = datetime.fromtimestamp(version_summary['last_start']).strftime("%d/%m/%Y à %H:%M")
             else:
-                last_used = self.stats_manager.get_last_used(version)
-                if last_used:
-                    last_used = datetime.strptime(last_used, "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y à %H:%M")
-                else:
-                    last_used = self.language_manager.get_text('never_used')
+                last_used = self.language_manager.get_text('never_used')
 
             last_used_label = tk.Label(stats_frame,
                                      text=self.language_manager.get_text('last_used', last_used),
@@ -1052,14 +2046,474 @@ class TriLegacyLauncher:
                                      fg='white')
             last_used_label.pack(anchor='w', pady=(2, 10))
 
+            # Temps par client et cumulé pendant un lancement multiple
+            clients = self.background_tracker.get_clients(version)
+            if len(clients) > 1:
+                client_lines = [self.language_manager.get_text('client_time', index, client['pid'],
+                                                               format_duration(client['elapsed']))
+                                for index, client in enumerate(clients, 1)]
+                client_lines.append(self.language_manager.get_text(
+                    'clients_total_time', format_duration(sum(client['elapsed'] for client in clients))))
+                for text in client_lines:
+                    tk.Label(stats_frame,
+                            text=text,
+                            font=('Segoe UI', 10),
+                            bg=self.colors['bg'],
+                            fg='white').pack(anchor='w', padx=10)
+
+            # Télémétrie des clients en cours (derniers échantillons conservés)
+            for client in clients:
+                text = self.format_live_telemetry(client['pid'])
+                if text:
+                    tk.Label(stats_frame,
+                            text=text,
+                            font=('Segoe UI', 10),
+                            bg=self.colors['bg'],
+                            fg='white').pack(anchor='w', padx=10)
+
+    def format_live_telemetry(self, pid):
+        """Résume les derniers échantillons de télémétrie d'un client en cours (None sans échantillon)."""
+        series = self.telemetry_sampler.get_series(pid) if self.telemetry_sampler else None
+        if not series or not series['time']:
+            return None
+        cpu = series['cpu']
+        return self.language_manager.get_text(
+            'live_telemetry', pid, format_size(series['rss'][-1]), f"{sum(cpu) / len(cpu):.0f}",
+            f"{max(cpu):.0f}", format_duration(int(series['time'][-1] - series['time'][0])))
+
+    @staticmethod
+    def format_latency(seconds):
+        """Formate un délai de lancement en secondes (tiret si non mesuré)."""
+        return '-' if seconds is None else f"{seconds:.1f} s"
+
     def open_addon_manager(self):
         """Ouvre la fenêtre du gestionnaire d'addons."""
+        if self.defer_until_ready(self.open_addon_manager) or not self.require_services('addon_manager'):
+            return
         window = WindowManager(self.root, self.language_manager.get_text('addon_manager'), "800x600", self.colors)
         self.create_addon_manager_content(window.window)
 
+    def open_saved_variables(self):
+        """Ouvre la fenêtre d'analyse des SavedVariables."""
+        if self.defer_until_ready(self.open_saved_variables) or not self.require_services('addon_manager'):
+            return
+        window = WindowManager(self.root, self.language_manager.get_text('saved_variables'), "600x600", self.colors)
+        self.create_saved_variables_content(window.window)
+
+    def create_saved_variables_content(self, window):
+        """Crée le contenu de la fenêtre d'analyse des SavedVariables."""
+        main_frame = tk.Frame(window, bg=self.colors['frame_bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        header = tk.Label(main_frame,
+                         text=self.language_manager.get_text('saved_variables'),
+                         font=('Morpheus', 24, 'bold'),
+                         bg=self.colors['frame_bg'],
+                         fg=self.colors['gold'])
+        header.pack(pady=(0, 10))
+
+        button_style = {
+            'font': ('Morpheus', 12),
+            'bg': self.colors['button_bg'],
+            'fg': self.colors['gold'],
+            'activebackground': self.colors['button_hover'],
+            'activeforeground': self.colors['gold'],
+            'cursor': 'hand2',
+            'relief': 'ridge',
+            'bd': 2
+        }
+        buttons_frame = tk.Frame(main_frame, bg=self.colors['frame_bg'])
+        buttons_frame.pack(fill='x', pady=(0, 10))
+
+        status_label = tk.Label(main_frame,
+                              text="",
+                              font=('Segoe UI', 10),
+                              bg=self.colors['frame_bg'],
+                              fg=self.colors['text'])
+        status_label.pack(anchor='w')
+
+        report_text = tk.Text(main_frame,
+                            font=('Consolas', 10),
+                            bg=self.colors['button_bg'],
+                            fg=self.colors['text'],
+                            wrap='none',
+                            state='disabled')
+        report_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        view = {'status': status_label, 'text': report_text, 'buttons': []}
+        for key, archive in (('analyze_saved_variables', False), ('archive_orphans', True)):
+            button = tk.Button(buttons_frame,
+                             text=self.language_manager.get_text(key),
+                             command=lambda archive=archive: [self.sound_manager.play('toggle'),
+                                                              self.run_saved_variables_analysis(view, archive)],
+                             **button_style)
+            button.pack(side='left', padx=5)
+            view['buttons'].append(button)
+
+        self.run_saved_variables_analysis(view, False)
+
+    def run_saved_variables_analysis(self, view, archive_orphans):
+        """Analyse (et archive éventuellement) les SavedVariables de chaque version, hors du thread Tk."""
+        versions = [version for version in ('vanilla', 'tbc', 'wotlk')
+                    if self.settings_manager.get_path(version)
+                    and os.path.exists(self.settings_manager.get_path(version))]
+        if archive_orphans and any(self.is_running(version) for version in versions):
+            # Le client réécrit ses SavedVariables en quittant
+            messagebox.showwarning(self.language_manager.get_text('archive_orphans'),
+                                   self.language_manager.get_text('close_game_first'))
+            return
+        for button in view['buttons']:
+            button.config(state='disabled')
+
+        def show_progress(files, size):
+            if view['status'].winfo_exists():
+                view['status'].config(text=self.language_manager.get_text(
+                    'analyzing_saved_variables', files, format_size(size)))
+
+        def run():
+            reports = {}
+            for version in versions:
+                try:
+                    reports[version] = self.addon_manager.analyze_saved_variables(
+                        version, self.settings_manager.get_path(version), archive_orphans,
+                        progress=lambda files, size: self.ui_tasks.put(lambda: show_progress(files, size)))
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'analyse des SavedVariables {version}: {e}")
+            self.ui_tasks.put(lambda: self.show_saved_variables_report(view, reports))
+
+        threading.Thread(target=run, name="SavedVariables", daemon=True).start()
+
+    def show_saved_variables_report(self, view, reports, limit=10):
+        """Affiche le rapport d'analyse des SavedVariables."""
+        if not view['text'].winfo_exists():
+            return
+        lines = []
+        for version, report in reports.items():
+            lines.append(f"== {version.upper()} : " + self.language_manager.get_text(
+                'saved_variables_total', report['files'], format_size(report['total'])))
+            sections = [
+                ('saved_variables_by_addon', report['by_addon']),
+                ('saved_variables_by_character', report['by_character'])
+            ]
+            for key, sizes in sections:
+                lines.append(self.language_manager.get_text(key))
+                for name, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:limit]:
+                    lines.append(f"  {format_size(size):>10}  {name}")
+            lines.append(self.language_manager.get_text('saved_variables_top_variables'))
+            for variable in report['top_variables'][:limit]:
+                lines.append(f"  {format_size(variable['size']):>10}  {variable['addon']}: {variable['variable']}")
+            lines.append(self.language_manager.get_text(
+                'saved_variables_orphans', len(report['orphans']), format_size(report['orphan_bytes'])))
+            if report['archive_path']:
+                lines.append(self.language_manager.get_text(
+                    'orphans_archived', report['removed'], report['archive_path']))
+            else:
+                lines.extend(f"  {os.path.relpath(path, os.path.dirname(self.settings_manager.get_path(version)))}"
+                             for path in report['orphans'][:limit])
+            lines.append("")
+
+        view['text'].config(state='normal')
+        view['text'].delete('1.0', tk.END)
+        view['text'].insert('1.0', '\n'.join(lines))
+        view['text'].config(state='disabled')
+        view['status'].config(text="")
+        for button in view['buttons']:
+            button.config(state='normal')
+
+    def purge_client_cache(self, version, game_path, policy, progress=None):
+        """Purge le cache d'une version selon sa politique (appelée hors du thread Tk)."""
+        max_size = int(policy['max_size_mb'] * 1024 * 1024) if policy['max_size_mb'] is not None else None
+        return self.client_cache.purge(game_path, policy['max_age_days'], max_size, progress)
+
+    def open_client_cache(self):
+        """Ouvre la fenêtre de maintenance des caches des clients."""
+        if self.defer_until_ready(self.open_client_cache):
+            return
+        window = WindowManager(self.root, self.language_manager.get_text('client_cache'), "600x600", self.colors)
+        self.create_client_cache_content(window.window)
+
+    def create_client_cache_content(self, window):
+        """Crée le contenu de la fenêtre de maintenance des caches."""
+        main_frame = tk.Frame(window, bg=self.colors['frame_bg'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        header = tk.Label(main_frame,
+                         text=self.language_manager.get_text('client_cache'),
+                         font=('Morpheus', 24, 'bold'),
+                         bg=self.colors['frame_bg'],
+                         fg=self.colors['gold'])
+        header.pack(pady=(0, 10))
+
+        label_style = {
+            'font': ('Segoe UI', 10),
+            'bg': self.colors['frame_bg'],
+            'fg': self.colors['text']
+        }
+        button_style = {
+            'font': ('Morpheus', 12),
+            'bg': self.colors['button_bg'],
+            'fg': self.colors['gold'],
+            'activebackground': self.colors['button_hover'],
+            'activeforeground': self.colors['gold'],
+            'cursor': 'hand2',
+            'relief': 'ridge',
+            'bd': 2
+        }
+
+        versions = [
+            ('Vanilla (1.12.1)', 'vanilla'),
+            ('The Burning Crusade (2.4.3)', 'tbc'),
+            ('Wrath of the Lich King (3.3.5)', 'wotlk')
+        ]
+
+        for title, version in versions:
+            path = self.settings_manager.get_path(version)
+            if not path or not os.path.exists(path):
+                continue
+            version_frame = tk.Frame(main_frame,
+                                   bg=self.colors['frame_bg'],
+                                   highlightbackground=self.colors['gold'],
+                                   highlightthickness=1)
+            version_frame.pack(fill='x', pady=10, padx=5)
+
+            tk.Label(version_frame,
+                    text=title,
+                    font=('Morpheus', 16, 'bold'),
+                    bg=self.colors['frame_bg'],
+                    fg=self.colors['gold']).pack(pady=(10, 5))
+
+            size_label = tk.Label(version_frame, text="", **label_style)
+            size_label.pack(anchor='w', padx=10)
+
+            policy = self.settings_manager.get_cache_policy(version)
+            options_frame = tk.Frame(version_frame, bg=self.colors['frame_bg'])
+            options_frame.pack(fill='x', padx=10, pady=5)
+            entries = {}
+            for key, text_key in (('max_age_days', 'cache_max_age'), ('max_size_mb', 'cache_max_size')):
+                tk.Label(options_frame, text=self.language_manager.get_text(text_key), **label_style).pack(side='left')
+                entry = tk.Entry(options_frame, width=6, bg=self.colors['button_bg'], fg=self.colors['text'],
+                               insertbackground=self.colors['gold'])
+                if policy[key] is not None:
+                    entry.insert(0, str(policy[key]))
+                entry.pack(side='left', padx=(5, 15))
+                entries[key] = entry
+
+            auto_var = tk.BooleanVar(value=policy['auto_clear'])
+            view = {'version': version, 'path': path, 'size_label': size_label,
+                    'entries': entries, 'auto_var': auto_var, 'buttons': []}
+            tk.Checkbutton(version_frame,
+                          text=self.language_manager.get_text('cache_auto_clear'),
+                          variable=auto_var,
+                          command=lambda view=view: self.save_cache_policy(view),
+                          selectcolor=self.colors['button_bg'],
+                          activebackground=self.colors['frame_bg'],
+                          activeforeground=self.colors['text'],
+                          **label_style).pack(anchor='w', padx=10)
+
+            purge_button = tk.Button(version_frame,
+                                   text=self.language_manager.get_text('purge_cache'),
+                                   command=lambda view=view: [self.sound_manager.play('toggle'),
+                                                              self.run_cache_task(view, purge=True)],
+                                   **button_style)
+            purge_button.pack(pady=(5, 10))
+            view['buttons'].append(purge_button)
+
+            # Préchargement des archives MPQ dans le cache du système
+            prefetch_label = tk.Label(version_frame, text="", **label_style)
+            prefetch_label.pack(anchor='w', padx=10)
+            prefetch_policy = self.settings_manager.get_prefetch_policy(version)
+            prefetch_frame = tk.Frame(version_frame, bg=self.colors['frame_bg'])
+            prefetch_frame.pack(fill='x', padx=10, pady=5)
+            prefetch_var = tk.BooleanVar(value=prefetch_policy['enabled'])
+            tk.Checkbutton(prefetch_frame,
+                          text=self.language_manager.get_text('prefetch_on_startup'),
+                          variable=prefetch_var,
+                          command=lambda view=view: self.save_prefetch_policy(view),
+                          selectcolor=self.colors['button_bg'],
+                          activebackground=self.colors['frame_bg'],
+                          activeforeground=self.colors['text'],
+                          **label_style).pack(side='left')
+            tk.Label(prefetch_frame, text=self.language_manager.get_text('prefetch_budget'), **label_style).pack(side='left', padx=(15, 0))
+            budget_entry = tk.Entry(prefetch_frame, width=6, bg=self.colors['button_bg'], fg=self.colors['text'],
+                                  insertbackground=self.colors['gold'])
+            budget_entry.insert(0, str(prefetch_policy['budget_mb']))
+            budget_entry.pack(side='left', padx=5)
+            view.update({'prefetch_label': prefetch_label, 'prefetch_var': prefetch_var, 'budget_entry': budget_entry})
+
+            prefetch_buttons = tk.Frame(version_frame, bg=self.colors['frame_bg'])
+            prefetch_buttons.pack(pady=(5, 10))
+            tk.Button(prefetch_buttons,
+                     text=self.language_manager.get_text('prefetch_now'),
+                     command=lambda view=view: [self.sound_manager.play('toggle'), self.prefetch_now(view)],
+                     **button_style).pack(side='left', padx=5)
+            tk.Button(prefetch_buttons,
+                     text=self.language_manager.get_text('cancel'),
+                     command=lambda: [self.sound_manager.play('toggle'), self.prefetch_cancel.set()],
+                     **button_style).pack(side='left', padx=5)
+
+            self.cache_views[version] = view
+            self.run_cache_task(view, purge=False)
+
+    def save_cache_policy(self, view):
+        """Enregistre la politique de cache saisie ; retourne None si une valeur est invalide."""
+        policy = {'auto_clear': view['auto_var'].get()}
+        for key, entry in view['entries'].items():
+            value = entry.get().strip().replace(',', '.')
+            try:
+                policy[key] = float(value) if value else None
+                if policy[key] is not None and policy[key] < 0:
+                    raise ValueError(value)
+            except ValueError:
+                messagebox.showerror(self.language_manager.get_text('error'),
+                                     self.language_manager.get_text('invalid_number', value))
+                return None
+        self.settings_manager.set_cache_policy(view['version'], policy)
+        return policy
+
+    def save_prefetch_policy(self, view):
+        """Enregistre la politique de préchargement saisie ; retourne None si le budget est invalide."""
+        value = view['budget_entry'].get().strip()
+        try:
+            budget_mb = int(value)
+            if budget_mb <= 0:
+                raise ValueError(value)
+        except ValueError:
+            messagebox.showerror(self.language_manager.get_text('error'),
+                                 self.language_manager.get_text('invalid_number', value))
+            return None
+        policy = {'enabled': view['prefetch_var'].get(), 'budget_mb': budget_mb}
+        self.settings_manager.set_prefetch_policy(view['version'], policy)
+        return policy
+
+    def prefetch_now(self, view):
+        """Précharge immédiatement les archives de la version d'une vue."""
+        if self.save_prefetch_policy(view) is not None:
+            self.start_prefetch([view['version']])
+
+    def start_prefetch(self, versions=None):
+        """
+        Précharge les archives des versions données (par défaut celles dont le
+        préchargement au démarrage est activé) dans un thread d'arrière-plan.
+        """
+        if self.prefetch_thread is not None and self.prefetch_thread.is_alive():
+            return False
+        if versions is None:
+            versions = [version for version in ('vanilla', 'tbc', 'wotlk')
+                        if self.settings_manager.get_prefetch_policy(version)['enabled']]
+        versions = [version for version in versions
+                    if self.settings_manager.get_path(version)
+                    and os.path.exists(self.settings_manager.get_path(version))]
+        if not versions:
+            return False
+        self.prefetch_cancel = threading.Event()
+        cancel = self.prefetch_cancel
+
+        def run():
+            for version in versions:
+                if cancel.is_set():
+                    break
+                budget = self.settings_manager.get_prefetch_policy(version)['budget_mb'] * 1024 * 1024
+                try:
+                    report = self.data_prefetcher.prefetch(
+                        self.settings_manager.get_path(version), budget, cancel,
+                        progress=lambda done, total, version=version: self.ui_tasks.put(
+                            lambda: self.on_prefetch_progress(version, done, total)))
+                except Exception as e:
+                    logger.error(f"Erreur lors du préchargement {version}: {e}")
+                    report = None
+                self.ui_tasks.put(lambda version=version, report=report: self.on_prefetch_done(version, report))
+
+        self.prefetch_thread = threading.Thread(target=run, name="DataPrefetch", daemon=True)
+        self.prefetch_thread.start()
+        return True
+
+    def on_prefetch_progress(self, version, done, total):
+        """Affiche l'avancement du préchargement dans la fenêtre de maintenance, si elle est ouverte."""
+        view = self.cache_views.get(version)
+        if view is not None and view['prefetch_label'].winfo_exists():
+            view['prefetch_label'].config(text=self.language_manager.get_text(
+                'prefetching', format_size(done), format_size(total)))
+
+    def on_prefetch_done(self, version, report):
+        """Affiche le résultat d'un préchargement."""
+        view = self.cache_views.get(version)
+        if view is None or not view['prefetch_label'].winfo_exists() or report is None:
+            return
+        view['prefetch_label'].config(text=self.format_residency(report['resident_after'], report['total']))
+
+    def format_residency(self, resident, total):
+        """Texte de la part des archives présente en mémoire."""
+        if resident is None:
+            return self.language_manager.get_text('data_resident', '?', format_size(total))
+        return self.language_manager.get_text('data_resident', format_size(resident), format_size(total))
+
+    def run_cache_task(self, view, purge):
+        """Mesure ou purge le cache d'une version, hors du thread Tk."""
+        version = view['version']
+        policy = None
+        if purge:
+            if self.is_running(version):
+                messagebox.showwarning(self.language_manager.get_text('client_cache'),
+                                       self.language_manager.get_text('close_game_first'))
+                return
+            policy = self.save_cache_policy(view)
+            if policy is None:
+                return
+        for button in view['buttons']:
+            button.config(state='disabled')
+
+        def show_progress(text):
+            if view['size_label'].winfo_exists():
+                view['size_label'].config(text=text)
+
+        def on_measured(done, size):
+            text = self.language_manager.get_text('measuring_cache', done, format_size(size))
+            self.ui_tasks.put(lambda: show_progress(text))
+
+        def show_residency(resident, total):
+            if view['prefetch_label'].winfo_exists():
+                view['prefetch_label'].config(text=self.format_residency(resident, total))
+
+        def on_purged(done, total):
+            text = self.language_manager.get_text('purging_cache', done, total)
+            self.ui_tasks.put(lambda: show_progress(text))
+
+        def run():
+            freed = None
+            try:
+                if purge:
+                    freed = self.purge_client_cache(version, view['path'], policy, on_purged)['freed']
+                result = self.client_cache.measure(view['path'], on_measured)
+                resident, total = self.data_prefetcher.residency(find_data_files(view['path']))
+                self.ui_tasks.put(lambda: show_residency(resident, total))
+            except Exception as e:
+                logger.error(f"Erreur lors de la maintenance du cache {version}: {e}")
+                result = None
+            self.ui_tasks.put(lambda: self.on_cache_task_done(view, result, freed))
+
+        threading.Thread(target=run, name="ClientCache", daemon=True).start()
+
+    def on_cache_task_done(self, view, result, freed):
+        """Affiche la taille du cache après une mesure ou une purge."""
+        if not view['size_label'].winfo_exists():
+            return
+        if result is None:
+            text = self.language_manager.get_text('error')
+        elif not result['dirs']:
+            text = self.language_manager.get_text('no_cache')
+        else:
+            text = self.language_manager.get_text('cache_size', format_size(result['size']), result['files'])
+            if freed is not None:
+                text += " — " + self.language_manager.get_text('cache_freed', format_size(freed))
+        view['size_label'].config(text=text)
+        for button in view['buttons']:
+            button.config(state='normal')
+
     def open_settings(self):
         """Ouvre la fenêtre des paramètres."""
-        window = WindowManager(self.root, self.language_manager.get_text('settings'), "800x500", self.colors)
+        if self.defer_until_ready(self.open_settings):
+            return
+        window = WindowManager(self.root, self.language_manager.get_text('settings'), "800x650", self.colors)
         self.create_settings_content(window.window)
 
     def center_window(self):
@@ -1072,23 +2526,38 @@ class TriLegacyLauncher:
 
     def on_closing(self):
         """Gère la fermeture propre de l'application."""
+        # Attendre la fin de l'initialisation différée, qui écrit dans le journal et l'historique
+        if self.defer_until_ready(self.on_closing):
+            return
         try:
-            # Sauvegarder le temps de jeu pour tous les processus en cours
-            current_time = datetime.now()
-            for version, process_info in list(self.running_processes.items()):
+            # Arrêter le préchargement, puis le tracker : il crédite le temps écoulé
+            # depuis le dernier battement de chaque version avant de clore les sessions
+            self.prefetch_cancel.set()
+            for service in (self.launch_timeline, self.telemetry_sampler, self.background_tracker):
+                if service is not None:
+                    service.stop()
+            
+            # Fermer les clients encore en cours
+            for process_info in list(self.running_processes.values()):
                 if process_info['process'].poll() is None:
-                    elapsed = int((current_time - process_info['start_time']).total_seconds())
-                    self.game_tracker.increment_time(version, elapsed)
                     process_info['process'].terminate()
-
-            # Arrêter le tracker en arrière-plan
-            self.background_tracker.stop()
+            
+            # Écrire le temps de jeu en attente avant de quitter
+            self.game_tracker.close()
+            for service in (self.session_journal, self.session_store, self.addon_manager):
+                if service is not None:
+                    service.close()
+            self.data_store.close()
+            if self._wake_pipe is not None:
+                self.root.tk.deletefilehandler(self._wake_pipe.fileno())
+                self._wake_pipe.close()
+                self._wake_pipe = None
             
             # Détruire la fenêtre principale
             self.root.destroy()
             
         except Exception as e:
-            logging.error(f"Erreur lors de la fermeture de l'application: {e}")
+            logger.error(f"Erreur lors de la fermeture de l'application: {e}")
             self.root.destroy()
 
     def update_interface_texts(self):
@@ -1117,7 +2586,7 @@ class TriLegacyLauncher:
                     elif any(f"LANCER {v.upper()}" in current_text.upper() for v in ['vanilla', 'tbc', 'wotlk']):
                         for v in ['vanilla', 'tbc', 'wotlk']:
                             if v.upper() in current_text.upper():
-                                if v in self.running_processes:
+                                if self.is_running(v):
                                     widget.config(text=self.language_manager.get_text('game_running'))
                                 else:
                                     widget.config(text=self.language_manager.get_text('launch_button', v.upper()))
@@ -1144,6 +2613,8 @@ class TriLegacyLauncher:
             tools_menu = menubar.winfo_children()[1]
             tools_menu.entryconfigure(0, label=self.language_manager.get_text('addons'))
             tools_menu.entryconfigure(1, label=self.language_manager.get_text('stats'))
+            tools_menu.entryconfigure(2, label=self.language_manager.get_text('saved_variables'))
+            tools_menu.entryconfigure(3, label=self.language_manager.get_text('client_cache'))
             
             # Mise à jour récursive de tous les widgets
             update_widget_text(self.root)
@@ -1161,11 +2632,15 @@ class TriLegacyLauncher:
                         window.title(self.language_manager.get_text('settings'))
                         self.update_settings_window(window)
             
+            # Réappliquer l'état affiché de la fenêtre principale
+            self.main_view.invalidate()
+            self.update_ui()
+            
             # Forcer la mise à jour de l'interface
             self.root.update_idletasks()
 
         except Exception as e:
-            logging.error(f"Erreur lors de la mise à jour des textes de l'interface: {e}")
+            logger.error(f"Erreur lors de la mise à jour des textes de l'interface: {e}")
 
     def update_stats_window(self, window):
         """Met à jour les textes de la fenêtre des statistiques."""
@@ -1194,10 +2669,10 @@ class TriLegacyLauncher:
                             launches = self.game_tracker.get_launches(version)
                             widget.config(text=self.language_manager.get_text('launches_count', launches))
                         elif 'dernière utilisation' in widget.cget('text').lower():
-                            if version in self.running_processes:
+                            if self.is_running(version):
                                 last_used = self.language_manager.get_text('game_running')
                             else:
-                                last_used = self.stats_manager.get_last_used(version)
+                                last_used = self.stats_manager.get_last_used(version) if self.stats_manager else None
                                 if last_used:
                                     last_used = datetime.strptime(last_used, "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y à %H:%M")
                                 else:
@@ -1205,7 +2680,7 @@ class TriLegacyLauncher:
                             widget.config(text=self.language_manager.get_text('last_used', last_used))
 
         except Exception as e:
-            logging.error(f"Erreur lors de la mise à jour de la fenêtre des statistiques: {e}")
+            logger.error(f"Erreur lors de la mise à jour de la fenêtre des statistiques: {e}")
 
     def update_addon_window(self, window):
         """Met à jour les textes de la fenêtre des addons."""
@@ -1224,7 +2699,7 @@ class TriLegacyLauncher:
                         widget.config(text=self.language_manager.get_text('configure_path'))
 
         except Exception as e:
-            logging.error(f"Erreur lors de la mise à jour de la fenêtre des addons: {e}")
+            logger.error(f"Erreur lors de la mise à jour de la fenêtre des addons: {e}")
 
     def update_settings_window(self, window):
         """Met à jour les textes de la fenêtre des paramètres."""
@@ -1252,7 +2727,7 @@ class TriLegacyLauncher:
                         widget.config(text=self.language_manager.get_text('cancel'))
 
         except Exception as e:
-            logging.error(f"Erreur lors de la mise à jour de la fenêtre des paramètres: {e}")
+            logger.error(f"Erreur lors de la mise à jour de la fenêtre des paramètres: {e}")
 
     def change_language(self, language, window=None):
         """Change la langue de l'interface."""
@@ -1272,6 +2747,8 @@ class TriLegacyLauncher:
             tools_menu = menubar.winfo_children()[1]
             tools_menu.entryconfigure(0, label=self.language_manager.get_text('addons'))
             tools_menu.entryconfigure(1, label=self.language_manager.get_text('stats'))
+            tools_menu.entryconfigure(2, label=self.language_manager.get_text('saved_variables'))
+            tools_menu.entryconfigure(3, label=self.language_manager.get_text('client_cache'))
             
             # Mise à jour des labels des menus
             menubar.entryconfigure(0, label=self.language_manager.get_text('file'))
@@ -1289,7 +2766,7 @@ class TriLegacyLauncher:
                 time_label = frame.winfo_children()[1]     # Deuxième widget dans le frame
                 
                 # Mise à jour du bouton de lancement
-                if version in self.running_processes:
+                if self.is_running(version):
                     launch_button.config(text=self.language_manager.get_text('game_running'))
                 else:
                     launch_button.config(text=self.language_manager.get_text('launch_button', version.upper()))
@@ -1309,11 +2786,15 @@ class TriLegacyLauncher:
             if window:
                 window.destroy()
             
+            # Réappliquer l'état affiché de la fenêtre principale
+            self.main_view.invalidate()
+            self.update_ui()
+            
             # Forcer la mise à jour de l'interface
             self.root.update_idletasks()
             
         except Exception as e:
-            logging.error(f"Erreur lors du changement de langue: {e}")
+            logger.error(f"Erreur lors du changement de langue: {e}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
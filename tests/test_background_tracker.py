@@ -0,0 +1,104 @@
+import sys
+import time
+import subprocess
+
+import pytest
+
+from utils import process_monitor
+from utils.background_tracker import BackgroundTracker
+from utils.data_store import DataStore
+from utils.game_time_tracker import GameTimeTracker
+from utils.process_monitor import ProcessMonitor
+
+
+class FakeMonitor:
+    """Moniteur sans thread : les événements sont injectés par le test."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def watch(self, pid, tag=None, process=None):
+        pass
+
+    def unwatch(self, pid):
+        pass
+
+    def stop(self):
+        pass
+
+    def emit(self, kind, pid, tag, elapsed):
+        for callback in self.listeners:
+            callback({'type': kind, 'pid': pid, 'tag': tag, 'elapsed': elapsed, 'returncode': None})
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+
+
+@pytest.fixture
+def game_tracker(tmp_path):
+    store = DataStore(str(tmp_path), flush_interval=60)
+    yield GameTimeTracker(store)
+    store.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_overlapping_clients_are_credited_once(game_tracker, clock):
+    monitor = FakeMonitor()
+    tracker = BackgroundTracker(game_tracker, monitor=monitor)
+    tracker.start_tracking('wotlk', FakeProcess(1))
+    clock[0] += 30
+    tracker.start_tracking('wotlk', FakeProcess(2))
+
+    # Les deux clients battent pour la même période : elle n'est créditée qu'une fois
+    clock[0] += 60
+    monitor.emit('heartbeat', 1, 'wotlk', 90)
+    monitor.emit('heartbeat', 2, 'wotlk', 60)
+    assert game_tracker.get_time('wotlk') == 90
+
+    clock[0] += 10
+    monitor.emit('exit', 1, 'wotlk', 10)
+    clock[0] += 20
+    monitor.emit('exit', 2, 'wotlk', 30)
+    assert game_tracker.get_time('wotlk') == 120
+    assert tracker.groups == {} and tracker.tracking_sessions == {}
+
+
+def test_clients_of_different_versions_are_credited_separately(game_tracker, clock):
+    monitor = FakeMonitor()
+    tracker = BackgroundTracker(game_tracker, monitor=monitor)
+    tracker.start_tracking('tbc', FakeProcess(1))
+    tracker.start_tracking('vanilla', FakeProcess(2))
+    clock[0] += 40
+    monitor.emit('exit', 1, 'tbc', 40)
+    monitor.emit('exit', 2, 'vanilla', 40)
+    assert game_tracker.get_time('tbc') == 40
+    assert game_tracker.get_time('vanilla') == 40
+
+
+def test_real_clients_with_polling_backend(game_tracker, monkeypatch):
+    monkeypatch.setattr(process_monitor, '_create_backend', process_monitor._PollingBackend)
+    monitor = ProcessMonitor(heartbeat_interval=0.2, poll_interval=0.05)
+    tracker = BackgroundTracker(game_tracker, monitor=monitor)
+    processes = [subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(1.5)']) for _ in range(2)]
+    for process in processes:
+        tracker.start_tracking('wotlk', process)
+
+    deadline = time.monotonic() + 5
+    while tracker.tracking_sessions and time.monotonic() < deadline:
+        time.sleep(0.05)
+    tracker.stop()
+
+    assert tracker.tracking_sessions == {}
+    # Réunion des durées de vie (~1,5 s), et non leur somme (~3 s)
+    assert 1 <= game_tracker.get_time('wotlk') <= 2
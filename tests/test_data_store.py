@@ -0,0 +1,64 @@
+import os
+import json
+
+from utils.data_store import DataStore, SCHEMA_VERSION
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def read_store(data_dir):
+    with open(os.path.join(data_dir, 'store.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_legacy_files_are_migrated_once(tmp_path):
+    data_dir = str(tmp_path)
+    write_json(os.path.join(data_dir, 'settings.json'), {'paths': {'wotlk': 'C:/WoW/Wow.exe'}})
+    write_json(os.path.join(data_dir, 'game_time.json'),
+               {'times': {'wotlk': 3600}, 'last_used': {}, 'launches': {'wotlk': 4}})
+    write_json(os.path.join(data_dir, 'config.json'), {'language': 'en'})
+
+    store = DataStore(data_dir, flush_interval=60)
+    assert store.section('settings')['paths']['wotlk'] == 'C:/WoW/Wow.exe'
+    assert store.section('game_time')['times']['wotlk'] == 3600
+    assert store.section('config')['language'] == 'en'
+    store.close()
+
+    stored = read_store(data_dir)
+    assert stored['schema'] == SCHEMA_VERSION
+    assert stored['sections']['game_time']['launches']['wotlk'] == 4
+
+    # Une fois store.json écrit, les anciens fichiers ne sont plus relus
+    write_json(os.path.join(data_dir, 'config.json'), {'language': 'de'})
+    store = DataStore(data_dir, flush_interval=60)
+    assert store.section('config')['language'] == 'en'
+    store.close()
+
+
+def test_changes_are_written_on_close(tmp_path):
+    data_dir = str(tmp_path)
+    store = DataStore(data_dir, flush_interval=60)
+    store.close()
+
+    store = DataStore(data_dir, flush_interval=60)
+    with store.lock:
+        store.section('game_time')['times']['tbc'] = 120
+    store.mark_dirty('game_time')
+    store.close()
+
+    assert read_store(data_dir)['sections']['game_time']['times']['tbc'] == 120
+    store = DataStore(data_dir, flush_interval=60)
+    assert store.section('game_time')['times']['tbc'] == 120
+    store.close()
+
+
+def test_unreadable_store_falls_back_to_defaults(tmp_path):
+    data_dir = str(tmp_path)
+    with open(os.path.join(data_dir, 'store.json'), 'w', encoding='utf-8') as f:
+        f.write('{tronqué')
+    store = DataStore(data_dir, flush_interval=60)
+    assert store.section('config')['language'] == 'fr'
+    store.close()
@@ -0,0 +1,70 @@
+import os
+import json
+import threading
+
+import pytest
+
+from utils.persistence import atomic_write_json, WriteBehindWriter
+
+
+def test_atomic_write_json_replaces_file(tmp_path):
+    path = str(tmp_path / 'sub' / 'data.json')
+    atomic_write_json(path, {'a': 1})
+    atomic_write_json(path, {'a': 2}, indent=2)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'a': 2}
+    # Aucun fichier temporaire ne reste dans le dossier
+    assert os.listdir(os.path.dirname(path)) == ['data.json']
+
+
+def test_atomic_write_json_keeps_old_file_on_error(tmp_path):
+    path = str(tmp_path / 'data.json')
+    atomic_write_json(path, {'a': 1})
+    with pytest.raises(TypeError):
+        atomic_write_json(path, {'a': object()})
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'a': 1}
+    assert os.listdir(str(tmp_path)) == ['data.json']
+
+
+def test_write_behind_coalesces_changes():
+    flushed = []
+    writer = WriteBehindWriter(lambda: flushed.append(1), flush_interval=60)
+    for _ in range(100):
+        writer.mark_dirty()
+    assert flushed == []
+    writer.close()
+    assert flushed == [1]
+
+
+def test_request_flush_writes_in_background():
+    done = threading.Event()
+    writer = WriteBehindWriter(done.set, flush_interval=60)
+    writer.mark_dirty()
+    writer.request_flush()
+    assert done.wait(2)
+    writer.close()
+    assert not writer.dirty
+
+
+def test_close_without_changes_does_not_write():
+    flushed = []
+    writer = WriteBehindWriter(lambda: flushed.append(1), flush_interval=60)
+    writer.close()
+    assert flushed == []
+
+
+def test_failed_flush_is_retried_on_close():
+    calls = []
+
+    def flush():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("disque plein")
+
+    writer = WriteBehindWriter(flush, flush_interval=60)
+    writer.mark_dirty()
+    assert writer.flush() is False
+    assert writer.dirty
+    writer.close()
+    assert len(calls) == 2 and not writer.dirty
@@ -0,0 +1,98 @@
+import sys
+import time
+import queue
+import subprocess
+
+import pytest
+
+from utils import process_monitor
+from utils.process_monitor import ProcessMonitor
+
+
+@pytest.fixture
+def polling(monkeypatch):
+    """Force le mode dégradé par scrutation, disponible sur toutes les plateformes."""
+    monkeypatch.setattr(process_monitor, '_create_backend', process_monitor._PollingBackend)
+
+
+def spawn(seconds):
+    return subprocess.Popen([sys.executable, '-c', f'import time; time.sleep({seconds})'])
+
+
+def next_event(monitor, kind, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        event = monitor.events.get(timeout=max(0.0, deadline - time.monotonic()))
+        if event['type'] == kind:
+            return event
+
+
+def test_exit_events_fire_with_polling_backend(polling):
+    monitor = ProcessMonitor(heartbeat_interval=60, poll_interval=0.05)
+    fast, slow = spawn(0.1), spawn(0.4)
+    monitor.watch(fast.pid, 'tbc', fast)
+    monitor.watch(slow.pid, 'wotlk', slow)
+    try:
+        first = next_event(monitor, 'exit')
+        second = next_event(monitor, 'exit')
+        assert monitor._backend.name == 'poll'
+        assert [(first['pid'], first['tag']), (second['pid'], second['tag'])] == \
+            [(fast.pid, 'tbc'), (slow.pid, 'wotlk')]
+        assert first['returncode'] == 0
+    finally:
+        monitor.stop()
+
+
+def test_heartbeats_and_listeners(polling):
+    monitor = ProcessMonitor(heartbeat_interval=0.1, poll_interval=0.05)
+    seen = queue.Queue()
+    monitor.add_listener(seen.put)
+    process = spawn(0.5)
+    monitor.watch(process.pid, 'vanilla', process)
+    try:
+        beat = next_event(monitor, 'heartbeat')
+        assert beat['pid'] == process.pid and beat['elapsed'] >= 0.1
+        assert next_event(monitor, 'exit')['pid'] == process.pid
+        assert seen.qsize() >= 2
+    finally:
+        monitor.stop()
+
+
+def test_unwatch_emits_nothing(polling):
+    monitor = ProcessMonitor(heartbeat_interval=60, poll_interval=0.05)
+    process = spawn(0.2)
+    monitor.watch(process.pid, 'tbc', process)
+    monitor.unwatch(process.pid)
+    try:
+        process.wait()
+        with pytest.raises(queue.Empty):
+            monitor.events.get(timeout=0.3)
+    finally:
+        monitor.stop()
+
+
+def test_thread_restarts_after_backend_failures(polling):
+    monitor = ProcessMonitor(heartbeat_interval=60, poll_interval=0.05)
+    process = spawn(0.6)
+    monitor.watch(process.pid, 'wotlk', process)
+
+    def fail(timeout):
+        raise OSError("mécanisme d'attente défaillant")
+
+    # Chaque nouveau mécanisme échoue : le thread s'arrête après plusieurs erreurs
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(process_monitor._PollingBackend, 'wait', lambda self, timeout: fail(timeout))
+        monitor._backend.wake()
+        deadline = time.monotonic() + 2
+        while monitor._running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not monitor._running
+
+    # La surveillance en cours est reprise au redémarrage
+    other = spawn(0.1)
+    monitor.watch(other.pid, 'tbc', other)
+    try:
+        pids = {next_event(monitor, 'exit')['pid'], next_event(monitor, 'exit')['pid']}
+        assert pids == {process.pid, other.pid}
+    finally:
+        monitor.stop()
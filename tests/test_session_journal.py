@@ -0,0 +1,108 @@
+import os
+
+from utils import session_journal
+from utils.persistence import atomic_write_json
+from utils.session_journal import SessionJournal
+
+
+def play(journal, version, elapsed):
+    session_id = journal.start_session(version)
+    journal.heartbeat(session_id, elapsed // 2)
+    journal.stop_session(session_id, elapsed)
+
+
+def test_totals_survive_restart(tmp_path):
+    journal = SessionJournal(str(tmp_path), seed_totals={'wotlk': 1000})
+    play(journal, 'wotlk', 600)
+    journal.close()
+
+    for _ in range(3):
+        journal = SessionJournal(str(tmp_path), seed_totals={'wotlk': 1000})
+        assert journal.get_total('wotlk') == 1600
+        journal.close()
+
+
+def test_recover_closes_sessions_at_last_heartbeat(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    session_id = journal.start_session('tbc', pid=42, base=300)
+    journal.heartbeat(session_id, 120)
+    journal._handle.close()  # Crash : la session n'est jamais close
+
+    journal = SessionJournal(str(tmp_path))
+    recovered = journal.recover()
+    assert [(r['version'], r['elapsed'], r['base']) for r in recovered] == [('tbc', 120, 300)]
+    assert journal.get_total('tbc') == 120
+    journal.close()
+
+
+def test_compaction_keeps_totals(tmp_path):
+    journal = SessionJournal(str(tmp_path), compact_threshold=10 ** 6)
+    play(journal, 'vanilla', 100)
+    journal.compact()
+    play(journal, 'vanilla', 50)
+    journal.close()
+
+    journal = SessionJournal(str(tmp_path))
+    assert journal.get_total('vanilla') == 150
+    assert journal.generation == 1
+    journal.close()
+
+
+def test_stale_journal_is_replaced_after_crash_during_compaction(tmp_path):
+    journal = SessionJournal(str(tmp_path), compact_threshold=10 ** 6)
+    play(journal, 'wotlk', 100)
+    # Crash entre l'écriture de l'instantané et le remplacement du journal
+    # (ancien format : instantané de la génération suivante, sans position)
+    atomic_write_json(journal.snapshot_file, {
+        'schema': session_journal.JOURNAL_SCHEMA,
+        'generation': journal.generation + 1,
+        'totals': dict(journal.totals),
+        'sessions': dict(journal.session_counts),
+        'open_sessions': {}
+    })
+    journal._handle.close()
+
+    journal = SessionJournal(str(tmp_path))
+    assert journal.get_total('wotlk') == 100
+    play(journal, 'wotlk', 500)
+    assert journal.get_total('wotlk') == 600
+    journal.close()
+
+    journal = SessionJournal(str(tmp_path))
+    assert journal.get_total('wotlk') == 600
+    journal.close()
+
+
+def test_crash_before_journal_swap_replays_only_the_tail(tmp_path, monkeypatch):
+    journal = SessionJournal(str(tmp_path), compact_threshold=10 ** 6)
+    play(journal, 'tbc', 100)
+
+    replace = os.replace
+
+    def fail_on_journal(src, dst):
+        if dst == journal.journal_file:
+            raise OSError("crash simulé")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, 'replace', fail_on_journal)
+    journal.compact()
+    monkeypatch.undo()
+    assert os.path.exists(journal.snapshot_file)
+    # L'instantané couvre déjà la première session ; le journal reste utilisable
+    play(journal, 'tbc', 40)
+    journal.close()
+
+    journal = SessionJournal(str(tmp_path))
+    assert journal.get_total('tbc') == 140
+    journal.close()
+
+
+def test_background_compaction(tmp_path):
+    journal = SessionJournal(str(tmp_path), compact_threshold=3)
+    for _ in range(5):
+        play(journal, 'vanilla', 10)
+    journal.close()
+
+    journal = SessionJournal(str(tmp_path))
+    assert journal.get_total('vanilla') == 50
+    journal.close()
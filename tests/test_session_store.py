@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.session_store import SessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(str(tmp_path))
+    yield store
+    store.close()
+
+
+def at_noon(days_ago):
+    day = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=days_ago)
+    return day.timestamp()
+
+
+def test_version_stats_in_one_query(store):
+    sessions = [(at_noon(days_ago), duration)
+                for days_ago, duration in ((0, 600), (1, 1200), (2, 300), (10, 5000), (11, 100), (12, 100))]
+    for start, duration in sessions:
+        store.record_session('wotlk', start, duration)
+    store.record_session('wotlk', at_noon(400), 99999, source='import')
+    store.record_telemetry('wotlk', {'start': at_noon(1), 'duration': 1200, 'samples': 10, 'peak_rss': 1 << 30,
+                                     'mean_cpu': 40.0, 'read_bytes': 5, 'write_bytes': 6, 'peak_threads': 30,
+                                     'peak_handles': 200})
+    store.record_telemetry('wotlk', {'start': at_noon(0), 'duration': 600, 'samples': 5, 'peak_rss': 1 << 29,
+                                     'mean_cpu': 20.0, 'read_bytes': 1, 'write_bytes': 2, 'peak_threads': 25,
+                                     'peak_handles': 150})
+
+    stats = store.get_version_stats()
+    assert set(stats) == {'vanilla', 'tbc', 'wotlk'}
+    wotlk = stats['wotlk']
+    assert wotlk['longest'] == 5000
+    assert wotlk['last_start'] == int(at_noon(0))
+    assert wotlk['streaks'] == {'current': 3, 'best': 3}
+    assert wotlk['telemetry']['peak_rss'] == 1 << 29
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    week_start = (today - timedelta(days=today.weekday())).timestamp()
+    month_start = today.replace(day=1).timestamp()
+    assert wotlk['week'] == sum(duration for start, duration in sessions if start >= week_start)
+    assert wotlk['month'] == sum(duration for start, duration in sessions if start >= month_start)
+
+    assert stats['tbc'] == {'last_start': None, 'longest': 0, 'week': 0, 'month': 0,
+                            'streaks': {'current': 0, 'best': 0}, 'telemetry': None}
+
+
+def test_import_rows_are_excluded_from_live_stats(store):
+    store.import_totals({'times': {'vanilla': 7200}, 'last_used': {'vanilla': '2020-01-01 10:00:00'}}, {})
+    vanilla = store.get_version_stats()['vanilla']
+    assert vanilla['longest'] == 0
+    assert vanilla['streaks'] == {'current': 0, 'best': 0}
+    assert vanilla['last_start'] == int(datetime(2020, 1, 1, 10).timestamp())
@@ -1,17 +1,82 @@
-from .game_time_tracker import GameTimeTracker
+from .data_store import DataStore, get_default_store
+from .game_time_tracker import GameTimeTracker, format_duration
 from .settings_manager import SettingsManager
 from .stats_manager import StatsManager
-from .addon_manager import AddonManager
+from .addon_manager import AddonManager, addon_sort_key
+from .addon_index import AddonIndexer, parse_toc, get_addons_dir
+from .addon_installer import AddonInstaller, AddonArchiveError
+from .addon_deps import DependencyGraph
+from .addon_search import TrigramIndex
+from .saved_variables import SavedVariablesAnalyzer, format_size
+from .client_cache import ClientCacheManager, get_cache_dirs
+from .prefetch import DataPrefetcher, find_data_files
+from .launch_profiles import (LauncherPriority, apply_launch_profile, affinity_slice, parse_cpu_list, format_cpu_list,
+                              PRIORITY_LEVELS, IO_PRIORITY_LEVELS)
+from .config_wtf import PERFORMANCE_PROFILES, apply_config_values, get_config_path, read_config
 from .background_tracker import BackgroundTracker
+from .process_monitor import ProcessMonitor
+from .backend_loop import WakePipe
+from .launch_timeline import LaunchTimeline
+from .telemetry import TelemetrySampler, RingBuffer
+from .dir_watcher import DirectoryWatcher
 from .process_utils import is_wow_running
 from .language_manager import LanguageManager
+from .session_journal import SessionJournal
+from .session_store import SessionStore
+from .view_model import ViewModel
+from .image_cache import ImageCache
+from .startup_profiler import StartupProfiler
+from .single_instance import SingleInstance
+from .log_setup import setup_logging, shutdown_logging
 
 __all__ = [
+    'DataStore',
+    'get_default_store',
     'GameTimeTracker',
+    'format_duration',
     'SettingsManager',
     'StatsManager',
     'AddonManager',
+    'addon_sort_key',
+    'AddonIndexer',
+    'parse_toc',
+    'get_addons_dir',
+    'AddonInstaller',
+    'AddonArchiveError',
+    'DependencyGraph',
+    'TrigramIndex',
+    'SavedVariablesAnalyzer',
+    'format_size',
+    'ClientCacheManager',
+    'get_cache_dirs',
+    'DataPrefetcher',
+    'find_data_files',
+    'LauncherPriority',
+    'apply_launch_profile',
+    'affinity_slice',
+    'parse_cpu_list',
+    'format_cpu_list',
+    'PRIORITY_LEVELS',
+    'IO_PRIORITY_LEVELS',
+    'PERFORMANCE_PROFILES',
+    'apply_config_values',
+    'get_config_path',
+    'read_config',
     'BackgroundTracker',
+    'ProcessMonitor',
+    'WakePipe',
+    'LaunchTimeline',
+    'TelemetrySampler',
+    'RingBuffer',
+    'DirectoryWatcher',
     'is_wow_running',
-    'LanguageManager'
+    'LanguageManager',
+    'SessionJournal',
+    'SessionStore',
+    'ViewModel',
+    'ImageCache',
+    'StartupProfiler',
+    'SingleInstance',
+    'setup_logging',
+    'shutdown_logging'
 ] 
\ No newline at end of file
@@ -0,0 +1,283 @@
+import os
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from .persistence import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+ADDON_STATE_FILE = "AddOns.txt"
+# Fin de ligne des fichiers AddOns.txt créés par le launcher (format du client)
+DEFAULT_NEWLINE = '\r\n'
+
+
+class DependencyGraph:
+    """
+    Graphe des dépendances entre addons installés.
+
+    Les arcs proviennent des champs `Dependencies`/`RequiredDeps` des .toc
+    (les `OptionalDeps` ne sont pas bloquantes). Comme le client, les noms
+    sont comparés sans tenir compte de la casse. Les cycles sont d'abord
+    regroupés en composantes fortement connexes, puis la résolution est un
+    parcours topologique de ces composantes dont le résultat est mémorisé :
+    analyser tout le dossier ne visite chaque addon qu'une fois.
+
+    Attributes:
+        addons (dict): Addons indexés par nom de dossier
+    """
+
+    def __init__(self, addons: Dict[str, Dict]):
+        """
+        Construit le graphe.
+
+        Args:
+            addons (Dict[str, Dict]): Index des addons (voir AddonIndexer)
+        """
+        self.addons = addons
+        self._names = {name.lower(): name for name in addons}
+        self._requires = {
+            name: list(info.get('dependencies', []))
+            for name, info in addons.items()
+        }
+        self._memo: Dict[int, Dict] = {}
+        self._component: Optional[Dict[str, int]] = None
+        self._members: List[List[str]] = []
+        self._dependents: Optional[Dict[str, Set[str]]] = None
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Retourne le nom de dossier installé correspondant (casse du disque), ou None."""
+        return self._names.get(name.lower())
+
+    def resolve(self, name: str) -> Dict:
+        """
+        Résout les dépendances obligatoires d'un addon.
+
+        Args:
+            name (str): Nom de l'addon
+
+        Returns:
+            Dict: order (addon et dépendances dans l'ordre de chargement),
+                missing (dépendances absentes, directes ou indirectes) et
+                cycles (cycles rencontrés, chacun sous forme de liste)
+        """
+        key = name.lower()
+        if key not in self._names:
+            return {'order': [], 'missing': [name], 'cycles': []}
+        if self._component is None:
+            self._build_components()
+        result = self._resolve_component(self._component[key])
+        name = self._names[key]
+        # Dans un cycle, l'addon demandé est chargé après les autres membres
+        order = [item for item in result['order'] if item != name] + [name]
+        return {'order': order, 'missing': result['missing'], 'cycles': result['cycles']}
+
+    def _edges(self, key: str) -> List[str]:
+        """Dépendances installées d'un addon (noms en minuscules)."""
+        deps = (declared.lower() for declared in self._requires.get(self._names[key], []))
+        return [dep for dep in deps if dep in self._names]
+
+    def _build_components(self) -> None:
+        """
+        Regroupe les addons en composantes fortement connexes (algorithme de Tarjan).
+
+        Chaque cycle de dépendances forme une seule composante : la résolution
+        est mémorisée par composante, si bien qu'un cycle donne le même
+        résultat quel que soit l'addon par lequel on y entre.
+        """
+        self._component = {}
+        self._members = []
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+
+        def visit(key):
+            index[key] = low[key] = len(index)
+            stack.append(key)
+            on_stack.add(key)
+            for dep in self._edges(key):
+                if dep not in index:
+                    visit(dep)
+                    low[key] = min(low[key], low[dep])
+                elif dep in on_stack:
+                    low[key] = min(low[key], index[dep])
+            if low[key] == index[key]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    self._component[member] = len(self._members)
+                    members.append(member)
+                    if member == key:
+                        break
+                self._members.append(members)
+
+        for key in self._names:
+            if key not in index:
+                visit(key)
+
+    def _find_cycle(self, members: List[str]) -> Optional[List[str]]:
+        """Retourne un cycle passant par le premier membre d'une composante, ou None."""
+        start = members[0]
+        inside = set(members)
+        previous = {start: None}
+        pending = [start]
+        while pending:
+            key = pending.pop(0)
+            for dep in self._edges(key):
+                if dep == start:
+                    path = [key]
+                    while previous[path[-1]] is not None:
+                        path.append(previous[path[-1]])
+                    return [self._names[item] for item in reversed(path)] + [self._names[start]]
+                if dep in inside and dep not in previous:
+                    previous[dep] = key
+                    pending.append(dep)
+        return None
+
+    def _resolve_component(self, component: int) -> Dict:
+        if component in self._memo:
+            return self._memo[component]
+        members = self._members[component]
+        order: List[str] = []
+        missing: Set[str] = set()
+        cycles: List[List[str]] = []
+        for key in members:
+            for declared in self._requires.get(self._names[key], []):
+                dep = declared.lower()
+                if dep not in self._names:
+                    missing.add(declared)
+                    continue
+                dep_component = self._component[dep]
+                if dep_component == component:
+                    continue
+                result = self._resolve_component(dep_component)
+                order.extend(item for item in result['order'] if item not in order)
+                missing.update(result['missing'])
+                cycles.extend(cycle for cycle in result['cycles'] if cycle not in cycles)
+        cycle = self._find_cycle(members)
+        if cycle is not None:
+            cycles.append(cycle)
+        order.extend(self._names[key] for key in members)
+        result = {'order': order, 'missing': sorted(missing), 'cycles': cycles}
+        self._memo[component] = result
+        return result
+
+    def analyze(self) -> Dict:
+        """
+        Analyse tous les addons installés.
+
+        Returns:
+            Dict: missing (addon -> dépendances absentes) et cycles (liste des cycles distincts)
+        """
+        missing = {}
+        cycles = []
+        seen_cycles = set()
+        for name in self.addons:
+            result = self.resolve(name)
+            if result['missing']:
+                missing[name] = result['missing']
+            for cycle in result['cycles']:
+                key = frozenset(cycle)
+                if key not in seen_cycles:
+                    seen_cycles.add(key)
+                    cycles.append(cycle)
+        return {'missing': missing, 'cycles': cycles}
+
+    def dependents(self, names: Iterable[str]) -> Set[str]:
+        """
+        Retourne les addons qui dépendent, directement ou non, des addons donnés.
+
+        Args:
+            names (Iterable[str]): Noms des addons
+
+        Returns:
+            Set[str]: Noms des addons dépendants (hors addons donnés)
+        """
+        if self._dependents is None:
+            self._dependents = {}
+            for name, deps in self._requires.items():
+                for dep in deps:
+                    self._dependents.setdefault(dep.lower(), set()).add(name)
+        start = {name.lower() for name in names}
+        pending = list(start)
+        result = set()
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                key = dependent.lower()
+                if key not in start and dependent not in result:
+                    result.add(dependent)
+                    pending.append(key)
+        return result
+
+
+def find_addon_state_files(wtf_dir: str) -> List[str]:
+    """
+    Liste les fichiers AddOns.txt de tous les personnages.
+
+    Le chemin est `WTF/Account/<Compte>/<Royaume>/<Personnage>/AddOns.txt` ;
+    le fichier est inclus même s'il n'existe pas encore (personnage sans
+    réglage d'addons).
+
+    Args:
+        wtf_dir (str): Dossier WTF de l'installation
+
+    Returns:
+        List[str]: Chemins des fichiers AddOns.txt
+    """
+    def subdirs(path):
+        try:
+            with os.scandir(path) as entries:
+                return [entry for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
+    files = []
+    for account in subdirs(os.path.join(wtf_dir, 'Account')):
+        for realm in subdirs(account.path):
+            if realm.name.lower() == 'savedvariables':
+                continue
+            for character in subdirs(realm.path):
+                files.append(os.path.join(character.path, ADDON_STATE_FILE))
+    return sorted(files)
+
+
+def apply_addon_states(path: str, states: Dict[str, bool]) -> bool:
+    """
+    Applique des états activé/désactivé à un fichier AddOns.txt en une écriture.
+
+    Les lignes existantes (ordre, addons non concernés) sont conservées ;
+    le fichier n'est réécrit que si son contenu change.
+
+    Args:
+        path (str): Chemin du fichier AddOns.txt
+        states (Dict[str, bool]): Nom de l'addon -> True pour activer
+
+    Returns:
+        bool: True si le fichier a été réécrit
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = ''
+    newline = '\r\n' if '\r\n' in content else ('\n' if content else DEFAULT_NEWLINE)
+    lines = content.splitlines()
+    pending = {name.lower(): (name, enabled) for name, enabled in states.items()}
+    changed = False
+    for i, line in enumerate(lines):
+        name, sep, state = line.partition(':')
+        key = name.strip().lower()
+        if not sep or key not in pending:
+            continue
+        addon_name, enabled = pending.pop(key)
+        wanted = 'enabled' if enabled else 'disabled'
+        if state.strip().lower() != wanted:
+            lines[i] = f"{name.strip()}: {wanted}"
+            changed = True
+    for addon_name, enabled in pending.values():
+        lines.append(f"{addon_name}: {'enabled' if enabled else 'disabled'}")
+        changed = True
+    if changed:
+        atomic_write_text(path, newline.join(lines) + newline, newline='')
+    return changed
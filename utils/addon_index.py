@@ -0,0 +1,276 @@
+import os
+import re
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+
+from .persistence import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "addon_index.json"
+# Version du format du cache (un changement invalide toutes les entrées)
+CACHE_VERSION = 1
+# Nombre maximal de threads d'analyse des fichiers .toc
+DEFAULT_MAX_WORKERS = 8
+
+# Codes couleur WoW (|cffRRGGBB ... |r) présents dans certains titres
+_COLOR_CODE_RE = re.compile(r'\|c[0-9a-fA-F]{8}|\|r')
+
+
+class AddonInfo(TypedDict):
+    name: str
+    title: str
+    version: str
+    interface: str
+    notes: str
+    dependencies: List[str]
+    optional_deps: List[str]
+    saved_variables: List[str]
+    saved_variables_per_character: List[str]
+
+
+def get_addons_dir(game_path: str) -> str:
+    """
+    Retourne le dossier Interface/AddOns d'une installation.
+
+    Args:
+        game_path (str): Chemin de l'exécutable du jeu
+
+    Returns:
+        str: Chemin du dossier des addons
+    """
+    return os.path.join(os.path.dirname(game_path), 'Interface', 'AddOns')
+
+
+def _split_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_toc(toc_path: str, name: Optional[str] = None) -> AddonInfo:
+    """
+    Lit les métadonnées d'un fichier .toc.
+
+    Seules les lignes `## Clé: valeur` sont interprétées ; les clés
+    `Dependencies`, `RequiredDeps` et `Dep*` sont regroupées comme
+    dépendances obligatoires.
+
+    Args:
+        toc_path (str): Chemin du fichier .toc
+        name (Optional[str]): Nom du dossier de l'addon (déduit du fichier si None)
+
+    Returns:
+        AddonInfo: Métadonnées de l'addon
+    """
+    name = name or os.path.splitext(os.path.basename(toc_path))[0]
+    info: AddonInfo = {
+        'name': name,
+        'title': name,
+        'version': '',
+        'interface': '',
+        'notes': '',
+        'dependencies': [],
+        'optional_deps': [],
+        'saved_variables': [],
+        'saved_variables_per_character': []
+    }
+    with open(toc_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        for line in f:
+            if not line.startswith('##'):
+                continue
+            key, sep, value = line[2:].partition(':')
+            if not sep:
+                continue
+            key = key.strip().lower()
+            value = value.strip()
+            if key == 'title':
+                info['title'] = _COLOR_CODE_RE.sub('', value).strip() or name
+            elif key == 'version':
+                info['version'] = value
+            elif key == 'interface':
+                info['interface'] = value
+            elif key == 'notes':
+                info['notes'] = _COLOR_CODE_RE.sub('', value).strip()
+            elif key == 'optionaldeps':
+                info['optional_deps'].extend(_split_list(value))
+            elif key in ('dependencies', 'requireddeps') or key.startswith('dep'):
+                info['dependencies'].extend(_split_list(value))
+            elif key == 'savedvariables':
+                info['saved_variables'].extend(_split_list(value))
+            elif key == 'savedvariablespercharacter':
+                info['saved_variables_per_character'].extend(_split_list(value))
+    return info
+
+
+def _find_toc(folder_path: str, name: str) -> Optional[str]:
+    """Retourne le .toc portant le nom du dossier, en ignorant la casse si besoin."""
+    toc_path = os.path.join(folder_path, name + '.toc')
+    if os.path.isfile(toc_path):
+        return toc_path
+    expected = (name + '.toc').lower()
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.name.lower() == expected and entry.is_file():
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
+
+class AddonIndexer:
+    """
+    Index des addons installés, construit à partir des fichiers .toc.
+
+    Le dossier AddOns est parcouru avec `os.scandir` ; seuls les addons dont
+    le dossier ou le fichier .toc a changé depuis la dernière analyse (date
+    de modification et taille) sont relus, en parallèle. Les résultats sont
+    conservés dans `addon_index.json` pour être réutilisés au démarrage
+    suivant.
+
+    Attributes:
+        cache_file (str): Chemin du cache de l'index
+        max_workers (int): Nombre de threads d'analyse
+    """
+
+    def __init__(self, data_dir: str, cache_file: str = CACHE_FILE,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialise l'indexeur.
+
+        Args:
+            data_dir (str): Dossier des données
+            cache_file (str): Nom du fichier de cache
+            max_workers (int): Nombre maximal de threads d'analyse
+        """
+        self.cache_file = os.path.join(data_dir, cache_file)
+        self.max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        self._lock = threading.Lock()
+        self._cache = None
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                if stored.get('version') == CACHE_VERSION:
+                    self._cache = stored.get('dirs', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        try:
+            atomic_write_json(self.cache_file, {'version': CACHE_VERSION, 'dirs': self._cache})
+        except OSError as e:
+            logger.warning(f"Impossible d'écrire le cache de l'index des addons: {e}")
+
+    @staticmethod
+    def _stamp(folder_path: str, name: str) -> Optional[Tuple[str, List[int]]]:
+        """Retourne le .toc d'un dossier et son empreinte (mtime du dossier, mtime et taille du .toc)."""
+        toc_path = _find_toc(folder_path, name)
+        if toc_path is None:
+            return None
+        try:
+            dir_stat = os.stat(folder_path)
+            toc_stat = os.stat(toc_path)
+        except OSError:
+            return None
+        return toc_path, [dir_stat.st_mtime_ns, toc_stat.st_mtime_ns, toc_stat.st_size]
+
+    def _parse_all(self, to_parse: List[Tuple[str, str, List[int]]]) -> Dict[str, Dict]:
+        """Analyse les .toc en parallèle et retourne les nouvelles entrées du cache."""
+        entries = {}
+        if not to_parse:
+            return entries
+        workers = min(self.max_workers, len(to_parse))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AddonIndexer") as pool:
+            results = pool.map(lambda item: self._parse(item[0], item[1]), to_parse)
+            for (name, _, stamp), info in zip(to_parse, results):
+                if info is not None:
+                    entries[name] = {'stamp': stamp, 'info': info}
+        return entries
+
+    def scan(self, addons_dir: str) -> Dict[str, AddonInfo]:
+        """
+        Indexe un dossier AddOns.
+
+        Args:
+            addons_dir (str): Chemin du dossier Interface/AddOns
+
+        Returns:
+            Dict[str, AddonInfo]: Addons indexés par nom de dossier
+        """
+        key = os.path.normcase(os.path.abspath(addons_dir))
+        with self._lock:
+            cached = self._load_cache().get(key, {})
+            entries = {}
+            to_parse = []
+            try:
+                with os.scandir(addons_dir) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            continue
+                        stamped = self._stamp(entry.path, entry.name)
+                        if stamped is None:
+                            continue
+                        toc_path, stamp = stamped
+                        previous = cached.get(entry.name)
+                        if previous and previous.get('stamp') == stamp:
+                            entries[entry.name] = previous
+                        else:
+                            to_parse.append((entry.name, toc_path, stamp))
+            except FileNotFoundError:
+                logger.info(f"Dossier d'addons introuvable: {addons_dir}")
+            except OSError as e:
+                logger.error(f"Erreur lors du parcours de {addons_dir}: {e}")
+
+            entries.update(self._parse_all(to_parse))
+            if to_parse or len(entries) != len(cached):
+                self._cache[key] = entries
+                self._save_cache()
+            logger.info(f"Index des addons de {addons_dir}: {len(entries)} addons, {len(to_parse)} relus")
+            return {name: entry['info'] for name, entry in entries.items()}
+
+    def update(self, addons_dir: str, names: Iterable[str]) -> Tuple[Dict[str, AddonInfo], List[str]]:
+        """
+        Met à jour l'index pour quelques dossiers d'addons seulement.
+
+        Args:
+            addons_dir (str): Chemin du dossier Interface/AddOns
+            names (Iterable[str]): Noms des dossiers modifiés
+
+        Returns:
+            Tuple[Dict[str, AddonInfo], List[str]]: Addons ajoutés ou modifiés, noms des addons supprimés
+        """
+        key = os.path.normcase(os.path.abspath(addons_dir))
+        with self._lock:
+            cached = self._load_cache().setdefault(key, {})
+            to_parse = []
+            removed = []
+            for name in names:
+                stamped = self._stamp(os.path.join(addons_dir, name), name)
+                if stamped is None:
+                    if cached.pop(name, None) is not None:
+                        removed.append(name)
+                    continue
+                toc_path, stamp = stamped
+                previous = cached.get(name)
+                if not previous or previous.get('stamp') != stamp:
+                    to_parse.append((name, toc_path, stamp))
+            parsed = self._parse_all(to_parse)
+            cached.update(parsed)
+            if parsed or removed:
+                self._save_cache()
+            return {name: entry['info'] for name, entry in parsed.items()}, removed
+
+    @staticmethod
+    def _parse(name: str, toc_path: str) -> Optional[AddonInfo]:
+        try:
+            return parse_toc(toc_path, name)
+        except OSError as e:
+            logger.warning(f"Lecture impossible de {toc_path}: {e}")
+            return None
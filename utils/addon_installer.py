@@ -0,0 +1,186 @@
+import os
+import shutil
+import logging
+import posixpath
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Nombre d'archives décompressées en parallèle (zlib libère le GIL)
+DEFAULT_MAX_WORKERS = 4
+# Taille des blocs copiés depuis l'archive (octets)
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class AddonArchiveError(Exception):
+    """Archive d'addon invalide ou dangereuse."""
+
+
+def _safe_member_path(name: str) -> Optional[str]:
+    """Normalise le chemin d'une entrée et rejette les chemins sortant du dossier cible."""
+    path = posixpath.normpath(name.replace('\\', '/'))
+    if path in ('.', '') or path.startswith('/') or path.split('/')[0] == '..' or ':' in path.split('/')[0]:
+        return None
+    return path
+
+
+def find_addon_roots(names: Iterable[str]) -> Dict[str, str]:
+    """
+    Détecte les dossiers d'addons d'une archive à partir de leurs fichiers .toc.
+
+    Un dossier est un addon s'il contient un .toc portant son nom
+    (`Addon/Addon.toc`), éventuellement sous un dossier d'emballage
+    (`Pack-1.0/Addon/Addon.toc`). Les bibliothèques embarquées dans un addon
+    ne sont pas retenues séparément.
+
+    Args:
+        names (Iterable[str]): Noms des entrées de l'archive
+
+    Returns:
+        Dict[str, str]: Préfixe dans l'archive -> nom du dossier d'addon
+    """
+    candidates = {}
+    for name in names:
+        path = _safe_member_path(name)
+        if path is None or not path.lower().endswith('.toc'):
+            continue
+        prefix, toc_name = posixpath.split(path)
+        folder = posixpath.basename(prefix) if prefix else toc_name[:-4]
+        if toc_name[:-4].lower() == folder.lower():
+            candidates[prefix] = folder
+
+    roots = {}
+    for prefix in sorted(candidates, key=len):
+        if not any(root == '' or prefix.startswith(root + '/') for root in roots):
+            roots[prefix] = candidates[prefix]
+    return roots
+
+
+def _extract_archive(archive_path: str, staging_dir: str) -> List[str]:
+    """Décompresse en flux les dossiers d'addons d'une archive dans `staging_dir`."""
+    with zipfile.ZipFile(archive_path) as zf:
+        members = zf.infolist()
+        roots = find_addon_roots(member.filename for member in members)
+        if not roots:
+            raise AddonArchiveError(f"Aucun addon (.toc) trouvé dans {os.path.basename(archive_path)}")
+        # Les préfixes les plus longs d'abord pour rattacher chaque entrée au bon addon
+        ordered_roots = sorted(roots.items(), key=lambda item: len(item[0]), reverse=True)
+        for member in members:
+            path = _safe_member_path(member.filename)
+            if path is None:
+                raise AddonArchiveError(f"Chemin interdit dans l'archive: {member.filename}")
+            for prefix, folder in ordered_roots:
+                if not prefix or path == prefix or path.startswith(prefix + '/'):
+                    relative = path[len(prefix):].lstrip('/')
+                    break
+            else:
+                continue
+            target = os.path.join(staging_dir, folder, *relative.split('/'))
+            if member.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zf.open(member) as source, open(target, 'wb') as destination:
+                shutil.copyfileobj(source, destination, COPY_CHUNK_SIZE)
+    return sorted(set(roots.values()))
+
+
+class AddonInstaller:
+    """
+    Installe des addons depuis des archives .zip.
+
+    Les archives sont décompressées en flux (aucune n'est chargée entièrement
+    en mémoire) et en parallèle dans un dossier temporaire placé à côté de
+    `Interface/AddOns`, sur le même système de fichiers. Chaque dossier
+    d'addon n'est mis en place qu'une fois complet, par renommage : le jeu
+    ne voit jamais un addon à moitié copié, et l'ancienne version n'est
+    supprimée qu'après le remplacement.
+
+    Attributes:
+        max_workers (int): Nombre d'archives traitées simultanément
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialise l'installateur.
+
+        Args:
+            max_workers (int): Nombre maximal d'archives décompressées en parallèle
+        """
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+
+    def install(self, archives: List[str], addons_dir: str,
+                progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Installe les addons contenus dans une ou plusieurs archives.
+
+        Args:
+            archives (List[str]): Chemins des archives .zip
+            addons_dir (str): Dossier Interface/AddOns de destination
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (archives traitées, total)
+
+        Returns:
+            Dict: installed (noms des addons installés) et errors (archive -> message)
+        """
+        os.makedirs(addons_dir, exist_ok=True)
+        staging_root = tempfile.mkdtemp(prefix='.addon_staging-', dir=os.path.dirname(os.path.abspath(addons_dir)))
+        errors = {}
+        extracted: List[Tuple[int, str, List[str]]] = []
+        try:
+            workers = min(self.max_workers, len(archives)) or 1
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AddonInstaller") as pool:
+                futures = {
+                    pool.submit(_extract_archive, archive, os.path.join(staging_root, str(index))): (index, archive)
+                    for index, archive in enumerate(archives)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    index, archive = futures[future]
+                    try:
+                        extracted.append((index, archive, future.result()))
+                    except (OSError, zipfile.BadZipFile, AddonArchiveError) as e:
+                        logger.error(f"Échec de l'extraction de {archive}: {e}")
+                        errors[archive] = str(e)
+                    if progress:
+                        progress(done, len(archives))
+
+            # En cas de doublon, l'archive sélectionnée en dernier l'emporte
+            sources = {}
+            for index, archive, folders in sorted(extracted):
+                for folder in folders:
+                    if folder in sources:
+                        logger.warning(f"Addon {folder} présent dans plusieurs archives, {archive} retenue")
+                    sources[folder] = os.path.join(staging_root, str(index), folder)
+
+            installed = []
+            with self._lock:
+                for folder, source in sorted(sources.items()):
+                    try:
+                        self._swap_in(source, os.path.join(addons_dir, folder), staging_root)
+                        installed.append(folder)
+                    except OSError as e:
+                        logger.error(f"Impossible d'installer {folder}: {e}")
+                        errors[folder] = str(e)
+            logger.info(f"{len(installed)} addons installés dans {addons_dir}")
+            return {'installed': installed, 'errors': errors}
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+
+    @staticmethod
+    def _swap_in(source: str, destination: str, staging_root: str) -> None:
+        """Remplace `destination` par `source` en deux renommages, avec retour arrière."""
+        backup = None
+        if os.path.exists(destination):
+            backup = tempfile.mkdtemp(prefix='old-', dir=staging_root)
+            backup = os.path.join(backup, os.path.basename(destination))
+            os.replace(destination, backup)
+        try:
+            os.replace(source, destination)
+        except OSError:
+            if backup is not None:
+                os.replace(backup, destination)
+            raise
@@ -1,30 +1,212 @@
 import os
-import json
+import logging
+import threading
+from datetime import datetime
+from .data_store import get_default_store
+from .addon_index import AddonIndexer, get_addons_dir
+from .addon_installer import AddonInstaller
+from .addon_deps import DependencyGraph, apply_addon_states, find_addon_state_files
+from .addon_search import TrigramIndex
+from .saved_variables import SavedVariablesAnalyzer
+
+logger = logging.getLogger(__name__)
 
 class AddonManager:
-    def __init__(self):
-        self.data_dir = "data"
-        self.addon_file = os.path.join(self.data_dir, "addons.json")
-        self.addons = self._load_addons()
-
-    def _load_addons(self):
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-        
-        if os.path.exists(self.addon_file):
-            try:
-                with open(self.addon_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                return {'vanilla': [], 'tbc': [], 'wotlk': []}
-        return {'vanilla': [], 'tbc': [], 'wotlk': []}
+    def __init__(self, store=None, indexer=None, watcher=None, installer=None):
+        self.store = store or get_default_store()
+        self.addons = self.store.section('addons')
+        self.indexer = indexer or AddonIndexer(self.store.data_dir)
+        self.watcher = watcher
+        self.installer = installer or AddonInstaller()
+        self.index = {}
+        self.search_index = TrigramIndex()
+        self._graphs = {}
+        self._game_paths = {}
+        self._listeners = []
+        self._index_lock = threading.Lock()
+        if self.watcher is not None:
+            self.watcher.add_listener(self._on_directory_changes)
 
     def _save_addons(self):
         try:
-            with open(self.addon_file, 'w') as f:
-                json.dump(self.addons, f, indent=4)
+            self.store.mark_dirty('addons')
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des addons: {e}")
 
+    def add_listener(self, callback):
+        """
+        Ajoute un écouteur des modifications, appelé dans le thread du surveillant.
+
+        L'événement est un dictionnaire : type ('addons'), version, changed
+        (addons ajoutés ou modifiés) et removed (noms supprimés).
+        """
+        self._listeners.append(callback)
+
+    def _emit(self, event):
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Erreur dans un écouteur du gestionnaire d'addons: {e}")
+
+    def refresh(self, version, game_path):
+        """Réindexe les addons d'une version (seuls les addons modifiés sont relus)."""
+        with self._index_lock:
+            if self.watcher is not None and self._game_paths.get(version) == game_path:
+                # Index tenu à jour par les événements du surveillant
+                return dict(self.index[version])
+        addons = self.indexer.scan(get_addons_dir(game_path))
+        with self._index_lock:
+            removed = [name for name in self.index.get(version, {}) if name not in addons]
+            self.index[version] = addons
+            self._graphs.pop(version, None)
+            self._update_search_index(version, addons, removed)
+            self._game_paths[version] = game_path
+        if self.watcher is not None:
+            self.watcher.watch(('addons', version), get_addons_dir(game_path), depth=1)
+        return dict(addons)
+
+    def _on_directory_changes(self, tag, paths):
+        """Applique un lot de modifications du surveillant de dossiers."""
+        kind, version = tag
+        game_path = self._game_paths.get(version)
+        if game_path is None:
+            return
+        addons_dir = get_addons_dir(game_path)
+        names = set()
+        for path in paths:
+            relative = os.path.relpath(path, addons_dir)
+            if relative == os.curdir:
+                names = None
+                break
+            names.add(relative.split(os.sep)[0])
+
+        if names is None:
+            # Événements perdus ou racine modifiée : relecture complète (cache compris)
+            addons = self.indexer.scan(addons_dir)
+            with self._index_lock:
+                removed = [name for name in self.index.get(version, {}) if name not in addons]
+                self.index[version] = addons
+                self._graphs.pop(version, None)
+                self._update_search_index(version, addons, removed)
+            changed = addons
+        else:
+            changed, removed = self.indexer.update(addons_dir, names)
+            with self._index_lock:
+                index = self.index.setdefault(version, {})
+                for name in removed:
+                    index.pop(name, None)
+                index.update(changed)
+                if changed or removed:
+                    self._graphs.pop(version, None)
+                    self._update_search_index(version, changed, removed)
+        if changed or removed:
+            logger.info(f"Addons {version}: {len(changed)} modifiés, {len(removed)} supprimés")
+            self._emit({'type': 'addons', 'version': version, 'changed': changed, 'removed': removed})
+
+    def _update_search_index(self, version, changed, removed):
+        """Met à jour l'index de recherche pour les seuls addons modifiés (sous _index_lock)."""
+        for name in removed:
+            self.search_index.remove((version, name))
+        for name, addon in changed.items():
+            self.search_index.add((version, name), (name, addon['title'], addon['notes']))
+
+    def search(self, query, version=None):
+        """
+        Recherche les addons dont le nom, le titre ou les notes contiennent la requête.
+
+        Returns:
+            dict: Version -> ensemble des noms d'addons trouvés
+        """
+        with self._index_lock:
+            candidates = None
+            if version is not None:
+                candidates = {(version, name) for name in self.index.get(version, {})}
+            matches = self.search_index.search(query, candidates)
+        result = {}
+        for match_version, name in matches:
+            result.setdefault(match_version, set()).add(name)
+        return result
+
+    def install(self, game_path, archives, progress=None):
+        """Installe des archives .zip d'addons (l'index suit via le surveillant ou le prochain refresh)."""
+        return self.installer.install(list(archives), get_addons_dir(game_path), progress)
+
+    def get_dependency_graph(self, version):
+        """Retourne le graphe des dépendances de la version, reconstruit seulement si l'index a changé."""
+        with self._index_lock:
+            graph = self._graphs.get(version)
+            if graph is None:
+                graph = DependencyGraph(dict(self.index.get(version, {})))
+                self._graphs[version] = graph
+            return graph
+
+    def set_enabled(self, version, game_path, names, enabled):
+        """
+        Active ou désactive des addons pour tous les personnages d'une version.
+
+        Activer un addon active aussi ses dépendances obligatoires ; désactiver
+        une bibliothèque désactive aussi les addons qui en dépendent. Chaque
+        AddOns.txt est lu et réécrit une seule fois pour l'ensemble des addons.
+        """
+        graph = self.get_dependency_graph(version)
+        missing = set()
+        cycles = []
+        if enabled:
+            targets = []
+            for name in names:
+                result = graph.resolve(name)
+                targets.extend(addon for addon in result['order'] if addon not in targets)
+                missing.update(result['missing'])
+                cycles.extend(result['cycles'])
+        else:
+            targets = [graph.canonical(name) or name for name in names]
+            targets.extend(sorted(graph.dependents(names)))
+        states = {name: enabled for name in targets}
+        files = find_addon_state_files(os.path.join(os.path.dirname(game_path), 'WTF'))
+        written = 0
+        for path in files:
+            try:
+                if apply_addon_states(path, states):
+                    written += 1
+            except OSError as e:
+                logger.error(f"Impossible de modifier {path}: {e}")
+        logger.info(f"{len(states)} addons {'activés' if enabled else 'désactivés'} "
+                    f"pour {len(files)} personnages ({written} fichiers modifiés)")
+        return {'addons': targets, 'characters': len(files), 'written': written,
+                'missing': sorted(missing), 'cycles': cycles}
+
+    def analyze_saved_variables(self, version, game_path, archive_orphans=False, progress=None):
+        """
+        Analyse les SavedVariables d'une version en une passe sur le dossier WTF.
+
+        Avec archive_orphans, les fichiers des addons désinstallés sont
+        compressés dans `SavedVariables-<version>-<date>.zip` à côté du dossier
+        WTF puis supprimés, pendant la même lecture.
+        """
+        installed = self.refresh(version, game_path)
+        game_dir = os.path.dirname(game_path)
+        archive_path = None
+        if archive_orphans:
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            archive_path = os.path.join(game_dir, f"SavedVariables-{version}-{stamp}.zip")
+        analyzer = SavedVariablesAnalyzer(os.path.join(game_dir, 'WTF'))
+        report = analyzer.analyze(installed, archive_path=archive_path, trim=archive_orphans, progress=progress)
+        report['archive_path'] = archive_path if report['archived'] else None
+        return report
+
     def get_addons(self, version):
-        return self.addons.get(version, []) 
\ No newline at end of file
+        """Retourne les addons indexés d'une version, triés par titre."""
+        with self._index_lock:
+            addons = list(self.index.get(version, {}).values())
+        return sorted(addons, key=addon_sort_key)
+
+    def close(self):
+        """Arrête la surveillance des dossiers."""
+        if self.watcher is not None:
+            self.watcher.stop()
+
+
+def addon_sort_key(addon):
+    """Clé de tri d'un addon dans les listes (titre puis nom de dossier)."""
+    return (addon['title'].lower(), addon['name'])
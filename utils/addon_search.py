@@ -0,0 +1,106 @@
+import unicodedata
+from typing import Dict, Hashable, Iterable, Optional, Set
+
+# Séparateur entre champs : aucun trigramme de requête ne peut le contenir
+_FIELD_SEPARATOR = '\x00'
+
+
+def normalize(text: str) -> str:
+    """Met le texte en minuscules et retire les accents pour la recherche."""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def trigrams(text: str) -> Set[str]:
+    """Retourne l'ensemble des trigrammes d'un texte normalisé."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Index de recherche plein texte par trigrammes.
+
+    Chaque document est découpé en trigrammes ; une requête intersecte les
+    listes de documents de ses trigrammes, en commençant par la plus courte,
+    puis vérifie la présence réelle de la sous-chaîne. Ajouter, remplacer ou
+    retirer un document ne touche que ses propres trigrammes. Les requêtes
+    de moins de trois caractères parcourent directement les textes.
+
+    Attributes:
+        documents (dict): Identifiant -> texte normalisé
+    """
+
+    def __init__(self):
+        self.documents: Dict[Hashable, str] = {}
+        self._postings: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, doc_id: Hashable, fields: Iterable[str]) -> None:
+        """
+        Ajoute ou remplace un document.
+
+        Args:
+            doc_id (Hashable): Identifiant du document
+            fields (Iterable[str]): Textes indexés (nom, titre, notes...)
+        """
+        text = _FIELD_SEPARATOR.join(normalize(field) for field in fields if field)
+        if self.documents.get(doc_id) == text:
+            return
+        self.remove(doc_id)
+        self.documents[doc_id] = text
+        for gram in trigrams(text):
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: Hashable) -> None:
+        """
+        Retire un document de l'index.
+
+        Args:
+            doc_id (Hashable): Identifiant du document
+        """
+        text = self.documents.pop(doc_id, None)
+        if text is None:
+            return
+        for gram in trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str, candidates: Optional[Set[Hashable]] = None) -> Set[Hashable]:
+        """
+        Recherche les documents contenant tous les mots de la requête.
+
+        Args:
+            query (str): Texte recherché (mots séparés par des espaces)
+            candidates (Optional[Set[Hashable]]): Restreint la recherche à ces documents
+
+        Returns:
+            Set[Hashable]: Identifiants des documents trouvés
+        """
+        words = normalize(query).split()
+        if not words:
+            return set(self.documents if candidates is None else candidates)
+        result = None if candidates is None else set(candidates)
+        for word in words:
+            grams = trigrams(word)
+            if grams:
+                postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+                matches = set(postings[0])
+                if result is not None:
+                    matches &= result
+                for posting in postings[1:]:
+                    if not matches:
+                        break
+                    matches &= posting
+                # Les trigrammes ne garantissent pas leur ordre : vérification finale
+                result = {doc_id for doc_id in matches if word in self.documents[doc_id]}
+            else:
+                pool = self.documents if result is None else result
+                result = {doc_id for doc_id in pool if word in self.documents[doc_id]}
+            if not result:
+                break
+        return result
@@ -0,0 +1,180 @@
+import os
+import logging
+import selectors
+import threading
+import collections
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Erreurs consécutives du mécanisme d'attente avant l'arrêt du thread
+MAX_CONSECUTIVE_ERRORS = 3
+
+
+class WakePipe:
+    """Tube de réveil, enregistré dans un sélecteur s'il est fourni (donnée associée : None)."""
+
+    def __init__(self, selector=None):
+        self._read, self._write = os.pipe()
+        os.set_blocking(self._read, False)
+        os.set_blocking(self._write, False)
+        if selector is not None:
+            selector.register(self._read, selectors.EVENT_READ, None)
+
+    def fileno(self) -> int:
+        """Retourne le descripteur à surveiller en lecture."""
+        return self._read
+
+    def wake(self) -> None:
+        try:
+            os.write(self._write, b'\0')
+        except BlockingIOError:
+            pass
+
+    def drain(self) -> None:
+        try:
+            while os.read(self._read, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self._read)
+        os.close(self._write)
+
+
+class BackendLoop(ABC):
+    """
+    Thread unique bloqué dans un mécanisme d'attente du système et piloté par une file de commandes.
+
+    Les appels publics (watch, unwatch...) déposent une commande puis
+    réveillent le mécanisme d'attente ; seul le thread de la boucle touche
+    au mécanisme. En cas d'erreur, le mécanisme est recréé et les
+    surveillances en cours y sont réinscrites ; après MAX_CONSECUTIVE_ERRORS
+    erreurs consécutives, le thread s'arrête en remettant ses surveillances
+    dans la file, et le prochain `start()` les reprend.
+
+    Les sous-classes implémentent les méthodes abstraites (_create_backend,
+    _handle_command, _active_commands, _iterate) et peuvent redéfinir _on_exit.
+    """
+
+    thread_name = "BackendLoop"
+
+    def __init__(self):
+        self._commands = collections.deque()
+        self._lock = threading.Lock()
+        self._backend = None
+        self._thread = None
+        self._running = False
+
+    @abstractmethod
+    def _create_backend(self):
+        """Crée le mécanisme d'attente (add, remove, wake, wait, close)."""
+
+    @abstractmethod
+    def _handle_command(self, command: Tuple) -> None:
+        """Applique une commande dans le thread de la boucle."""
+
+    @abstractmethod
+    def _active_commands(self) -> List[Tuple]:
+        """Retourne les commandes recréant les surveillances en cours."""
+
+    @abstractmethod
+    def _iterate(self) -> None:
+        """Effectue une attente puis traite ses résultats."""
+
+    def _on_exit(self) -> None:
+        """Nettoie l'état propre au thread à sa sortie."""
+
+    def start(self) -> None:
+        """Démarre le thread de la boucle."""
+        with self._lock:
+            if self._running:
+                return
+            self._backend = self._create_backend()
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._thread.start()
+        logger.info(f"{self.thread_name} démarré (mécanisme: {self._backend.name})")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Arrête le thread de la boucle.
+
+        Args:
+            timeout (float): Délai d'attente maximal du thread
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            backend = self._backend
+        backend.wake()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        with self._lock:
+            self._thread = None
+            self._backend = None
+            self._commands.clear()
+        logger.info(f"{self.thread_name} arrêté")
+
+    def _send(self, command: Tuple, start: bool = True) -> None:
+        """Dépose une commande et réveille la boucle (démarrée au besoin)."""
+        if start:
+            self.start()
+        with self._lock:
+            self._commands.append(command)
+            backend = self._backend
+        if backend is not None:
+            backend.wake()
+
+    def _apply_commands(self) -> None:
+        while True:
+            with self._lock:
+                if not self._commands:
+                    return
+                command = self._commands.popleft()
+            self._handle_command(command)
+
+    def _run(self) -> None:
+        errors = 0
+        try:
+            while self._running:
+                try:
+                    self._iterate()
+                    errors = 0
+                except Exception as e:
+                    errors += 1
+                    logger.error(f"Erreur dans {self.thread_name}: {e}")
+                    if errors >= MAX_CONSECUTIVE_ERRORS:
+                        break
+                    self._reset_backend()
+        finally:
+            with self._lock:
+                backend = self._backend
+                if self._running:
+                    # Arrêt sur erreur : les surveillances seront reprises par le prochain start()
+                    self._commands.extendleft(reversed(self._active_commands()))
+                    self._running = False
+                    self._backend = None
+                    self._thread = None
+            self._on_exit()
+            try:
+                if backend is not None:
+                    backend.close()
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture de {self.thread_name}: {e}")
+
+    def _reset_backend(self) -> None:
+        """Remplace le mécanisme d'attente défaillant et y réinscrit les surveillances en cours."""
+        with self._lock:
+            old_backend = self._backend
+            self._backend = self._create_backend()
+        try:
+            old_backend.close()
+        except Exception as e:
+            logger.debug(f"Fermeture de l'ancien mécanisme d'attente impossible: {e}")
+        for command in self._active_commands():
+            self._handle_command(command)
@@ -1,155 +1,216 @@
-import threading
 import time
-import psutil
+import threading
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from .process_monitor import ProcessMonitor
+
+logger = logging.getLogger(__name__)
 
 class BackgroundTracker:
-    def __init__(self, game_tracker):
+    """
+    Suit le temps de jeu des clients lancés, indexés par PID.
+
+    Plusieurs clients d'une même version forment un groupe : le temps de jeu
+    de la version (game_tracker, journal, historique) est la réunion des
+    durées de vie des clients du groupe, tandis que chaque client garde son
+    propre temps. Tous les processus sont surveillés par l'unique thread du
+    ProcessMonitor, quel que soit leur nombre.
+    """
+
+    def __init__(self, game_tracker, journal=None, session_store=None, monitor=None):
         self.game_tracker = game_tracker
-        self.tracking_threads = {}
+        self.journal = journal
+        self.session_store = session_store
+        # Un seul moniteur pour tous les processus suivis (pas de thread par client)
+        self.monitor = monitor or ProcessMonitor()
+        self.monitor.add_listener(self._on_process_event)
+        # Clients suivis, indexés par PID
+        self.tracking_sessions = {}
+        # Groupes de clients, indexés par version
+        self.groups = {}
         self.lock = threading.Lock()
-        logging.info("BackgroundTracker initialisé")
+        logger.info("BackgroundTracker initialisé")
 
     def start_tracking(self, version, process):
         try:
-            # Arrêter le suivi existant si nécessaire
-            self.stop_tracking(version)
-            
-            # Créer un nouvel événement d'arrêt pour ce thread
-            stop_event = threading.Event()
-            
-            thread = threading.Thread(
-                target=self._monitor_game_process,
-                args=(version, process, stop_event),
-                daemon=True
-            )
-            
+            # Arrêter un suivi existant du même PID si nécessaire
+            self.stop_tracking(process.pid)
+
+            now = time.monotonic()
             with self.lock:
-                self.tracking_threads[version] = {
-                    'thread': thread,
+                group = self.groups.get(version)
+                if group is None:
+                    group = {
+                        'start_time': datetime.now(),
+                        'accumulated_time': 0,
+                        'pending_time': 0.0,
+                        'credited_until': now,
+                        'session_id': None,
+                        'pids': set()
+                    }
+                    self.groups[version] = group
+                    new_group = True
+                else:
+                    new_group = False
+                group['pids'].add(process.pid)
+                self.tracking_sessions[process.pid] = {
+                    'version': version,
+                    'pid': process.pid,
                     'start_time': datetime.now(),
-                    'last_update': datetime.now(),
+                    'start_monotonic': now,
                     'process': process,
-                    'accumulated_time': 0,
-                    'stop_event': stop_event
+                    'elapsed': 0.0
                 }
-            
-            thread.start()
-            logging.info(f"Démarrage du suivi pour {version}")
-            
+
+            if new_group and self.journal:
+                # Ouvrir la session dans le journal pour survivre à un crash
+                group['session_id'] = self.journal.start_session(version, process.pid,
+                                                                 self.game_tracker.get_time(version))
+
+            self.monitor.watch(process.pid, tag=version, process=process)
+            logger.info(f"Démarrage du suivi pour {version} (PID: {process.pid}, "
+                        f"{len(group['pids'])} client(s))")
+
         except Exception as e:
-            logging.error(f"Erreur lors du démarrage du suivi pour {version}: {e}")
+            logger.error(f"Erreur lors du démarrage du suivi pour {version}: {e}")
 
-    def stop_tracking(self, version):
+    def stop_tracking(self, pid):
         try:
-            thread_info = None
             with self.lock:
-                if version in self.tracking_threads:
-                    thread_info = self.tracking_threads[version]
-            
-            if thread_info:
-                # Signaler l'arrêt au thread
-                thread_info['stop_event'].set()
-                
-                # Attendre la fin du thread avec un timeout
-                thread_info['thread'].join(timeout=2)
-                
+                session_info = self.tracking_sessions.pop(pid, None)
+                if not session_info:
+                    return
+                version = session_info['version']
+                group = self._leave_group(version, pid)
+
+            self.monitor.unwatch(pid)
+            if group:
                 # Sauvegarder le temps final
-                self._save_final_time(version, thread_info)
-                
-                # Supprimer les informations du thread
-                with self.lock:
-                    if version in self.tracking_threads:
-                        del self.tracking_threads[version]
-                
-                logging.info(f"Arrêt du suivi pour {version}")
-                
+                self._save_final_time(version, group)
+            logger.info(f"Arrêt du suivi pour {version} (PID: {pid})")
+
         except Exception as e:
-            logging.error(f"Erreur lors de l'arrêt du suivi pour {version}: {e}")
+            logger.error(f"Erreur lors de l'arrêt du suivi du PID {pid}: {e}")
+
+    def _leave_group(self, version, pid):
+        """Retire un client de son groupe ; retourne le groupe s'il est désormais vide (sous self.lock)."""
+        group = self.groups.get(version)
+        if group is None:
+            return None
+        group['pids'].discard(pid)
+        if group['pids']:
+            return None
+        del self.groups[version]
+        return group
 
-    def _save_final_time(self, version, thread_info):
+    def _save_final_time(self, version, session_info):
         try:
             # Lors de la fermeture, on ne sauvegarde que le temps déjà accumulé
-            # sans ajouter le temps écoulé depuis la dernière mise à jour
-            if thread_info['accumulated_time'] > 0:
-                logging.info(f"Temps final sauvegardé pour {version}: {thread_info['accumulated_time']} secondes")
+            # sans ajouter le temps écoulé depuis la dernière mise à jour.
+            # La session n'est close qu'une seule fois dans le journal et l'historique.
+            with self.lock:
+                close_session = not session_info.get('closed')
+                session_info['closed'] = True
+            if not close_session:
+                return
+            if self.journal and session_info.get('session_id'):
+                self.journal.stop_session(session_info['session_id'], session_info['accumulated_time'])
+            if self.session_store and session_info['accumulated_time'] > 0:
+                self.session_store.record_session(version, session_info['start_time'].timestamp(),
+                                                  session_info['accumulated_time'])
+            if session_info['accumulated_time'] > 0:
+                logger.info(f"Temps final sauvegardé pour {version}: {session_info['accumulated_time']} secondes")
         except Exception as e:
-            logging.error(f"Erreur lors de la sauvegarde finale du temps pour {version}: {e}")
+            logger.error(f"Erreur lors de la sauvegarde finale du temps pour {version}: {e}")
 
     def stop(self):
         try:
-            # Copier la liste des versions pour éviter les modifications pendant l'itération
-            versions = list(self.tracking_threads.keys())
-            
-            # Arrêter chaque thread individuellement
-            for version in versions:
-                self.stop_tracking(version)
-                
-            logging.info("Arrêt de tous les suivis")
+            # Créditer le temps écoulé depuis le dernier battement avant l'arrêt
+            now = time.monotonic()
+            with self.lock:
+                for version, group in self.groups.items():
+                    self._credit_group(version, group, now)
+                pids = list(self.tracking_sessions.keys())
+
+            # Arrêter chaque suivi individuellement
+            for pid in pids:
+                self.stop_tracking(pid)
+
+            self.monitor.stop()
+            logger.info("Arrêt de tous les suivis")
         except Exception as e:
-            logging.error(f"Erreur lors de l'arrêt général: {e}")
+            logger.error(f"Erreur lors de l'arrêt général: {e}")
+
+    def get_clients(self, version=None):
+        """
+        Retourne les clients suivis et leur temps de jeu.
+
+        Args:
+            version (Optional[str]): Restreint aux clients de cette version
 
-    def _monitor_game_process(self, version, process, stop_event):
+        Returns:
+            list: Dictionnaires (version, pid, start_time, elapsed en secondes) triés par lancement
+        """
+        now = time.monotonic()
+        with self.lock:
+            clients = [
+                {'version': info['version'], 'pid': pid, 'start_time': info['start_time'],
+                 'elapsed': int(now - info['start_monotonic'])}
+                for pid, info in self.tracking_sessions.items()
+                if version is None or info['version'] == version
+            ]
+        return sorted(clients, key=lambda client: client['start_time'])
+
+    def get_client_total(self, version):
+        """Retourne le temps cumulé de tous les clients en cours d'une version (secondes)."""
+        return sum(client['elapsed'] for client in self.get_clients(version))
+
+    def _credit_time(self, version, session_info, elapsed):
+        """Crédite le temps écoulé en secondes entières, le reste étant reporté."""
+        session_info['pending_time'] += elapsed
+        seconds = int(session_info['pending_time'])
+        if seconds <= 0:
+            return
+        session_info['pending_time'] -= seconds
+        session_info['accumulated_time'] += seconds
+        self.game_tracker.increment_time(version, seconds)
+        if self.journal and session_info.get('session_id'):
+            self.journal.heartbeat(session_info['session_id'], session_info['accumulated_time'])
+        logger.debug(f"Temps mis à jour pour {version}: +{seconds}s, total accumulé={session_info['accumulated_time']}s")
+
+    def _credit_group(self, version, group, now, since=None):
+        """
+        Crédite au groupe le temps couvert par un client vivant jusqu'à `now`
+        (sous self.lock). Les périodes déjà créditées par un autre client ne
+        sont pas comptées deux fois.
+        """
+        start = group['credited_until'] if since is None else max(group['credited_until'], since)
+        if now > start:
+            self._credit_time(version, group, now - start)
+        group['credited_until'] = max(group['credited_until'], now)
+
+    def _on_process_event(self, event):
+        """Traite un événement du moniteur (appelé dans le thread du moniteur)."""
+        version = event['tag']
+        pid = event['pid']
+        group = None
         try:
-            pid = process.pid
-            while not stop_event.is_set():
-                try:
-                    # Vérifier si le processus existe toujours
-                    if not psutil.pid_exists(pid):
-                        logging.info(f"Processus {version} (PID: {pid}) terminé")
-                        break
-                    
-                    # Vérifier si le processus est toujours WoW
-                    try:
-                        proc = psutil.Process(pid)
-                        if not proc.name().lower().startswith('wow'):
-                            logging.info(f"Processus {version} (PID: {pid}) n'est plus WoW")
-                            break
-                    except psutil.NoSuchProcess:
-                        logging.info(f"Processus {version} (PID: {pid}) n'existe plus")
-                        break
-                    
-                    thread_info = None
-                    with self.lock:
-                        if version in self.tracking_threads:
-                            thread_info = self.tracking_threads[version]
-                    
-                    if thread_info:
-                        current_time = datetime.now()
-                        last_update = thread_info.get('last_update', thread_info['start_time'])
-                        elapsed_seconds = int((current_time - last_update).total_seconds())
-                        
-                        if elapsed_seconds >= 10:  # Mise à jour toutes les 10 secondes
-                            with self.lock:
-                                if version in self.tracking_threads:
-                                    thread_info['accumulated_time'] += elapsed_seconds
-                                    thread_info['last_update'] = current_time
-                                    self.game_tracker.increment_time(version, elapsed_seconds)
-                                    logging.info(f"Temps mis à jour pour {version}: +{elapsed_seconds}s, total accumulé={thread_info['accumulated_time']}s")
-                    
-                    time.sleep(1)  # Vérification toutes les secondes
-                    
-                except psutil.NoSuchProcess:
-                    logging.info(f"Processus {version} (PID: {pid}) n'existe plus")
-                    break
-                except Exception as e:
-                    logging.error(f"Erreur dans la boucle de suivi pour {version}: {e}")
-                    break
-                
+            now = time.monotonic()
+            with self.lock:
+                session_info = self.tracking_sessions.get(pid)
+                if not session_info or session_info['version'] != version:
+                    return
+                session_info['elapsed'] += event['elapsed']
+                current = self.groups.get(version)
+                if current is not None:
+                    self._credit_group(version, current, now, session_info['start_monotonic'])
+                if event['type'] == 'exit':
+                    del self.tracking_sessions[pid]
+                    group = self._leave_group(version, pid)
+
+            if event['type'] == 'exit':
+                logger.info(f"Processus {version} (PID: {pid}) terminé après {int(session_info['elapsed'])}s")
+                if group:
+                    self._save_final_time(version, group)
         except Exception as e:
-            logging.error(f"Erreur dans le moniteur de processus pour {version}: {e}")
-        finally:
-            try:
-                # Nettoyage final
-                thread_info = None
-                with self.lock:
-                    if version in self.tracking_threads:
-                        thread_info = self.tracking_threads[version]
-                        del self.tracking_threads[version]
-                
-                if thread_info:
-                    self._save_final_time(version, thread_info)
-                    logging.info(f"Nettoyage final pour {version}")
-            except Exception as e:
-                logging.error(f"Erreur lors du nettoyage final pour {version}: {e}") 
\ No newline at end of file
+            logger.error(f"Erreur dans le suivi de {version}: {e}")
@@ -0,0 +1,201 @@
+import os
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Dossiers de cache du client, selon la version (Cache en 1.12, WDB ensuite)
+CACHE_DIR_NAMES = ('cache', 'wdb')
+# Nombre de dossiers parcourus en parallèle
+DEFAULT_MAX_WORKERS = 4
+# Nombre de fichiers supprimés entre deux rapports de progression
+PROGRESS_INTERVAL = 200
+
+# (chemin, taille, date de modification)
+CacheFile = Tuple[str, int, float]
+
+
+def get_cache_dirs(game_path: str) -> List[str]:
+    """
+    Retourne les dossiers de cache présents à côté de l'exécutable du jeu.
+
+    Les noms sont comparés sans tenir compte de la casse (`Cache`, `WDB`, `wdb`...).
+
+    Args:
+        game_path (str): Chemin de l'exécutable du jeu
+
+    Returns:
+        List[str]: Chemins des dossiers de cache existants
+    """
+    try:
+        with os.scandir(os.path.dirname(game_path)) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.lower() in CACHE_DIR_NAMES and entry.is_dir())
+    except OSError:
+        return []
+
+
+def _scan_dir(path: str) -> Tuple[List[CacheFile], List[str]]:
+    """Liste les fichiers (avec taille et date) et les sous-dossiers d'un dossier."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((entry.path, stat.st_size, stat.st_mtime))
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.warning(f"Lecture impossible de {path}: {e}")
+    return files, subdirs
+
+
+class ClientCacheManager:
+    """
+    Mesure et purge les dossiers de cache (Cache/WDB) des clients.
+
+    Le parcours est parallèle : chaque dossier est lu par os.scandir dans un
+    pool de threads et ses sous-dossiers sont soumis dès qu'ils sont connus,
+    sans attendre la fin du niveau courant. La taille et la date de chaque
+    fichier viennent de la même lecture, ce qui suffit pour purger par âge
+    ou par taille sans second parcours.
+
+    Attributes:
+        max_workers (int): Nombre de dossiers lus simultanément
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialise le gestionnaire de cache.
+
+        Args:
+            max_workers (int): Nombre maximal de dossiers lus en parallèle
+        """
+        self.max_workers = max(1, max_workers)
+
+    def walk(self, roots: List[str], progress: Optional[Callable[[int, int], None]] = None) -> Tuple[List[CacheFile], List[str]]:
+        """
+        Parcourt des dossiers en parallèle.
+
+        Args:
+            roots (List[str]): Dossiers à parcourir
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (fichiers trouvés, octets)
+
+        Returns:
+            Tuple[List[CacheFile], List[str]]: Fichiers (chemin, taille, date) et sous-dossiers rencontrés
+        """
+        files: List[CacheFile] = []
+        dirs: List[str] = []
+        size = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="CacheWalk") as pool:
+            pending = {pool.submit(_scan_dir, root) for root in roots}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found, subdirs = future.result()
+                    files.extend(found)
+                    dirs.extend(subdirs)
+                    size += sum(item[1] for item in found)
+                    pending.update(pool.submit(_scan_dir, subdir) for subdir in subdirs)
+                if progress:
+                    progress(len(files), size)
+        return files, dirs
+
+    def measure(self, game_path: str, progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Mesure le cache d'une installation.
+
+        Args:
+            game_path (str): Chemin de l'exécutable du jeu
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (fichiers trouvés, octets)
+
+        Returns:
+            Dict: dirs (dossiers de cache), files, size et oldest (date du plus ancien fichier, ou None)
+        """
+        roots = get_cache_dirs(game_path)
+        files, _ = self.walk(roots, progress)
+        return {
+            'dirs': roots,
+            'files': len(files),
+            'size': sum(item[1] for item in files),
+            'oldest': min((item[2] for item in files), default=None)
+        }
+
+    def purge(self, game_path: str, max_age_days: Optional[float] = None, max_size: Optional[int] = None,
+              progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Purge le cache d'une installation.
+
+        Sans critère, tout le cache est vidé. Sinon les fichiers plus anciens
+        que `max_age_days` sont supprimés, puis les plus anciens restants
+        jusqu'à repasser sous `max_size` octets. Les dossiers de cache
+        eux-mêmes sont conservés.
+
+        Args:
+            game_path (str): Chemin de l'exécutable du jeu
+            max_age_days (Optional[float]): Âge maximal des fichiers conservés (jours)
+            max_size (Optional[int]): Taille maximale du cache conservé (octets)
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (fichiers supprimés, total à supprimer)
+
+        Returns:
+            Dict: removed (fichiers supprimés), freed (octets libérés), remaining (octets restants) et errors
+        """
+        roots = get_cache_dirs(game_path)
+        files, dirs = self.walk(roots)
+        if max_age_days is None and max_size is None:
+            doomed = files
+        else:
+            # Du plus récent au plus ancien : on garde tant que les critères sont respectés
+            files.sort(key=lambda item: item[2], reverse=True)
+            cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+            kept = 0
+            doomed = []
+            for item in files:
+                if (cutoff is not None and item[2] < cutoff) or (max_size is not None and kept + item[1] > max_size):
+                    doomed.append(item)
+                else:
+                    kept += item[1]
+
+        removed = 0
+        freed = 0
+        errors = 0
+        total_size = sum(item[1] for item in files)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="CachePurge") as pool:
+            results = pool.map(self._remove, doomed, chunksize=64)
+            for done, ((path, size, _), ok) in enumerate(zip(doomed, results), 1):
+                if ok:
+                    removed += 1
+                    freed += size
+                else:
+                    errors += 1
+                if progress and (done % PROGRESS_INTERVAL == 0 or done == len(doomed)):
+                    progress(done, len(doomed))
+
+        # Sous-dossiers vidés, des plus profonds aux moins profonds
+        for path in sorted(dirs, key=len, reverse=True):
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+        logger.info(f"Cache de {os.path.dirname(game_path)}: {removed} fichiers supprimés, "
+                    f"{freed} octets libérés, {errors} erreurs")
+        return {'removed': removed, 'freed': freed, 'remaining': total_size - freed, 'errors': errors}
+
+    @staticmethod
+    def _remove(item: CacheFile) -> bool:
+        try:
+            os.remove(item[0])
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError as e:
+            logger.warning(f"Suppression impossible de {item[0]}: {e}")
+            return False
@@ -0,0 +1,137 @@
+import os
+import re
+import logging
+from typing import Dict
+
+from .persistence import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE = "Config.wtf"
+# Fin de ligne des fichiers Config.wtf créés par le launcher (format du client)
+DEFAULT_NEWLINE = '\r\n'
+
+# Ligne de réglage : SET nomVariable "valeur"
+_SET_RE = re.compile(r'^\s*SET\s+(\S+)\s+"(.*)"\s*$', re.IGNORECASE)
+
+# Profils de performance intégrés : identifiant -> variables du client modifiées.
+# Les variables inconnues d'une version sont ignorées par son client.
+PERFORMANCE_PROFILES: Dict[str, Dict[str, str]] = {
+    'low_latency_raid': {
+        'farclip': '300',
+        'gxMultisample': '1',
+        'gxVSync': '0',
+        'gxTripleBuffer': '0',
+        'maxfps': '100',
+        'maxfpsbk': '10',
+        'spellEffectLevel': '1',
+        'groundEffectDensity': '16',
+        'groundEffectDist': '40',
+        'weatherDensity': '0',
+        'detailDoodadAlpha': '0',
+        'ffxGlow': '0',
+        'ffxDeath': '0'
+    },
+    'balanced': {
+        'farclip': '477',
+        'gxMultisample': '2',
+        'gxVSync': '0',
+        'maxfps': '120',
+        'maxfpsbk': '20',
+        'spellEffectLevel': '2',
+        'groundEffectDensity': '64',
+        'groundEffectDist': '80',
+        'weatherDensity': '1',
+        'detailDoodadAlpha': '50',
+        'ffxGlow': '1',
+        'ffxDeath': '1'
+    },
+    'max_quality': {
+        'farclip': '777',
+        'gxMultisample': '4',
+        'gxVSync': '1',
+        'maxfps': '0',
+        'maxfpsbk': '30',
+        'spellEffectLevel': '2',
+        'groundEffectDensity': '256',
+        'groundEffectDist': '140',
+        'weatherDensity': '3',
+        'detailDoodadAlpha': '100',
+        'textureFilteringMode': '5',
+        'ffxGlow': '1',
+        'ffxDeath': '1'
+    }
+}
+
+
+def get_config_path(game_path: str) -> str:
+    """Retourne le chemin du Config.wtf d'une installation."""
+    return os.path.join(os.path.dirname(game_path), 'WTF', CONFIG_FILE)
+
+
+def read_config(path: str) -> Dict[str, str]:
+    """
+    Lit les réglages d'un fichier Config.wtf.
+
+    Args:
+        path (str): Chemin du fichier Config.wtf
+
+    Returns:
+        Dict[str, str]: Nom de variable -> valeur (dict vide si le fichier n'existe pas)
+    """
+    values = {}
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                match = _SET_RE.match(line)
+                if match:
+                    values[match.group(1)] = match.group(2)
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def apply_config_values(path: str, values: Dict[str, str]) -> bool:
+    """
+    Applique des réglages à un fichier Config.wtf en une écriture atomique.
+
+    Seules les lignes des variables concernées sont modifiées (comparées
+    sans tenir compte de la casse, comme le client) ; les variables absentes
+    sont ajoutées à la fin et le reste du fichier est conservé tel quel.
+    Le fichier n'est réécrit que si son contenu change.
+
+    Args:
+        path (str): Chemin du fichier Config.wtf
+        values (Dict[str, str]): Nom de variable -> valeur
+
+    Returns:
+        bool: True si le fichier a été réécrit
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = ''
+    newline = '\r\n' if '\r\n' in content else ('\n' if content else DEFAULT_NEWLINE)
+    lines = content.splitlines()
+    wanted = {name.lower(): (name, str(value)) for name, value in values.items()}
+    seen = set()
+    changed = False
+    for i, line in enumerate(lines):
+        match = _SET_RE.match(line)
+        if not match or match.group(1).lower() not in wanted:
+            continue
+        key = match.group(1).lower()
+        seen.add(key)
+        value = wanted[key][1]
+        if match.group(2) != value:
+            lines[i] = f'SET {match.group(1)} "{value}"'
+            changed = True
+    for key, (name, value) in wanted.items():
+        if key not in seen:
+            lines.append(f'SET {name} "{value}"')
+            changed = True
+    if changed:
+        atomic_write_text(path, newline.join(lines) + newline, newline='')
+        logger.info(f"{len(values)} réglages appliqués à {path}")
+    return changed
@@ -0,0 +1,220 @@
+import os
+import sys
+import copy
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, TypedDict
+
+from .persistence import atomic_write_json, WriteBehindWriter
+
+logger = logging.getLogger(__name__)
+
+# Version courante du schéma de store.json
+SCHEMA_VERSION = 1
+# Intervalle maximal entre deux écritures différées (secondes)
+DEFAULT_FLUSH_INTERVAL = 60.0
+
+VERSIONS = ('vanilla', 'tbc', 'wotlk')
+
+
+class SettingsSection(TypedDict, total=False):
+    paths: Dict[str, str]
+
+
+class GameTimeSection(TypedDict):
+    times: Dict[str, int]
+    last_used: Dict[str, Optional[str]]
+    launches: Dict[str, int]
+
+
+class ConfigSection(TypedDict, total=False):
+    language: str
+
+
+def _default_sections() -> Dict[str, Any]:
+    return {
+        'settings': {'paths': {version: '' for version in VERSIONS}},
+        'stats': {version: {} for version in VERSIONS},
+        'addons': {version: [] for version in VERSIONS},
+        'game_time': {
+            'times': {version: 0 for version in VERSIONS},
+            'last_used': {version: None for version in VERSIONS},
+            'launches': {version: 0 for version in VERSIONS}
+        },
+        'config': {'language': 'fr'}
+    }
+
+
+# Anciens fichiers, un par gestionnaire, importés une seule fois
+LEGACY_FILES = {
+    'settings': 'settings.json',
+    'stats': 'stats.json',
+    'addons': 'addons.json',
+    'game_time': 'game_time.json',
+    'config': 'config.json'
+}
+
+
+def default_data_dir() -> str:
+    """Retourne le dossier data à côté de l'exécutable ou des sources."""
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, "data")
+
+
+def _migrate_legacy_files(store: 'DataStore', sections: Dict[str, Any]) -> None:
+    """Schéma 0 → 1 : import des cinq fichiers JSON indépendants."""
+    for section, file_name in LEGACY_FILES.items():
+        path = os.path.join(store.data_dir, file_name)
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            if isinstance(legacy, dict):
+                sections[section].update(legacy)
+                logger.info(f"Fichier {file_name} importé dans la section {section}")
+        except Exception as e:
+            logger.error(f"Import impossible de {file_name}: {e}")
+
+
+# Migrations indexées par la version de schéma de départ
+MIGRATIONS = {
+    0: _migrate_legacy_files,
+}
+
+
+class DataStore:
+    """
+    Magasin de données unique du launcher.
+
+    Toutes les sections (paramètres, statistiques, addons, temps de jeu,
+    configuration) sont lues en une fois depuis `store.json`. Les
+    gestionnaires modifient leur section en mémoire sous `lock` puis appellent
+    `mark_dirty` ; les sections modifiées sont écrites ensemble, en une seule
+    écriture atomique différée. Le numéro de schéma enregistré garantit que
+    chaque migration ne s'exécute qu'une fois.
+
+    Attributes:
+        data_dir (str): Dossier des données
+        store_file (str): Chemin de store.json
+        lock (threading.RLock): Verrou protégeant toutes les sections
+    """
+
+    def __init__(self, data_dir: Optional[str] = None, store_file: str = "store.json",
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Charge le magasin de données.
+
+        Args:
+            data_dir (Optional[str]): Dossier des données (dossier par défaut si None)
+            store_file (str): Nom du fichier du magasin
+            flush_interval (float): Intervalle maximal entre deux écritures (secondes)
+        """
+        self.data_dir = data_dir or default_data_dir()
+        self.store_file = os.path.join(self.data_dir, store_file)
+        self.lock = threading.RLock()
+        self._dirty_sections = set()
+        os.makedirs(self.data_dir, exist_ok=True)
+        self._sections = self._load()
+        self._writer = WriteBehindWriter(self._write, flush_interval, name="DataStoreWriter")
+        if self._pending_migration:
+            # Enregistrer le résultat de la migration pour ne plus la rejouer
+            self._writer.request_flush()
+
+    def _load(self) -> Dict[str, Any]:
+        sections = _default_sections()
+        schema = 0
+        if os.path.exists(self.store_file):
+            try:
+                with open(self.store_file, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                schema = stored.get('schema', 0)
+                for name, value in stored.get('sections', {}).items():
+                    if name in sections and isinstance(value, dict):
+                        sections[name].update(value)
+                    else:
+                        sections[name] = value
+            except Exception as e:
+                logger.error(f"Erreur lors du chargement de {self.store_file}: {e}")
+
+        if schema < SCHEMA_VERSION:
+            for version in range(schema, SCHEMA_VERSION):
+                migration = MIGRATIONS.get(version)
+                if migration:
+                    logger.info(f"Migration du magasin de données: schéma {version} -> {version + 1}")
+                    migration(self, sections)
+            self._dirty_sections.update(sections)
+            self._pending_migration = True
+        else:
+            self._pending_migration = False
+        return sections
+
+    def section(self, name: str) -> Any:
+        """
+        Retourne la section demandée (référence modifiable sous `lock`).
+
+        Args:
+            name (str): Nom de la section
+
+        Returns:
+            Any: Contenu de la section
+        """
+        with self.lock:
+            if name not in self._sections:
+                self._sections[name] = {}
+            return self._sections[name]
+
+    def mark_dirty(self, name: str) -> None:
+        """
+        Signale qu'une section a changé ; elle sera écrite au prochain lot.
+
+        Args:
+            name (str): Nom de la section
+        """
+        with self.lock:
+            self._dirty_sections.add(name)
+        self._writer.mark_dirty()
+
+    def request_flush(self) -> None:
+        """Demande l'écriture au plus tôt des sections modifiées, en arrière-plan."""
+        self._writer.request_flush()
+
+    def save(self) -> None:
+        """Écrit immédiatement les sections modifiées."""
+        self._writer.mark_dirty()
+        self._writer.flush()
+
+    def _write(self) -> None:
+        with self.lock:
+            changed: List[str] = sorted(self._dirty_sections)
+            snapshot = {'schema': SCHEMA_VERSION, 'sections': copy.deepcopy(self._sections)}
+            self._dirty_sections.clear()
+            self._pending_migration = False
+        try:
+            atomic_write_json(self.store_file, snapshot)
+        except Exception:
+            with self.lock:
+                self._dirty_sections.update(changed)
+            raise
+        logger.debug(f"Magasin de données écrit (sections: {', '.join(changed)})")
+
+    def close(self) -> None:
+        """Écrit les modifications en attente et arrête l'écrivain différé."""
+        self._writer.close()
+
+
+_default_store: Optional[DataStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store() -> DataStore:
+    """Retourne le magasin de données partagé, créé au premier appel."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = DataStore()
+        return _default_store
@@ -0,0 +1,374 @@
+import os
+import sys
+import time
+import errno
+import struct
+import logging
+import selectors
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from .backend_loop import BackendLoop, WakePipe
+
+logger = logging.getLogger(__name__)
+
+# Délai sans nouvel événement avant de transmettre un lot (secondes)
+DEFAULT_DEBOUNCE = 0.5
+# Délai maximal avant de transmettre un lot, même si les événements continuent (secondes)
+DEFAULT_MAX_DELAY = 5.0
+# Intervalle de vérification du mode dégradé par scrutation (secondes)
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Constantes inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _subdirs(path: str) -> List[str]:
+    return _list_dir(path)[1]
+
+
+def _list_dir(path: str) -> Tuple[Set[str], List[str]]:
+    """Retourne les noms des entrées d'un dossier et les chemins de ses sous-dossiers."""
+    try:
+        with os.scandir(path) as entries:
+            names = set()
+            subdirs = []
+            for entry in entries:
+                names.add(entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            return names, subdirs
+    except OSError:
+        return set(), []
+
+
+class _InotifyBackend:
+    """Notifications du noyau via inotify, appelé par ctypes (Linux)."""
+
+    name = 'inotify'
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._ctypes = ctypes
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        # wd -> (étiquette, dossier, profondeur restante)
+        self.watches: Dict[int, Tuple[Hashable, str, int]] = {}
+        self.roots: Dict[Hashable, str] = {}
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ, 'inotify')
+        self._wake = WakePipe(self.selector)
+
+    def _watch_tree(self, tag, path, depth):
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = self._ctypes.get_errno()
+            if err == errno.ENOSPC:
+                logger.warning("Limite de surveillances inotify atteinte (fs.inotify.max_user_watches)")
+            elif err != errno.ENOENT:
+                logger.warning(f"Surveillance impossible de {path}: {os.strerror(err)}")
+            return
+        self.watches[wd] = (tag, path, depth)
+        if depth > 0:
+            for subdir in _subdirs(path):
+                self._watch_tree(tag, subdir, depth - 1)
+
+    def add(self, tag, path, depth):
+        self.remove(tag)
+        self.roots[tag] = path
+        self._watch_tree(tag, path, depth)
+
+    def remove(self, tag):
+        self.roots.pop(tag, None)
+        for wd, (watch_tag, _, _) in list(self.watches.items()):
+            if watch_tag == tag:
+                self._rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def wake(self):
+        self._wake.wake()
+
+    def wait(self, timeout):
+        changes = []
+        for key, _ in self.selector.select(timeout):
+            if key.data is None:
+                self._wake.drain()
+            else:
+                changes.extend(self._read_events())
+        return changes
+
+    def _read_events(self):
+        changes = []
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Événements perdus : chaque racine doit être relue entièrement
+                    changes.extend(self.roots.items())
+                    continue
+                watch = self.watches.get(wd)
+                if watch is None:
+                    continue
+                tag, path, depth = watch
+                if mask & IN_IGNORED:
+                    del self.watches[wd]
+                    continue
+                full_path = os.path.join(path, name) if name else path
+                changes.append((tag, full_path))
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and depth > 0:
+                    self._watch_tree(tag, full_path, depth - 1)
+
+    def close(self):
+        for tag in list(self.roots):
+            self.remove(tag)
+        self.selector.close()
+        os.close(self.fd)
+        self._wake.close()
+
+
+class _PollingBackend:
+    """Mode dégradé : compare périodiquement la date de modification des dossiers."""
+
+    name = 'poll'
+
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        # étiquette -> {dossier: (mtime_ns, noms des entrées, sous-dossiers, profondeur restante)}
+        self.trees: Dict[Hashable, Dict[str, Tuple[int, Set[str], List[str], int]]] = {}
+        self.roots: Dict[Hashable, str] = {}
+        self._wake_event = threading.Event()
+
+    def _snapshot(self, tree, path, depth):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        names, subdirs = _list_dir(path)
+        if depth <= 0:
+            subdirs = []
+        tree[path] = (mtime, names, subdirs, depth)
+        for subdir in subdirs:
+            self._snapshot(tree, subdir, depth - 1)
+
+    def _forget(self, tree, path):
+        entry = tree.pop(path, None)
+        if entry is not None:
+            for subdir in entry[2]:
+                self._forget(tree, subdir)
+
+    def add(self, tag, path, depth):
+        tree = {}
+        self._snapshot(tree, path, depth)
+        self.trees[tag] = tree
+        self.roots[tag] = path
+
+    def remove(self, tag):
+        self.trees.pop(tag, None)
+        self.roots.pop(tag, None)
+
+    def wake(self):
+        self._wake_event.set()
+
+    def wait(self, timeout):
+        if self.trees:
+            timeout = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+        changes = []
+        for tag, tree in self.trees.items():
+            for path in list(tree):
+                if path not in tree:
+                    continue
+                mtime, names, subdirs, depth = tree[path]
+                try:
+                    current = os.stat(path).st_mtime_ns
+                except OSError:
+                    self._forget(tree, path)
+                    changes.append((tag, path))
+                    continue
+                if current == mtime:
+                    continue
+                # Seul un dossier dont la date a changé est relu ; les entrées ajoutées
+                # ou supprimées sont signalées comme avec inotify
+                new_names, new_subdirs = _list_dir(path)
+                if depth <= 0:
+                    new_subdirs = []
+                for name in names.symmetric_difference(new_names):
+                    changes.append((tag, os.path.join(path, name)))
+                for subdir in set(subdirs) - set(new_subdirs):
+                    self._forget(tree, subdir)
+                tree[path] = (current, new_names, new_subdirs, depth)
+                for subdir in set(new_subdirs) - set(subdirs):
+                    self._snapshot(tree, subdir, depth - 1)
+        return changes
+
+    def close(self):
+        self.trees.clear()
+        self.roots.clear()
+
+
+def _create_backend(poll_interval):
+    """Choisit le meilleur mécanisme de surveillance disponible."""
+    if sys.platform.startswith('linux'):
+        try:
+            return _InotifyBackend()
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify indisponible, repli sur la scrutation: {e}")
+    return _PollingBackend(poll_interval)
+
+
+class DirectoryWatcher(BackendLoop):
+    """
+    Surveille des arborescences de dossiers depuis un seul thread.
+
+    Sous Linux, les modifications arrivent du noyau via inotify ; ailleurs,
+    seule la date de modification des dossiers est comparée périodiquement.
+    Les événements sont regroupés par étiquette et transmis en un seul lot
+    une fois l'activité retombée (`debounce`) ou au plus tard après
+    `max_delay` : la décompression d'un pack de milliers de fichiers produit
+    une seule notification.
+
+    Les écouteurs sont appelés dans le thread de surveillance avec
+    l'étiquette et l'ensemble des chemins modifiés. Un chemin égal à la
+    racine surveillée signifie que toute l'arborescence doit être relue.
+
+    Attributes:
+        debounce (float): Délai de regroupement des événements
+        max_delay (float): Délai maximal avant transmission d'un lot
+    """
+
+    thread_name = "DirectoryWatcher"
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE, max_delay: float = DEFAULT_MAX_DELAY,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialise le surveillant.
+
+        Args:
+            debounce (float): Délai sans événement avant transmission (secondes)
+            max_delay (float): Délai maximal avant transmission (secondes)
+            poll_interval (float): Intervalle du mode dégradé par scrutation (secondes)
+        """
+        super().__init__()
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self._listeners: List[Callable[[Hashable, Set[str]], None]] = []
+        # étiquette -> (dossier racine, profondeur), pour réinscrire les surveillances
+        self._watches: Dict[Hashable, Tuple[str, int]] = {}
+        self._pending: Dict[Hashable, Set[str]] = {}
+        self._first_event = None
+        self._last_event = None
+
+    def add_listener(self, callback: Callable[[Hashable, Set[str]], None]) -> None:
+        """
+        Ajoute un écouteur appelé dans le thread de surveillance pour chaque lot.
+
+        Args:
+            callback (Callable[[Hashable, Set[str]], None]): Fonction recevant l'étiquette et les chemins modifiés
+        """
+        self._listeners.append(callback)
+
+    def watch(self, tag: Hashable, path: str, depth: int = 0) -> None:
+        """
+        Surveille un dossier et ses sous-dossiers jusqu'à la profondeur donnée.
+
+        Args:
+            tag (Hashable): Étiquette renvoyée avec les modifications (remplace une surveillance existante)
+            path (str): Dossier racine
+            depth (int): Nombre de niveaux de sous-dossiers surveillés
+        """
+        self._send(('watch', tag, path, depth))
+
+    def unwatch(self, tag: Hashable) -> None:
+        """
+        Arrête la surveillance associée à une étiquette.
+
+        Args:
+            tag (Hashable): Étiquette de la surveillance
+        """
+        self._send(('unwatch', tag, None, 0), start=False)
+
+    def _create_backend(self):
+        return _create_backend(self.poll_interval)
+
+    def _handle_command(self, command) -> None:
+        action, tag, path, depth = command
+        if action == 'watch':
+            self._watches[tag] = (path, depth)
+            self._backend.add(tag, path, depth)
+        else:
+            self._watches.pop(tag, None)
+            self._backend.remove(tag)
+            self._pending.pop(tag, None)
+
+    def _active_commands(self):
+        return [('watch', tag, path, depth) for tag, (path, depth) in self._watches.items()]
+
+    def _on_exit(self) -> None:
+        self._pending.clear()
+        self._watches.clear()
+        self._first_event = self._last_event = None
+
+    def _next_timeout(self, now: float) -> Optional[float]:
+        if not self._pending:
+            return None
+        deadline = min(self._last_event + self.debounce, self._first_event + self.max_delay)
+        return max(0.0, deadline - now)
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._first_event = self._last_event = None
+        for tag, paths in pending.items():
+            for callback in self._listeners:
+                try:
+                    callback(tag, paths)
+                except Exception as e:
+                    logger.error(f"Erreur dans un écouteur du surveillant de dossiers: {e}")
+
+    def _iterate(self) -> None:
+        """Attend les modifications et transmet les lots dont le délai est écoulé."""
+        self._apply_commands()
+        backend = self._backend
+        changes = backend.wait(self._next_timeout(time.monotonic()))
+        now = time.monotonic()
+        for tag, path in changes:
+            if tag not in backend.roots:
+                continue
+            self._pending.setdefault(tag, set()).add(path)
+            self._last_event = now
+            if self._first_event is None:
+                self._first_event = now
+        if self._pending and self._next_timeout(now) == 0.0:
+            self._flush()
@@ -1,9 +1,10 @@
-import os
-import json
+import copy
 import logging
 from datetime import datetime
 from typing import Dict, Optional, Union
-import sys
+from .data_store import DataStore, get_default_store
+
+logger = logging.getLogger(__name__)
 
 # Constantes
 SUPPORTED_VERSIONS = {'vanilla', 'tbc', 'wotlk'}
@@ -12,35 +13,50 @@ DEFAULT_DATA_STRUCTURE = {
     'last_used': {version: None for version in SUPPORTED_VERSIONS},
     'launches': {version: 0 for version in SUPPORTED_VERSIONS}
 }
+# Temps de jeu maximal non écrit avant une sauvegarde forcée (secondes)
+DEFAULT_MAX_UNSAVED_SECONDS = 120
+
+def format_duration(seconds: Union[int, float]) -> str:
+    """
+    Formate une durée en heures et minutes.
+    
+    Args:
+        seconds (Union[int, float]): Durée en secondes
+        
+    Returns:
+        str: Durée formatée (ex: "2h 30min")
+    """
+    seconds = abs(int(seconds))
+    return f"{seconds // 3600}h {(seconds % 3600) // 60}min"
 
 class GameTimeTracker:
     """
     Gère le suivi du temps de jeu pour différentes versions de World of Warcraft.
     
     Attributes:
-        data_file (str): Nom du fichier de données
+        store (DataStore): Magasin de données partagé (section 'game_time')
         data (dict): Données de temps de jeu
+        max_unsaved_seconds (int): Temps de jeu maximal perdu en cas de crash
     """
     
-    def __init__(self, data_file: str = "game_time.json"):
+    def __init__(self, store: Optional[DataStore] = None,
+                 max_unsaved_seconds: int = DEFAULT_MAX_UNSAVED_SECONDS):
         """
         Initialise le tracker de temps de jeu.
         
         Args:
-            data_file (str): Nom du fichier de données
+            store (Optional[DataStore]): Magasin de données (magasin partagé si None)
+            max_unsaved_seconds (int): Temps de jeu non écrit déclenchant une écriture immédiate
         """
-        # Déterminer le chemin de base selon que l'application est compilée ou non
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        self.data_dir = os.path.join(base_path, "data")
-        self.data_file = os.path.join(self.data_dir, data_file)
+        self.store = store or get_default_store()
+        self.data_dir = self.store.data_dir
+        self._lock = self.store.lock
         self.data = self.load_data()
-        logging.info(f"GameTimeTracker initialisé avec le fichier: {self.data_file}")
+        self.max_unsaved_seconds = max_unsaved_seconds
+        self._unsaved_seconds = 0
+        logger.info(f"GameTimeTracker initialisé avec le magasin: {self.store.store_file}")
         for version, time in self.data['times'].items():
-            logging.info(f"{version}: {time}s")
+            logger.info(f"{version}: {time}s")
 
     def _validate_version(self, version: str) -> bool:
         """
@@ -53,7 +69,7 @@ class GameTimeTracker:
             bool: True si la version est valide
         """
         if version not in SUPPORTED_VERSIONS:
-            logging.error(f"Version non supportée: {version}")
+            logger.error(f"Version non supportée: {version}")
             return False
         return True
 
@@ -90,47 +106,44 @@ class GameTimeTracker:
             if 'launches' not in self.data:
                 self.data['launches'] = {v: 0 for v in SUPPORTED_VERSIONS}
             
-            self.data['launches'][version] += 1
-            logging.info(f"Lancement incrémenté pour {version}: total={self.data['launches'][version]}")
-            self.save_data()
+            with self._lock:
+                self.data['launches'][version] += 1
+            logger.info(f"Lancement incrémenté pour {version}: total={self.data['launches'][version]}")
+            self.store.mark_dirty('game_time')
             return True
         except Exception as e:
-            logging.error(f"Erreur lors de l'incrémentation des lancements pour {version}: {e}")
+            logger.error(f"Erreur lors de l'incrémentation des lancements pour {version}: {e}")
             return False
 
     def load_data(self) -> Dict:
         """
-        Charge les données depuis le fichier.
+        Récupère la section temps de jeu du magasin de données.
         
         Returns:
-            dict: Données chargées ou structure par défaut
-        """
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    logging.info(f"Données chargées depuis {self.data_file}")
-                    if self._validate_data_structure(data):
-                        return data
-                    logging.warning("Structure de données invalide, utilisation de la structure par défaut")
-            else:
-                logging.info(f"Fichier {self.data_file} non trouvé, création de nouvelles données")
-            return DEFAULT_DATA_STRUCTURE.copy()
-        except Exception as e:
-            logging.error(f"Erreur lors du chargement des données de temps de jeu : {e}")
-            return DEFAULT_DATA_STRUCTURE.copy()
+            dict: Section validée, réinitialisée si sa structure est invalide
+        """
+        with self._lock:
+            data = self.store.section('game_time')
+            if not self._validate_data_structure(data):
+                logger.warning("Structure de données invalide, utilisation de la structure par défaut")
+                data.clear()
+                data.update(copy.deepcopy(DEFAULT_DATA_STRUCTURE))
+                self.store.mark_dirty('game_time')
+            return data
 
     def save_data(self) -> None:
-        """Sauvegarde les données dans le fichier."""
+        """Sauvegarde immédiatement les données."""
         try:
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump(self.data, f, indent=4)
-            logging.info(f"Données sauvegardées dans {self.data_file}:")
-            for version, time in self.data['times'].items():
-                logging.info(f"{version}: {time}s, lancements: {self.data['launches'][version]}")
+            self.store.mark_dirty('game_time')
+            self.store.save()
+            with self._lock:
+                self._unsaved_seconds = 0
         except Exception as e:
-            logging.error(f"Erreur lors de la sauvegarde des données de temps de jeu : {e}")
+            logger.error(f"Erreur lors de la sauvegarde des données de temps de jeu : {e}")
+
+    def close(self) -> None:
+        """Écrit les modifications de temps de jeu en attente."""
+        self.save_data()
 
     def increment_time(self, version: str, seconds: Union[int, float]) -> bool:
         """
@@ -147,12 +160,21 @@ class GameTimeTracker:
             if not self._validate_version(version) or not isinstance(seconds, (int, float)) or seconds <= 0:
                 return False
                 
-            self.data['times'][version] += int(seconds)
-            self.data['last_used'][version] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.save_data()
+            with self._lock:
+                self.data['times'][version] += int(seconds)
+                self.data['last_used'][version] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self._unsaved_seconds += int(seconds)
+                unsaved = self._unsaved_seconds
+            
+            # Borne la perte de temps de jeu en cas de crash
+            self.store.mark_dirty('game_time')
+            if unsaved >= self.max_unsaved_seconds:
+                with self._lock:
+                    self._unsaved_seconds = 0
+                self.store.request_flush()
             return True
         except Exception as e:
-            logging.error(f"Erreur lors de l'incrémentation du temps pour {version}: {e}")
+            logger.error(f"Erreur lors de l'incrémentation du temps pour {version}: {e}")
             return False
 
     def get_time(self, version: str) -> int:
@@ -170,7 +192,7 @@ class GameTimeTracker:
                 return 0
             return self.data['times'].get(version, 0)
         except Exception as e:
-            logging.error(f"Erreur lors de la récupération du temps pour {version}: {e}")
+            logger.error(f"Erreur lors de la récupération du temps pour {version}: {e}")
             return 0
 
     def get_launches(self, version: str) -> int:
@@ -188,7 +210,7 @@ class GameTimeTracker:
                 return 0
             return self.data.get('launches', {}).get(version, 0)
         except Exception as e:
-            logging.error(f"Erreur lors de la récupération des lancements pour {version}: {e}")
+            logger.error(f"Erreur lors de la récupération des lancements pour {version}: {e}")
             return 0
 
     def get_last_used(self, version: str) -> Optional[str]:
@@ -206,7 +228,7 @@ class GameTimeTracker:
                 return None
             return self.data['last_used'].get(version)
         except Exception as e:
-            logging.error(f"Erreur lors de la récupération de la dernière utilisation pour {version}: {e}")
+            logger.error(f"Erreur lors de la récupération de la dernière utilisation pour {version}: {e}")
             return None
 
     def get_formatted_time(self, version: str) -> str:
@@ -222,12 +244,9 @@ class GameTimeTracker:
         try:
             if not self._validate_version(version):
                 return "0h 0min"
-            seconds = abs(int(self.get_time(version)))
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            formatted = f"{hours}h {minutes}min"
-            logging.info(f"Temps formaté pour {version}: {formatted}")
+            formatted = format_duration(self.get_time(version))
+            logger.debug(f"Temps formaté pour {version}: {formatted}")
             return formatted
         except Exception as e:
-            logging.error(f"Erreur lors du formatage du temps pour {version}: {e}")
+            logger.error(f"Erreur lors du formatage du temps pour {version}: {e}")
             return "0h 0min" 
\ No newline at end of file
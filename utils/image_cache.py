@@ -0,0 +1,110 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Optional, Tuple
+
+from .persistence import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageCache:
+    """
+    Cache d'images dérivées prêtes à afficher.
+
+    Une image source redimensionnée est stockée au format PPM, que
+    `tk.PhotoImage` charge directement sans décodage JPEG ni passage par PIL.
+    Les entrées sont indexées par l'empreinte SHA-1 de la source et la taille
+    cible ; un manifeste conserve la taille et la date de modification de
+    chaque source pour éviter de recalculer l'empreinte à chaque démarrage.
+
+    Attributes:
+        cache_dir (str): Dossier du cache
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_dir (str): Dossier du cache
+        """
+        self.cache_dir = cache_dir
+        self.manifest_file = os.path.join(cache_dir, MANIFEST_FILE)
+        self._manifest = None
+
+    def _load_manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _source_hash(self, source_path: str) -> str:
+        """Retourne l'empreinte de la source, recalculée uniquement si elle a changé sur le disque."""
+        stat = os.stat(source_path)
+        manifest = self._load_manifest()
+        key = os.path.abspath(source_path)
+        entry = manifest.get(key)
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            return entry['sha1']
+        sha1 = _file_hash(source_path)
+        manifest[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': sha1}
+        try:
+            atomic_write_json(self.manifest_file, manifest)
+        except OSError as e:
+            logger.warning(f"Impossible d'écrire le manifeste du cache d'images: {e}")
+        return sha1
+
+    def get_scaled(self, source_path: str, size: Tuple[int, int]) -> Optional[str]:
+        """
+        Retourne le chemin d'une version redimensionnée et prête à afficher de l'image.
+
+        L'image n'est reconstruite que si la source a changé ou si la taille
+        cible n'a jamais été demandée.
+
+        Args:
+            source_path (str): Chemin de l'image source
+            size (Tuple[int, int]): Taille cible (largeur, hauteur)
+
+        Returns:
+            Optional[str]: Chemin du fichier PPM, ou None en cas d'échec
+        """
+        try:
+            sha1 = self._source_hash(source_path)
+            cached_path = os.path.join(self.cache_dir, f"{sha1[:16]}_{size[0]}x{size[1]}.ppm")
+            if os.path.exists(cached_path):
+                return cached_path
+            self._build(source_path, size, cached_path)
+            return cached_path
+        except Exception as e:
+            logger.error(f"Erreur lors de la préparation de l'image {source_path}: {e}")
+            return None
+
+    def _build(self, source_path: str, size: Tuple[int, int], cached_path: str) -> None:
+        """Décode, redimensionne et enregistre l'image (décodage JPEG réduit si possible)."""
+        from PIL import Image
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with Image.open(source_path) as image:
+            # Pour un JPEG, ne décode qu'à l'échelle 1/2, 1/4 ou 1/8 suffisante pour la cible
+            image.draft('RGB', size)
+            scaled = image.convert('RGB').resize(size, Image.Resampling.LANCZOS)
+
+        tmp_path = cached_path + '.tmp'
+        scaled.save(tmp_path, format='PPM')
+        os.replace(tmp_path, cached_path)
+        logger.info(f"Image mise en cache: {cached_path}")
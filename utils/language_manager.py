@@ -1,9 +1,12 @@
-import json
-import os
 import logging
+from .data_store import get_default_store
+
+logger = logging.getLogger(__name__)
 
 class LanguageManager:
-    def __init__(self):
+    def __init__(self, store=None):
+        self.store = store or get_default_store()
+        self.config = self.store.section('config')
         self.current_language = 'fr'  # Langue par défaut
         self.translations = {
             'fr': {
@@ -48,7 +51,75 @@ class LanguageManager:
                 'game_already_running': 'Le jeu est déjà en cours d\'exécution.',
                 'invalid_path': 'Le chemin du jeu n\'est pas configuré ou invalide.\nVeuillez le configurer dans les paramètres.',
                 'launch_error': 'Impossible de lancer le jeu:',
-                'folder_error': 'Impossible d\'ouvrir le dossier:'
+                'folder_error': 'Impossible d\'ouvrir le dossier:',
+                'week_time': 'Cette semaine : {}',
+                'month_time': 'Ce mois-ci : {}',
+                'longest_session': 'Plus longue session : {}',
+                'current_streak': 'Série en cours : {} jour(s) (record : {})',
+                'addons_count': '{} addons installés',
+                'indexing_addons': 'Indexation des addons...',
+                'install_addons': 'Installer des addons (.zip)',
+                'installing_addons': 'Installation... {}/{} archives',
+                'addons_installed': '{} addon(s) installé(s) : {}',
+                'install_failed': 'Échec pour : {}',
+                'enable_addons': 'Activer la sélection',
+                'disable_addons': 'Désactiver la sélection',
+                'addons_enabled': '{} addon(s) activé(s) pour {} personnage(s)',
+                'addons_disabled': '{} addon(s) désactivé(s) pour {} personnage(s)',
+                'missing_dependencies': 'Dépendances manquantes : {}',
+                'dependency_cycles': 'Dépendances circulaires : {}',
+                'saved_variables': 'SavedVariables',
+                'analyze_saved_variables': 'Analyser',
+                'archive_orphans': 'Archiver les orphelines',
+                'analyzing_saved_variables': 'Analyse... {} fichiers, {}',
+                'saved_variables_total': '{} fichiers, {}',
+                'saved_variables_by_addon': 'Addons les plus lourds',
+                'saved_variables_by_character': 'Personnages',
+                'saved_variables_top_variables': 'Variables les plus lourdes',
+                'saved_variables_orphans': '{} fichiers orphelins ({})',
+                'orphans_archived': '{} fichiers archivés dans {}',
+                'close_game_first': 'Fermez le jeu avant de modifier ses SavedVariables.',
+                'client_cache': 'Cache du client',
+                'cache_max_age': 'Âge max. (jours)',
+                'cache_max_size': 'Taille max. (Mo)',
+                'cache_auto_clear': 'Purger automatiquement avant chaque lancement',
+                'purge_cache': 'Purger',
+                'measuring_cache': 'Mesure... {} fichiers, {}',
+                'purging_cache': 'Purge... {}/{} fichiers',
+                'cache_size': 'Cache : {} ({} fichiers)',
+                'cache_freed': '{} libérés',
+                'no_cache': 'Aucun dossier Cache/WDB',
+                'invalid_number': 'Valeur invalide : {}',
+                'config_profile': 'Profil Config.wtf :',
+                'profile_none': 'Aucun (Config.wtf inchangé)',
+                'profile_low_latency_raid': 'Raid faible latence',
+                'profile_balanced': 'Équilibré',
+                'profile_max_quality': 'Qualité maximale (captures)',
+                'prefetch_on_startup': 'Précharger les archives au démarrage',
+                'prefetch_budget': 'Budget (Mo)',
+                'prefetch_now': 'Précharger',
+                'prefetching': 'Préchargement... {} / {}',
+                'data_resident': 'Archives en mémoire : {} / {}',
+                'cpu_priority': 'Priorité CPU :',
+                'io_priority': 'E/S :',
+                'cpu_affinity': 'Cœurs :',
+                'level_idle': 'Inactive',
+                'level_low': 'Basse',
+                'level_below_normal': 'Inférieure',
+                'level_normal': 'Normale',
+                'level_above_normal': 'Supérieure',
+                'level_high': 'Haute',
+                'multibox_clients': 'Clients :',
+                'multibox_stagger': 'Délai (s) :',
+                'clients_running': '{} clients en cours',
+                'client_time': 'Client {} (PID {}) : {}',
+                'clients_total_time': 'Temps cumulé des clients : {}',
+                'launch_latency': 'Lancement (p50 / p95) : fenêtre {} / {}, chargé {} / {} ({} lancements)',
+                'telemetry_enabled': 'Télémétrie des clients',
+                'telemetry_interval': 'Intervalle (s) :',
+                'last_session_telemetry': 'Dernière session : pic mémoire {}, CPU moyen {} %, E/S {}',
+                'services_unavailable': "Ce service n'a pas pu démarrer. Consultez le journal pour plus de détails.",
+                'live_telemetry': 'En cours (PID {}) : mémoire {}, CPU moyen {} % (pic {} %) sur {}'
             },
             'en': {
                 'launch_button': 'Launch {}',
@@ -92,7 +163,75 @@ class LanguageManager:
                 'game_already_running': 'The game is already running.',
                 'invalid_path': 'Game path is not configured or invalid.\nPlease configure it in settings.',
                 'launch_error': 'Unable to launch game:',
-                'folder_error': 'Unable to open folder:'
+                'folder_error': 'Unable to open folder:',
+                'week_time': 'This week: {}',
+                'month_time': 'This month: {}',
+                'longest_session': 'Longest session: {}',
+                'current_streak': 'Current streak: {} day(s) (best: {})',
+                'addons_count': '{} addons installed',
+                'indexing_addons': 'Indexing addons...',
+                'install_addons': 'Install addons (.zip)',
+                'installing_addons': 'Installing... {}/{} archives',
+                'addons_installed': '{} addon(s) installed: {}',
+                'install_failed': 'Failed for: {}',
+                'enable_addons': 'Enable selection',
+                'disable_addons': 'Disable selection',
+                'addons_enabled': '{} addon(s) enabled for {} character(s)',
+                'addons_disabled': '{} addon(s) disabled for {} character(s)',
+                'missing_dependencies': 'Missing dependencies: {}',
+                'dependency_cycles': 'Circular dependencies: {}',
+                'saved_variables': 'SavedVariables',
+                'analyze_saved_variables': 'Analyze',
+                'archive_orphans': 'Archive orphans',
+                'analyzing_saved_variables': 'Analyzing... {} files, {}',
+                'saved_variables_total': '{} files, {}',
+                'saved_variables_by_addon': 'Largest addons',
+                'saved_variables_by_character': 'Characters',
+                'saved_variables_top_variables': 'Largest variables',
+                'saved_variables_orphans': '{} orphaned files ({})',
+                'orphans_archived': '{} files archived to {}',
+                'close_game_first': 'Close the game before changing its SavedVariables.',
+                'client_cache': 'Client cache',
+                'cache_max_age': 'Max age (days)',
+                'cache_max_size': 'Max size (MB)',
+                'cache_auto_clear': 'Purge automatically before each launch',
+                'purge_cache': 'Purge',
+                'measuring_cache': 'Measuring... {} files, {}',
+                'purging_cache': 'Purging... {}/{} files',
+                'cache_size': 'Cache: {} ({} files)',
+                'cache_freed': '{} freed',
+                'no_cache': 'No Cache/WDB folder',
+                'invalid_number': 'Invalid value: {}',
+                'config_profile': 'Config.wtf profile:',
+                'profile_none': 'None (Config.wtf unchanged)',
+                'profile_low_latency_raid': 'Low-latency raid',
+                'profile_balanced': 'Balanced',
+                'profile_max_quality': 'Max quality (screenshots)',
+                'prefetch_on_startup': 'Prefetch archives at startup',
+                'prefetch_budget': 'Budget (MB)',
+                'prefetch_now': 'Prefetch',
+                'prefetching': 'Prefetching... {} / {}',
+                'data_resident': 'Archives in memory: {} / {}',
+                'cpu_priority': 'CPU priority:',
+                'io_priority': 'I/O:',
+                'cpu_affinity': 'Cores:',
+                'level_idle': 'Idle',
+                'level_low': 'Low',
+                'level_below_normal': 'Below normal',
+                'level_normal': 'Normal',
+                'level_above_normal': 'Above normal',
+                'level_high': 'High',
+                'multibox_clients': 'Clients:',
+                'multibox_stagger': 'Delay (s):',
+                'clients_running': '{} clients running',
+                'client_time': 'Client {} (PID {}): {}',
+                'clients_total_time': 'Combined client time: {}',
+                'launch_latency': 'Launch (p50 / p95): window {} / {}, loaded {} / {} ({} launches)',
+                'telemetry_enabled': 'Client telemetry',
+                'telemetry_interval': 'Interval (s):',
+                'last_session_telemetry': 'Last session: peak memory {}, mean CPU {}%, I/O {}',
+                'services_unavailable': 'This service could not start. See the log for details.',
+                'live_telemetry': 'Running (PID {}): memory {}, mean CPU {}% (peak {}%) over {}'
             },
             'es': {
                 'launch_button': 'Iniciar {}',
@@ -133,7 +272,75 @@ class LanguageManager:
                 'game_already_running': 'El juego ya está en ejecución.',
                 'invalid_path': 'La ruta del juego no está configurada o es inválida.\nPor favor, configúrela en los ajustes.',
                 'launch_error': 'No se puede iniciar el juego:',
-                'folder_error': 'No se puede abrir la carpeta:'
+                'folder_error': 'No se puede abrir la carpeta:',
+                'week_time': 'Esta semana: {}',
+                'month_time': 'Este mes: {}',
+                'longest_session': 'Sesión más larga: {}',
+                'current_streak': 'Racha actual: {} día(s) (récord: {})',
+                'addons_count': '{} addons instalados',
+                'indexing_addons': 'Indexando addons...',
+                'install_addons': 'Instalar addons (.zip)',
+                'installing_addons': 'Instalando... {}/{} archivos',
+                'addons_installed': '{} addon(s) instalado(s): {}',
+                'install_failed': 'Error en: {}',
+                'enable_addons': 'Activar selección',
+                'disable_addons': 'Desactivar selección',
+                'addons_enabled': '{} addon(s) activado(s) para {} personaje(s)',
+                'addons_disabled': '{} addon(s) desactivado(s) para {} personaje(s)',
+                'missing_dependencies': 'Dependencias faltantes: {}',
+                'dependency_cycles': 'Dependencias circulares: {}',
+                'saved_variables': 'SavedVariables',
+                'analyze_saved_variables': 'Analizar',
+                'archive_orphans': 'Archivar huérfanas',
+                'analyzing_saved_variables': 'Analizando... {} archivos, {}',
+                'saved_variables_total': '{} archivos, {}',
+                'saved_variables_by_addon': 'Addons más pesados',
+                'saved_variables_by_character': 'Personajes',
+                'saved_variables_top_variables': 'Variables más pesadas',
+                'saved_variables_orphans': '{} archivos huérfanos ({})',
+                'orphans_archived': '{} archivos archivados en {}',
+                'close_game_first': 'Cierra el juego antes de modificar sus SavedVariables.',
+                'client_cache': 'Caché del cliente',
+                'cache_max_age': 'Antigüedad máx. (días)',
+                'cache_max_size': 'Tamaño máx. (MB)',
+                'cache_auto_clear': 'Purgar automáticamente antes de cada inicio',
+                'purge_cache': 'Purgar',
+                'measuring_cache': 'Midiendo... {} archivos, {}',
+                'purging_cache': 'Purgando... {}/{} archivos',
+                'cache_size': 'Caché: {} ({} archivos)',
+                'cache_freed': '{} liberados',
+                'no_cache': 'Ninguna carpeta Cache/WDB',
+                'invalid_number': 'Valor no válido: {}',
+                'config_profile': 'Perfil Config.wtf:',
+                'profile_none': 'Ninguno (Config.wtf sin cambios)',
+                'profile_low_latency_raid': 'Banda de baja latencia',
+                'profile_balanced': 'Equilibrado',
+                'profile_max_quality': 'Calidad máxima (capturas)',
+                'prefetch_on_startup': 'Precargar archivos al iniciar',
+                'prefetch_budget': 'Presupuesto (MB)',
+                'prefetch_now': 'Precargar',
+                'prefetching': 'Precargando... {} / {}',
+                'data_resident': 'Archivos en memoria: {} / {}',
+                'cpu_priority': 'Prioridad CPU:',
+                'io_priority': 'E/S:',
+                'cpu_affinity': 'Núcleos:',
+                'level_idle': 'Inactiva',
+                'level_low': 'Baja',
+                'level_below_normal': 'Inferior',
+                'level_normal': 'Normal',
+                'level_above_normal': 'Superior',
+                'level_high': 'Alta',
+                'multibox_clients': 'Clientes:',
+                'multibox_stagger': 'Retraso (s):',
+                'clients_running': '{} clientes en curso',
+                'client_time': 'Cliente {} (PID {}): {}',
+                'clients_total_time': 'Tiempo acumulado de los clientes: {}',
+                'launch_latency': 'Inicio (p50 / p95): ventana {} / {}, cargado {} / {} ({} inicios)',
+                'telemetry_enabled': 'Telemetría de los clientes',
+                'telemetry_interval': 'Intervalo (s):',
+                'last_session_telemetry': 'Última sesión: pico de memoria {}, CPU media {} %, E/S {}',
+                'services_unavailable': 'Este servicio no pudo iniciarse. Consulte el registro para más detalles.',
+                'live_telemetry': 'En curso (PID {}): memoria {}, CPU media {} % (pico {} %) en {}'
             },
             'de': {
                 'launch_button': 'Starten {}',
@@ -174,7 +381,75 @@ class LanguageManager:
                 'game_already_running': 'Das Spiel läuft bereits.',
                 'invalid_path': 'Spielpfad ist nicht konfiguriert oder ungültig.\nBitte konfigurieren Sie ihn in den Einstellungen.',
                 'launch_error': 'Spiel kann nicht gestartet werden:',
-                'folder_error': 'Ordner kann nicht geöffnet werden:'
+                'folder_error': 'Ordner kann nicht geöffnet werden:',
+                'week_time': 'Diese Woche: {}',
+                'month_time': 'Diesen Monat: {}',
+                'longest_session': 'Längste Sitzung: {}',
+                'current_streak': 'Aktuelle Serie: {} Tag(e) (Rekord: {})',
+                'addons_count': '{} Addons installiert',
+                'indexing_addons': 'Addons werden indexiert...',
+                'install_addons': 'Addons installieren (.zip)',
+                'installing_addons': 'Installation... {}/{} Archive',
+                'addons_installed': '{} Addon(s) installiert: {}',
+                'install_failed': 'Fehlgeschlagen: {}',
+                'enable_addons': 'Auswahl aktivieren',
+                'disable_addons': 'Auswahl deaktivieren',
+                'addons_enabled': '{} Addon(s) für {} Charakter(e) aktiviert',
+                'addons_disabled': '{} Addon(s) für {} Charakter(e) deaktiviert',
+                'missing_dependencies': 'Fehlende Abhängigkeiten: {}',
+                'dependency_cycles': 'Zirkuläre Abhängigkeiten: {}',
+                'saved_variables': 'SavedVariables',
+                'analyze_saved_variables': 'Analysieren',
+                'archive_orphans': 'Verwaiste archivieren',
+                'analyzing_saved_variables': 'Analyse... {} Dateien, {}',
+                'saved_variables_total': '{} Dateien, {}',
+                'saved_variables_by_addon': 'Größte Addons',
+                'saved_variables_by_character': 'Charaktere',
+                'saved_variables_top_variables': 'Größte Variablen',
+                'saved_variables_orphans': '{} verwaiste Dateien ({})',
+                'orphans_archived': '{} Dateien archiviert in {}',
+                'close_game_first': 'Schließe das Spiel, bevor du seine SavedVariables änderst.',
+                'client_cache': 'Client-Cache',
+                'cache_max_age': 'Max. Alter (Tage)',
+                'cache_max_size': 'Max. Größe (MB)',
+                'cache_auto_clear': 'Vor jedem Start automatisch leeren',
+                'purge_cache': 'Leeren',
+                'measuring_cache': 'Messen... {} Dateien, {}',
+                'purging_cache': 'Leeren... {}/{} Dateien',
+                'cache_size': 'Cache: {} ({} Dateien)',
+                'cache_freed': '{} freigegeben',
+                'no_cache': 'Kein Cache/WDB-Ordner',
+                'invalid_number': 'Ungültiger Wert: {}',
+                'config_profile': 'Config.wtf-Profil:',
+                'profile_none': 'Keins (Config.wtf unverändert)',
+                'profile_low_latency_raid': 'Raid mit niedriger Latenz',
+                'profile_balanced': 'Ausgewogen',
+                'profile_max_quality': 'Maximale Qualität (Screenshots)',
+                'prefetch_on_startup': 'Archive beim Start vorladen',
+                'prefetch_budget': 'Budget (MB)',
+                'prefetch_now': 'Vorladen',
+                'prefetching': 'Vorladen... {} / {}',
+                'data_resident': 'Archive im Speicher: {} / {}',
+                'cpu_priority': 'CPU-Priorität:',
+                'io_priority': 'E/A:',
+                'cpu_affinity': 'Kerne:',
+                'level_idle': 'Leerlauf',
+                'level_low': 'Niedrig',
+                'level_below_normal': 'Niedriger als normal',
+                'level_normal': 'Normal',
+                'level_above_normal': 'Höher als normal',
+                'level_high': 'Hoch',
+                'multibox_clients': 'Clients:',
+                'multibox_stagger': 'Verzögerung (s):',
+                'clients_running': '{} Clients laufen',
+                'client_time': 'Client {} (PID {}): {}',
+                'clients_total_time': 'Gesamtzeit der Clients: {}',
+                'launch_latency': 'Start (p50 / p95): Fenster {} / {}, geladen {} / {} ({} Starts)',
+                'telemetry_enabled': 'Client-Telemetrie',
+                'telemetry_interval': 'Intervall (s):',
+                'last_session_telemetry': 'Letzte Sitzung: Spitzenspeicher {}, mittlere CPU {} %, E/A {}',
+                'services_unavailable': 'Dieser Dienst konnte nicht gestartet werden. Details stehen im Protokoll.',
+                'live_telemetry': 'Läuft (PID {}): Speicher {}, mittlere CPU {} % (Spitze {} %) über {}'
             },
             'pt': {
                 'launch_button': 'Iniciar {}',
@@ -215,38 +490,97 @@ class LanguageManager:
                 'game_already_running': 'O jogo já está em execução.',
                 'invalid_path': 'O caminho do jogo não está configurado ou é inválido.\nPor favor, configure nas configurações.',
                 'launch_error': 'Não foi possível iniciar o jogo:',
-                'folder_error': 'Não foi possível abrir a pasta:'
+                'folder_error': 'Não foi possível abrir a pasta:',
+                'week_time': 'Esta semana: {}',
+                'month_time': 'Este mês: {}',
+                'longest_session': 'Sessão mais longa: {}',
+                'current_streak': 'Sequência atual: {} dia(s) (recorde: {})',
+                'addons_count': '{} addons instalados',
+                'indexing_addons': 'Indexando addons...',
+                'install_addons': 'Instalar addons (.zip)',
+                'installing_addons': 'Instalando... {}/{} arquivos',
+                'addons_installed': '{} addon(s) instalado(s): {}',
+                'install_failed': 'Falha em: {}',
+                'enable_addons': 'Ativar seleção',
+                'disable_addons': 'Desativar seleção',
+                'addons_enabled': '{} addon(s) ativado(s) para {} personagem(ns)',
+                'addons_disabled': '{} addon(s) desativado(s) para {} personagem(ns)',
+                'missing_dependencies': 'Dependências ausentes: {}',
+                'dependency_cycles': 'Dependências circulares: {}',
+                'saved_variables': 'SavedVariables',
+                'analyze_saved_variables': 'Analisar',
+                'archive_orphans': 'Arquivar órfãs',
+                'analyzing_saved_variables': 'Analisando... {} arquivos, {}',
+                'saved_variables_total': '{} arquivos, {}',
+                'saved_variables_by_addon': 'Addons mais pesados',
+                'saved_variables_by_character': 'Personagens',
+                'saved_variables_top_variables': 'Variáveis mais pesadas',
+                'saved_variables_orphans': '{} arquivos órfãos ({})',
+                'orphans_archived': '{} arquivos arquivados em {}',
+                'close_game_first': 'Feche o jogo antes de alterar suas SavedVariables.',
+                'client_cache': 'Cache do cliente',
+                'cache_max_age': 'Idade máx. (dias)',
+                'cache_max_size': 'Tamanho máx. (MB)',
+                'cache_auto_clear': 'Limpar automaticamente antes de cada início',
+                'purge_cache': 'Limpar',
+                'measuring_cache': 'Medindo... {} arquivos, {}',
+                'purging_cache': 'Limpando... {}/{} arquivos',
+                'cache_size': 'Cache: {} ({} arquivos)',
+                'cache_freed': '{} liberados',
+                'no_cache': 'Nenhuma pasta Cache/WDB',
+                'invalid_number': 'Valor inválido: {}',
+                'config_profile': 'Perfil Config.wtf:',
+                'profile_none': 'Nenhum (Config.wtf inalterado)',
+                'profile_low_latency_raid': 'Raide de baixa latência',
+                'profile_balanced': 'Equilibrado',
+                'profile_max_quality': 'Qualidade máxima (capturas)',
+                'prefetch_on_startup': 'Pré-carregar arquivos ao iniciar',
+                'prefetch_budget': 'Orçamento (MB)',
+                'prefetch_now': 'Pré-carregar',
+                'prefetching': 'Pré-carregando... {} / {}',
+                'data_resident': 'Arquivos na memória: {} / {}',
+                'cpu_priority': 'Prioridade CPU:',
+                'io_priority': 'E/S:',
+                'cpu_affinity': 'Núcleos:',
+                'level_idle': 'Ociosa',
+                'level_low': 'Baixa',
+                'level_below_normal': 'Abaixo do normal',
+                'level_normal': 'Normal',
+                'level_above_normal': 'Acima do normal',
+                'level_high': 'Alta',
+                'multibox_clients': 'Clientes:',
+                'multibox_stagger': 'Intervalo (s):',
+                'clients_running': '{} clientes em execução',
+                'client_time': 'Cliente {} (PID {}): {}',
+                'clients_total_time': 'Tempo acumulado dos clientes: {}',
+                'launch_latency': 'Início (p50 / p95): janela {} / {}, carregado {} / {} ({} inícios)',
+                'telemetry_enabled': 'Telemetria dos clientes',
+                'telemetry_interval': 'Intervalo (s):',
+                'last_session_telemetry': 'Última sessão: pico de memória {}, CPU média {} %, E/S {}',
+                'services_unavailable': 'Este serviço não pôde ser iniciado. Consulte o registo para mais detalhes.',
+                'live_telemetry': 'Em execução (PID {}): memória {}, CPU média {} % (pico {} %) em {}'
             }
         }
         self.load_language()
 
     def load_language(self):
-        """Charge la langue depuis le fichier de configuration."""
+        """Charge la langue depuis la section de configuration du magasin de données."""
         try:
-            if os.path.exists('data/config.json'):
-                with open('data/config.json', 'r') as f:
-                    config = json.load(f)
-                    if 'language' in config:
-                        self.current_language = config['language']
-            else:
-                self.save_language()  # Crée le fichier avec la langue par défaut
+            language = self.config.get('language')
+            if language in self.translations:
+                self.current_language = language
         except Exception as e:
-            logging.error(f"Erreur lors du chargement de la langue: {e}")
+            logger.error(f"Erreur lors du chargement de la langue: {e}")
 
     def save_language(self):
-        """Sauvegarde la langue dans le fichier de configuration."""
+        """Enregistre la langue dans la section de configuration."""
         try:
-            config = {}
-            if os.path.exists('data/config.json'):
-                with open('data/config.json', 'r') as f:
-                    config = json.load(f)
-            
-            config['language'] = self.current_language
-            
-            with open('data/config.json', 'w') as f:
-                json.dump(config, f, indent=4)
+            with self.store.lock:
+                self.config['language'] = self.current_language
+            self.store.mark_dirty('config')
+            self.store.request_flush()
         except Exception as e:
-            logging.error(f"Erreur lors de la sauvegarde de la langue: {e}")
+            logger.error(f"Erreur lors de la sauvegarde de la langue: {e}")
 
     def get_text(self, key, *args):
         """Récupère le texte traduit pour la clé donnée."""
@@ -256,7 +590,7 @@ class LanguageManager:
                 return text.format(*args)
             return text
         except Exception as e:
-            logging.error(f"Erreur lors de la récupération du texte traduit: {e}")
+            logger.error(f"Erreur lors de la récupération du texte traduit: {e}")
             return key
 
     def set_language(self, language):
@@ -0,0 +1,254 @@
+import os
+import sys
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Niveaux de priorité CPU proposés, du plus bas au plus haut
+PRIORITY_LEVELS = ('idle', 'below_normal', 'normal', 'above_normal', 'high')
+# Niveaux de priorité d'E/S proposés
+IO_PRIORITY_LEVELS = ('idle', 'low', 'normal', 'high')
+
+# Valeurs nice équivalentes sous POSIX (les valeurs négatives demandent des droits)
+_NICE_VALUES = {'idle': 19, 'below_normal': 10, 'normal': 0, 'above_normal': -5, 'high': -10}
+# Niveaux de la classe « best effort » d'ionice (0 = le plus prioritaire)
+_IONICE_BEST_EFFORT = {'low': 7, 'normal': 4, 'high': 0}
+
+DEFAULT_LAUNCH_PROFILE = {'affinity': None, 'priority': 'normal', 'io_priority': 'normal'}
+
+
+def parse_cpu_list(text: str) -> Optional[List[int]]:
+    """
+    Convertit une liste de cœurs saisie (« 0-3,6 ») en liste d'indices.
+
+    Args:
+        text (str): Liste de cœurs ; vide pour tous les cœurs
+
+    Returns:
+        Optional[List[int]]: Indices triés, ou None pour ne pas restreindre
+
+    Raises:
+        ValueError: Si la saisie est invalide
+    """
+    cpus = set()
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        start, sep, end = part.partition('-')
+        first, last = int(start), int(end) if sep else int(start)
+        if first < 0 or last < first:
+            raise ValueError(part)
+        cpus.update(range(first, last + 1))
+    return sorted(cpus) or None
+
+
+def format_cpu_list(cpus: Optional[List[int]]) -> str:
+    """Formate une liste de cœurs en plages (« 0-3,6 »)."""
+    if not cpus:
+        return ''
+    ranges = []
+    start = previous = cpus[0]
+    for cpu in cpus[1:] + [None]:
+        if cpu is not None and cpu == previous + 1:
+            previous = cpu
+            continue
+        ranges.append(str(start) if start == previous else f"{start}-{previous}")
+        if cpu is not None:
+            start = previous = cpu
+    return ','.join(ranges)
+
+
+def affinity_slice(cpus: List[int], index: int, count: int) -> List[int]:
+    """
+    Répartit des cœurs entre plusieurs clients lancés ensemble.
+
+    Les cœurs sont découpés en `count` tranches contiguës de tailles
+    voisines ; s'il y a plus de clients que de cœurs, chaque client reçoit
+    un cœur, attribué à tour de rôle.
+
+    Args:
+        cpus (List[int]): Cœurs disponibles
+        index (int): Rang du client (à partir de 0)
+        count (int): Nombre de clients
+
+    Returns:
+        List[int]: Cœurs attribués au client
+    """
+    if count <= 1 or not cpus:
+        return list(cpus)
+    if count >= len(cpus):
+        return [cpus[index % len(cpus)]]
+    size, extra = divmod(len(cpus), count)
+    start = index * size + min(index, extra)
+    return cpus[start:start + size + (1 if index < extra else 0)]
+
+
+def _set_priority(process, level: str) -> None:
+    import psutil
+    if sys.platform == 'win32':
+        classes = {
+            'idle': psutil.IDLE_PRIORITY_CLASS,
+            'below_normal': psutil.BELOW_NORMAL_PRIORITY_CLASS,
+            'normal': psutil.NORMAL_PRIORITY_CLASS,
+            'above_normal': psutil.ABOVE_NORMAL_PRIORITY_CLASS,
+            'high': psutil.HIGH_PRIORITY_CLASS
+        }
+        process.nice(classes[level])
+    else:
+        process.nice(_NICE_VALUES[level])
+
+
+def _set_io_priority(process, level: str) -> None:
+    import psutil
+    if sys.platform == 'win32':
+        levels = {
+            'idle': psutil.IOPRIO_VERYLOW,
+            'low': psutil.IOPRIO_LOW,
+            'normal': psutil.IOPRIO_NORMAL,
+            'high': psutil.IOPRIO_HIGH
+        }
+        process.ionice(levels[level])
+    elif level == 'idle':
+        process.ionice(psutil.IOPRIO_CLASS_IDLE)
+    else:
+        process.ionice(psutil.IOPRIO_CLASS_BE, _IONICE_BEST_EFFORT[level])
+
+
+def apply_launch_profile(pid: int, profile: Dict) -> Dict[str, str]:
+    """
+    Applique un profil de lancement à un processus.
+
+    Chaque réglage est appliqué indépendamment : un réglage refusé (droits
+    insuffisants, fonction absente de la plateforme) est journalisé sans
+    empêcher les autres.
+
+    Args:
+        pid (int): Identifiant du processus
+        profile (Dict): affinity (liste de cœurs ou None), priority et io_priority
+
+    Returns:
+        Dict[str, str]: Réglage -> message d'erreur, pour les réglages non appliqués
+    """
+    import psutil
+    errors = {}
+    try:
+        process = psutil.Process(pid)
+    except psutil.Error as e:
+        return {'process': str(e)}
+
+    affinity = profile.get('affinity')
+    if affinity:
+        try:
+            available = set(range(psutil.cpu_count() or 1))
+            cpus = [cpu for cpu in affinity if cpu in available]
+            if cpus:
+                process.cpu_affinity(cpus)
+        except (psutil.Error, AttributeError, OSError, ValueError) as e:
+            errors['affinity'] = str(e)
+
+    steps = (
+        ('priority', PRIORITY_LEVELS, _set_priority),
+        ('io_priority', IO_PRIORITY_LEVELS, _set_io_priority)
+    )
+    for key, levels, setter in steps:
+        level = profile.get(key, 'normal')
+        if level == 'normal' or level not in levels:
+            continue
+        try:
+            setter(process, level)
+        except (psutil.Error, AttributeError, OSError, ValueError) as e:
+            errors[key] = str(e)
+
+    for key, message in errors.items():
+        logger.warning(f"Réglage {key} non appliqué au processus {pid}: {message}")
+    return errors
+
+
+class LauncherPriority:
+    """
+    Abaisse la priorité du launcher tant qu'un jeu tourne.
+
+    `lower` mémorise la priorité CPU et d'E/S d'origine du processus courant
+    avant de les abaisser ; `restore` les rétablit, et `restore_child` les
+    rend aux clients lancés entre-temps, qui ont hérité de la priorité basse. Sous POSIX, la priorité
+    CPU n'est abaissée que si elle pourra être rétablie sans droits
+    particuliers (RLIMIT_NICE). Les appels répétés sont sans effet.
+    """
+
+    def __init__(self):
+        self._saved = None
+
+    def lower(self) -> None:
+        """Passe le launcher en priorité basse (CPU et E/S)."""
+        if self._saved is not None:
+            return
+        import psutil
+        process = psutil.Process(os.getpid())
+        saved = {}
+        try:
+            nice = process.nice()
+            if self._can_restore(process, nice):
+                _set_priority(process, 'below_normal')
+                saved['nice'] = nice
+        except (psutil.Error, AttributeError, OSError) as e:
+            logger.warning(f"Impossible d'abaisser la priorité du launcher: {e}")
+        try:
+            saved['ionice'] = process.ionice()
+            _set_io_priority(process, 'low')
+        except (psutil.Error, AttributeError, OSError) as e:
+            logger.debug(f"Priorité d'E/S du launcher inchangée: {e}")
+        self._saved = saved
+
+    @staticmethod
+    def _can_restore(process, nice: int) -> bool:
+        """Sous POSIX, un processus sans droits ne peut pas remonter sa priorité une fois abaissée."""
+        if sys.platform == 'win32' or os.geteuid() == 0:
+            return True
+        import psutil
+        try:
+            # RLIMIT_NICE autorise une valeur nice minimale de 20 - limite
+            return 20 - process.rlimit(psutil.RLIMIT_NICE)[0] <= nice
+        except (psutil.Error, AttributeError, OSError):
+            return False
+
+    def restore(self) -> None:
+        """Rétablit la priorité d'origine du launcher."""
+        if self._saved is None:
+            return
+        import psutil
+        try:
+            self._apply_saved(psutil.Process(os.getpid()))
+        except (psutil.Error, AttributeError, OSError) as e:
+            # Sous POSIX, remonter la priorité peut demander des droits
+            logger.warning(f"Impossible de rétablir la priorité du launcher: {e}")
+        self._saved = None
+
+    def restore_child(self, pid: int) -> None:
+        """
+        Rend à un processus lancé pendant l'abaissement la priorité d'origine du launcher.
+
+        Un client démarré par Popen hérite de la priorité basse du launcher ;
+        il retrouve ainsi la priorité qu'il aurait eue, avant l'application
+        de son profil de lancement.
+
+        Args:
+            pid (int): Identifiant du processus enfant
+        """
+        if self._saved is None:
+            return
+        import psutil
+        try:
+            self._apply_saved(psutil.Process(pid))
+        except (psutil.Error, AttributeError, OSError) as e:
+            logger.warning(f"Impossible de rétablir la priorité du processus {pid}: {e}")
+
+    def _apply_saved(self, process) -> None:
+        if 'ionice' in self._saved:
+            ionice = self._saved['ionice']
+            if sys.platform == 'win32':
+                process.ionice(ionice)
+            else:
+                process.ionice(ionice.ioclass, ionice.value)
+        if 'nice' in self._saved:
+            process.nice(self._saved['nice'])
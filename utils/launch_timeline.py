@@ -0,0 +1,182 @@
+import sys
+import time
+import logging
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from .process_sampler import CpuMeter, PeriodicSampler
+
+logger = logging.getLogger(__name__)
+
+# Intervalle entre deux échantillons d'un lancement (secondes)
+DEFAULT_SAMPLE_INTERVAL = 0.5
+# Mémoire de travail à partir de laquelle le client est considéré affiché,
+# quand sa fenêtre ne peut pas être détectée (octets)
+DEFAULT_RSS_THRESHOLD = 150 * 1024 * 1024
+# Le chargement est terminé quand l'utilisation CPU reste sous cette fraction
+# du pic observé pendant IDLE_SAMPLES échantillons consécutifs
+IDLE_FRACTION = 0.5
+IDLE_SAMPLES = 4
+# Durée maximale de suivi d'un lancement (secondes)
+DEFAULT_TIMEOUT = 180.0
+
+
+def _find_window_pids():
+    """
+    Retourne une fonction indiquant si un processus a une fenêtre visible.
+
+    Utilise pywin32 sous Windows ; retourne None ailleurs (ou sans pywin32),
+    le seuil de mémoire servant alors de repère.
+    """
+    if sys.platform != 'win32':
+        return None
+    try:
+        import win32gui
+        import win32process
+    except ImportError:
+        return None
+
+    def visible_window_pids():
+        pids = set()
+
+        def collect(hwnd, _):
+            if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd):
+                pids.add(win32process.GetWindowThreadProcessId(hwnd)[1])
+            return True
+
+        win32gui.EnumWindows(collect, None)
+        return pids
+
+    return visible_window_pids
+
+
+class LaunchTimeline(PeriodicSampler):
+    """
+    Mesure la chronologie de chaque lancement d'un client.
+
+    Trois repères sont relevés, en secondes depuis l'appel à Popen :
+        popen: retour de Popen
+        window: première fenêtre visible du client, ou à défaut passage de sa
+            mémoire de travail au-dessus d'un seuil
+        idle: fin du pic de chargement, quand l'utilisation CPU retombe
+            durablement sous la moitié du pic observé
+
+    Un seul thread échantillonne tous les lancements en cours, un appel
+    psutil `oneshot()` par processus et par échantillon ; il s'arrête dès
+    qu'aucun lancement n'est en cours. Chaque chronologie terminée (repères
+    atteints, processus terminé ou délai dépassé) est enregistrée dans
+    l'historique des sessions.
+
+    Attributes:
+        interval (float): Intervalle entre deux échantillons
+        rss_threshold (int): Seuil de mémoire remplaçant la détection de fenêtre
+        timeout (float): Durée maximale de suivi d'un lancement
+    """
+
+    thread_name = "LaunchTimeline"
+
+    def __init__(self, session_store=None, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 rss_threshold: int = DEFAULT_RSS_THRESHOLD, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialise la mesure des lancements.
+
+        Args:
+            session_store: Historique des sessions où enregistrer les chronologies
+            interval (float): Intervalle entre deux échantillons (secondes)
+            rss_threshold (int): Seuil de mémoire de travail (octets)
+            timeout (float): Durée maximale de suivi d'un lancement (secondes)
+        """
+        super().__init__(interval)
+        self.session_store = session_store
+        self.rss_threshold = rss_threshold
+        self.timeout = timeout
+        self._launches: Dict[int, Dict] = {}
+        self._window_pids = _find_window_pids()
+
+    def track(self, version: str, pid: int, launched: float, popen_returned: float) -> None:
+        """
+        Commence la mesure d'un lancement.
+
+        Args:
+            version (str): Version du jeu
+            pid (int): PID du client
+            launched (float): Instant de l'appel à Popen (time.monotonic)
+            popen_returned (float): Instant du retour de Popen (time.monotonic)
+        """
+        with self._lock:
+            self._launches[pid] = {
+                'version': version,
+                'start': datetime.now().timestamp(),
+                'launched': launched,
+                'popen': popen_returned - launched,
+                'window': None,
+                'window_source': None,
+                'idle': None,
+                'process': None,
+                'cpu': CpuMeter(),
+                'peak_cpu': 0.0,
+                'quiet': 0
+            }
+            self._ensure_running()
+
+    def stop(self) -> None:
+        """Arrête l'échantillonnage ; les lancements en cours sont abandonnés."""
+        self._stop_thread()
+        with self._lock:
+            self._launches.clear()
+
+    def _items(self) -> List[Tuple[int, Dict]]:
+        return list(self._launches.items())
+
+    def _sample_all(self, psutil, launches: List[Tuple[int, Dict]]) -> None:
+        window_pids = None
+        if self._window_pids and any(info['window'] is None for _, info in launches):
+            try:
+                window_pids = self._window_pids()
+            except Exception as e:
+                logger.debug(f"Énumération des fenêtres impossible: {e}")
+        now = time.monotonic()
+        for pid, info in launches:
+            try:
+                done = self._sample(psutil, pid, info, now, window_pids)
+            except psutil.Error:
+                # Processus terminé ou inaccessible : la chronologie est close telle quelle
+                done = True
+            if done or now - info['launched'] >= self.timeout:
+                with self._lock:
+                    self._launches.pop(pid, None)
+                self._finish(pid, info)
+
+    def _sample(self, psutil, pid: int, info: Dict, now: float, window_pids) -> bool:
+        """Relève un échantillon ; retourne True une fois tous les repères atteints."""
+        if info['process'] is None:
+            info['process'] = psutil.Process(pid)
+        process = info['process']
+        with process.oneshot():
+            cpu_times = process.cpu_times()
+            rss = process.memory_info().rss
+        elapsed = now - info['launched']
+
+        if info['window'] is None:
+            if window_pids is not None and pid in window_pids:
+                info['window'], info['window_source'] = elapsed, 'window'
+            elif window_pids is None and rss >= self.rss_threshold:
+                info['window'], info['window_source'] = elapsed, 'rss'
+
+        cpu = info['cpu'].update(cpu_times, now)
+        if cpu is not None:
+            info['peak_cpu'] = max(info['peak_cpu'], cpu)
+            if info['window'] is not None and info['idle'] is None:
+                info['quiet'] = info['quiet'] + 1 if cpu < info['peak_cpu'] * IDLE_FRACTION else 0
+                if info['quiet'] >= IDLE_SAMPLES:
+                    # Le chargement s'est terminé au premier échantillon calme
+                    info['idle'] = elapsed - (IDLE_SAMPLES - 1) * self.interval
+        return info['idle'] is not None
+
+    def _finish(self, pid: int, info: Dict) -> None:
+        window, idle = ('-' if value is None else f"{value:.2f}s" for value in (info['window'], info['idle']))
+        logger.info(f"Lancement {info['version']} (PID: {pid}): Popen {info['popen']:.2f}s, "
+                    f"fenêtre {window} ({info['window_source']}), chargé {idle}")
+        if self.session_store:
+            self.session_store.record_launch(info['version'], info['start'], info['popen'],
+                                             info['window'], info['idle'], info['window_source'])
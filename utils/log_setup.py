@@ -0,0 +1,144 @@
+import os
+import time
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+# Taille maximale du fichier de log avant rotation et nombre d'archives conservées
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+# Nombre maximal d'enregistrements en attente d'écriture
+DEFAULT_QUEUE_SIZE = 10000
+# Niveaux par module (surchargés par la variable d'environnement TRI_LEGACY_LOG_LEVELS,
+# ex: "utils.process_monitor=DEBUG,PIL=WARNING")
+DEFAULT_MODULE_LEVELS = {
+    'PIL': logging.WARNING,
+    'utils.process_monitor': logging.INFO,
+    'utils.background_tracker': logging.INFO,
+    'utils.game_time_tracker': logging.INFO,
+}
+
+_listener: Optional[QueueListener] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limite le nombre de messages émis par un même point d'appel.
+
+    Au-delà de `max_records` messages en `period` secondes pour une même
+    ligne de code, les messages sont ignorés ; leur nombre est indiqué dans
+    le premier message accepté ensuite. Les avertissements et les erreurs ne
+    sont jamais filtrés.
+    """
+
+    def __init__(self, max_records: int = 10, period: float = 60.0):
+        super().__init__()
+        self.max_records = max_records
+        self.period = period
+        self._windows: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} messages similaires ignorés)"
+                return True
+            if window[1] < self.max_records:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler qui abandonne les messages plutôt que de bloquer si la file est pleine."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    levels = {}
+    for item in spec.split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def setup_logging(log_file: str, level: int = logging.INFO,
+                  module_levels: Optional[Dict[str, int]] = None,
+                  max_bytes: int = DEFAULT_MAX_BYTES,
+                  backup_count: int = DEFAULT_BACKUP_COUNT) -> None:
+    """
+    Configure une journalisation asynchrone avec rotation du fichier.
+
+    Les threads applicatifs ne font que déposer les messages dans une file
+    bornée ; un thread d'arrière-plan les écrit dans un fichier limité à
+    `max_bytes` octets et `backup_count` archives.
+
+    Args:
+        log_file (str): Chemin du fichier de log
+        level (int): Niveau global
+        module_levels (Optional[Dict[str, int]]): Niveaux spécifiques par module
+        max_bytes (int): Taille maximale du fichier avant rotation
+        backup_count (int): Nombre d'archives conservées
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.Queue(maxsize=DEFAULT_QUEUE_SIZE)
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    levels = dict(DEFAULT_MODULE_LEVELS)
+    levels.update(module_levels or {})
+    levels.update(_parse_levels(os.environ.get('TRI_LEGACY_LOG_LEVELS', '')))
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Écrit les messages en attente et arrête le thread de journalisation."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
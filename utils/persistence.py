@@ -0,0 +1,153 @@
+import os
+import json
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_text(path: str, text: str, encoding: str = 'utf-8', newline: Optional[str] = None) -> None:
+    """
+    Écrit un fichier texte de manière atomique.
+
+    Le contenu est d'abord écrit dans un fichier temporaire du même dossier,
+    synchronisé sur le disque puis renommé par-dessus la cible : un crash en
+    cours d'écriture laisse toujours l'ancienne ou la nouvelle version intacte.
+
+    Args:
+        path (str): Chemin du fichier cible
+        text (str): Contenu à écrire
+        encoding (str): Encodage du fichier
+        newline (Optional[str]): Fin de ligne imposée (voir `open`)
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline=newline) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Écrit un document JSON de manière atomique (voir `atomic_write_text`).
+
+    Args:
+        path (str): Chemin du fichier cible
+        data (Any): Données sérialisables en JSON
+        indent (Optional[int]): Indentation JSON (None pour un format compact)
+    """
+    separators = (',', ':') if indent is None else None
+    atomic_write_text(path, json.dumps(data, indent=indent, separators=separators))
+
+
+class WriteBehindWriter:
+    """
+    Regroupe les sauvegardes et les exécute en arrière-plan.
+
+    Les appelants signalent simplement que leurs données sont modifiées avec
+    `mark_dirty`. Un thread unique appelle `flush_callback` au plus une fois
+    par `flush_interval` secondes, quel que soit le nombre de modifications
+    intermédiaires. `request_flush` force une écriture au plus tôt et `close`
+    effectue la dernière écriture à l'arrêt.
+
+    Attributes:
+        flush_interval (float): Délai maximal entre deux écritures
+        dirty (bool): True si des modifications attendent d'être écrites
+    """
+
+    def __init__(self, flush_callback: Callable[[], None], flush_interval: float = 60.0, name: str = "WriteBehindWriter"):
+        """
+        Initialise l'écrivain différé.
+
+        Args:
+            flush_callback (Callable[[], None]): Fonction réalisant l'écriture
+            flush_interval (float): Délai maximal entre deux écritures (secondes)
+            name (str): Nom du thread d'écriture
+        """
+        self.flush_callback = flush_callback
+        self.flush_interval = max(0.1, float(flush_interval))
+        self.name = name
+        self.dirty = False
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def _ensure_thread(self) -> None:
+        """Démarre le thread d'écriture à la première modification."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def mark_dirty(self) -> None:
+        """Signale que les données ont changé et devront être écrites."""
+        with self._condition:
+            self.dirty = True
+            self._ensure_thread()
+
+    def request_flush(self) -> None:
+        """Demande une écriture immédiate par le thread d'arrière-plan."""
+        with self._condition:
+            self.dirty = True
+            self._flush_requested = True
+            self._ensure_thread()
+            self._condition.notify()
+
+    def flush(self) -> bool:
+        """
+        Écrit les données tout de suite dans le thread appelant si nécessaire.
+
+        Returns:
+            bool: True si une écriture a eu lieu
+        """
+        with self._flush_lock:
+            with self._condition:
+                if not self.dirty:
+                    return False
+                self.dirty = False
+                self._flush_requested = False
+            try:
+                self.flush_callback()
+                return True
+            except Exception as e:
+                logger.error(f"Erreur lors de l'écriture différée ({self.name}): {e}")
+                with self._condition:
+                    self.dirty = True
+                return False
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Arrête le thread et écrit les dernières modifications.
+
+        Args:
+            timeout (float): Délai d'attente maximal du thread d'écriture
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._flush_requested and not self._closed:
+                    self._condition.wait(timeout=self.flush_interval)
+                if self._closed:
+                    return
+            self.flush()
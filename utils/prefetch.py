@@ -0,0 +1,236 @@
+import os
+import sys
+import mmap
+import ctypes
+import ctypes.util
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Taille des plages préchargées entre deux vérifications d'annulation (octets)
+PREFETCH_CHUNK_SIZE = 32 * 1024 * 1024
+# Taille des fenêtres examinées par mincore (octets)
+RESIDENCY_WINDOW = 256 * 1024 * 1024
+# Fraction maximale de la mémoire disponible utilisée pour le préchargement
+MAX_AVAILABLE_FRACTION = 0.5
+# Nombre de fichiers préchargés en parallèle
+DEFAULT_MAX_WORKERS = 2
+# Budget par défaut (octets)
+DEFAULT_BUDGET = 2 * 1024 * 1024 * 1024
+
+_PROT_READ = 0x1
+_MAP_SHARED = 0x01
+_MAP_FAILED = ctypes.c_void_p(-1).value
+
+
+def _load_libc():
+    """Charge la libc pour mincore (None hors POSIX)."""
+    if sys.platform == 'win32':
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.mmap.restype = ctypes.c_void_p
+        libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_long]
+        libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+def find_data_files(game_path: str) -> List[str]:
+    """
+    Liste les archives MPQ d'une installation, dans l'ordre de préchargement.
+
+    Les archives de `Data` passent avant celles du dossier de langue
+    (`Data/frFR`...), et dans chaque dossier les archives de base avant les
+    correctifs (`patch*.MPQ`).
+
+    Args:
+        game_path (str): Chemin de l'exécutable du jeu
+
+    Returns:
+        List[str]: Chemins des archives
+    """
+    data_dir = os.path.join(os.path.dirname(game_path), 'Data')
+    files = []
+    try:
+        with os.scandir(data_dir) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith('.mpq'):
+                    files.append((0, entry.name.lower().startswith('patch'), entry.name.lower(), entry.path))
+        for depth, subdir in enumerate(sorted(subdirs), 1):
+            with os.scandir(subdir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith('.mpq'):
+                        files.append((depth, entry.name.lower().startswith('patch'), entry.name.lower(), entry.path))
+    except OSError as e:
+        logger.warning(f"Lecture impossible de {data_dir}: {e}")
+    return [item[3] for item in sorted(files)]
+
+
+def resident_bytes(path: str) -> Optional[int]:
+    """
+    Retourne le nombre d'octets d'un fichier présents dans le cache du système.
+
+    Utilise mincore sur une projection du fichier, par fenêtres pour borner
+    la mémoire ; retourne None si la mesure n'est pas disponible (Windows).
+
+    Args:
+        path (str): Chemin du fichier
+    """
+    if _libc is None:
+        return None
+    page_size = mmap.PAGESIZE
+    resident = 0
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        for offset in range(0, size, RESIDENCY_WINDOW):
+            length = min(RESIDENCY_WINDOW, size - offset)
+            address = _libc.mmap(None, length, _PROT_READ, _MAP_SHARED, f.fileno(), offset)
+            if address is None or address == _MAP_FAILED:
+                return None
+            try:
+                pages = (length + page_size - 1) // page_size
+                vector = (ctypes.c_ubyte * pages)()
+                if _libc.mincore(address, length, vector) != 0:
+                    return None
+                in_core = pages - bytes(vector).count(0)
+            finally:
+                _libc.munmap(address, length)
+            resident += min(in_core * page_size, length)
+    return resident
+
+
+class DataPrefetcher:
+    """
+    Précharge les archives du jeu dans le cache de fichiers du système.
+
+    Sous POSIX, posix_fadvise(WILLNEED) demande au noyau de lire les plages
+    en arrière-plan ; ailleurs, les plages sont lues par blocs dans un tampon
+    réutilisé. Les fichiers sont traités en parallèle par un petit pool de
+    threads, dans la limite d'un budget mémoire partagé (borné par la moitié
+    de la mémoire disponible), et le travail s'arrête entre deux plages dès
+    que l'événement d'annulation est levé.
+
+    Attributes:
+        max_workers (int): Nombre de fichiers préchargés simultanément
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialise le préchargeur.
+
+        Args:
+            max_workers (int): Nombre maximal de fichiers préchargés en parallèle
+        """
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def residency(files: List[str]) -> Tuple[Optional[int], int]:
+        """
+        Mesure la part des fichiers déjà en mémoire.
+
+        Returns:
+            Tuple[Optional[int], int]: (octets résidents ou None si non mesurable, taille totale)
+        """
+        resident = 0
+        total = 0
+        for path in files:
+            try:
+                total += os.path.getsize(path)
+                count = resident_bytes(path)
+            except OSError:
+                continue
+            resident = None if count is None or resident is None else resident + count
+        return resident, total
+
+    def prefetch(self, game_path: str, budget: int = DEFAULT_BUDGET,
+                 cancel_event: Optional[threading.Event] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Précharge les archives MPQ d'une installation.
+
+        Args:
+            game_path (str): Chemin de l'exécutable du jeu
+            budget (int): Nombre maximal d'octets préchargés
+            cancel_event (Optional[threading.Event]): Interrompt le préchargement une fois levé
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (octets préchargés, budget effectif)
+
+        Returns:
+            Dict: files, total (taille des archives), resident_before, prefetched,
+                resident_after (None si non mesurable) et cancelled
+        """
+        # Import différé : psutil n'est pas nécessaire au démarrage
+        import psutil
+        cancel_event = cancel_event or threading.Event()
+        files = find_data_files(game_path)
+        resident_before, total = self.residency(files)
+        budget = min(budget, int(psutil.virtual_memory().available * MAX_AVAILABLE_FRACTION))
+        state = {'reserved': 0, 'done': 0}
+        lock = threading.Lock()
+
+        def reserve(length):
+            """Réserve une plage dans le budget ; retourne la longueur accordée."""
+            with lock:
+                granted = max(0, min(length, budget - state['reserved']))
+                state['reserved'] += granted
+                return granted
+
+        def advance(length):
+            with lock:
+                state['done'] += length
+                done = state['done']
+            if progress:
+                progress(done, budget)
+
+        def prefetch_file(path):
+            try:
+                with open(path, 'rb', buffering=0) as f:
+                    size = os.fstat(f.fileno()).st_size
+                    buffer = None if hasattr(os, 'posix_fadvise') else bytearray(min(PREFETCH_CHUNK_SIZE, 1024 * 1024))
+                    for offset in range(0, size, PREFETCH_CHUNK_SIZE):
+                        if cancel_event.is_set():
+                            return
+                        length = reserve(min(PREFETCH_CHUNK_SIZE, size - offset))
+                        if not length:
+                            return
+                        if buffer is None:
+                            os.posix_fadvise(f.fileno(), offset, length, os.POSIX_FADV_WILLNEED)
+                        else:
+                            f.seek(offset)
+                            remaining = length
+                            while remaining > 0 and not cancel_event.is_set():
+                                read = f.readinto(buffer)
+                                if not read:
+                                    break
+                                remaining -= read
+                        advance(length)
+            except OSError as e:
+                logger.warning(f"Préchargement impossible de {path}: {e}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="DataPrefetch") as pool:
+            list(pool.map(prefetch_file, files))
+
+        resident_after, _ = self.residency(files)
+        report = {
+            'files': len(files),
+            'total': total,
+            'resident_before': resident_before,
+            'prefetched': state['done'],
+            'resident_after': resident_after,
+            'cancelled': cancel_event.is_set()
+        }
+        logger.info(f"Préchargement de {os.path.dirname(game_path)}: {report['prefetched']} octets sur "
+                    f"{len(files)} archives, résidents {resident_before} -> {resident_after}")
+        return report
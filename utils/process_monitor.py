@@ -0,0 +1,299 @@
+import os
+import sys
+import time
+import queue
+import logging
+import selectors
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .backend_loop import BackendLoop, WakePipe
+
+logger = logging.getLogger(__name__)
+
+# Intervalle par défaut entre deux battements par processus (secondes)
+DEFAULT_HEARTBEAT_INTERVAL = 10.0
+# Intervalle de vérification du mode dégradé par scrutation (secondes)
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class _PidfdBackend:
+    """Attente des fins de processus via pidfd et un sélecteur (Linux)."""
+
+    name = 'pidfd'
+
+    def __init__(self):
+        self.selector = selectors.DefaultSelector()
+        self.fds = {}
+        self._wake = WakePipe(self.selector)
+
+    def add(self, pid, process):
+        fd = os.pidfd_open(pid)
+        self.fds[pid] = fd
+        self.selector.register(fd, selectors.EVENT_READ, pid)
+
+    def remove(self, pid):
+        fd = self.fds.pop(pid, None)
+        if fd is not None:
+            self.selector.unregister(fd)
+            os.close(fd)
+
+    def wake(self):
+        self._wake.wake()
+
+    def wait(self, timeout):
+        exited = []
+        for key, _ in self.selector.select(timeout):
+            if key.data is None:
+                self._wake.drain()
+            else:
+                exited.append(key.data)
+        return exited
+
+    def close(self):
+        for pid in list(self.fds):
+            self.remove(pid)
+        self.selector.close()
+        self._wake.close()
+
+
+class _Win32Backend:
+    """Attente des fins de processus via WaitForMultipleObjects (Windows)."""
+
+    name = 'win32'
+    SYNCHRONIZE = 0x00100000
+    # WaitForMultipleObjects accepte 64 handles, dont un pour le réveil
+    MAX_HANDLES = 63
+
+    def __init__(self):
+        import win32api
+        import win32event
+        self.win32api = win32api
+        self.win32event = win32event
+        self.handles = {}
+        self._wake_event = win32event.CreateEvent(None, False, False, None)
+
+    def add(self, pid, process):
+        if len(self.handles) >= self.MAX_HANDLES:
+            raise RuntimeError("Trop de processus suivis pour WaitForMultipleObjects")
+        self.handles[pid] = self.win32api.OpenProcess(self.SYNCHRONIZE, False, pid)
+
+    def remove(self, pid):
+        handle = self.handles.pop(pid, None)
+        if handle is not None:
+            self.win32api.CloseHandle(handle)
+
+    def wake(self):
+        self.win32event.SetEvent(self._wake_event)
+
+    def wait(self, timeout):
+        pids = list(self.handles)
+        wait_handles = [self._wake_event] + [self.handles[pid] for pid in pids]
+        timeout_ms = self.win32event.INFINITE if timeout is None else int(timeout * 1000)
+        result = self.win32event.WaitForMultipleObjects(wait_handles, False, timeout_ms)
+        index = result - self.win32event.WAIT_OBJECT_0
+        if 1 <= index < len(wait_handles):
+            return [pids[index - 1]]
+        return []
+
+    def close(self):
+        for pid in list(self.handles):
+            self.remove(pid)
+        self.win32api.CloseHandle(self._wake_event)
+
+
+class _PollingBackend:
+    """Mode dégradé : vérifie les processus à intervalle fixe."""
+
+    name = 'poll'
+
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL):
+        import psutil
+        self.psutil = psutil
+        self.poll_interval = poll_interval
+        self.processes = {}
+        self._wake_event = threading.Event()
+
+    def add(self, pid, process):
+        self.processes[pid] = process
+
+    def remove(self, pid):
+        self.processes.pop(pid, None)
+
+    def wake(self):
+        self._wake_event.set()
+
+    def wait(self, timeout):
+        if self.processes:
+            timeout = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+        exited = []
+        for pid, process in self.processes.items():
+            if process is not None and hasattr(process, 'poll'):
+                if process.poll() is not None:
+                    exited.append(pid)
+            elif not self.psutil.pid_exists(pid):
+                exited.append(pid)
+        return exited
+
+    def close(self):
+        self.processes.clear()
+
+
+def _create_backend(poll_interval):
+    """Choisit le meilleur mécanisme d'attente disponible."""
+    if hasattr(os, 'pidfd_open'):
+        try:
+            return _PidfdBackend()
+        except OSError as e:
+            logger.warning(f"pidfd indisponible, repli sur un autre mécanisme: {e}")
+    if sys.platform == 'win32':
+        try:
+            return _Win32Backend()
+        except ImportError as e:
+            logger.warning(f"pywin32 indisponible, repli sur la scrutation: {e}")
+    return _PollingBackend(poll_interval)
+
+
+class ProcessMonitor(BackendLoop):
+    """
+    Surveille un nombre quelconque de processus depuis un seul thread.
+
+    Le thread reste bloqué dans l'attente du système (pidfd, handles Windows)
+    jusqu'à la fin d'un processus ou au prochain battement : il ne consomme
+    rien entre deux événements. Chaque événement est transmis aux écouteurs
+    (appelés dans le thread du moniteur) et déposé dans la file `events`
+    destinée à l'interface.
+
+    Un événement est un dictionnaire :
+        type (str): 'heartbeat' ou 'exit'
+        pid (int): PID du processus
+        tag: Étiquette fournie à `watch` (version du jeu)
+        elapsed (float): Secondes écoulées depuis le battement précédent
+        returncode (Optional[int]): Code de retour (événement 'exit')
+
+    Attributes:
+        heartbeat_interval (float): Intervalle entre deux battements
+        events (queue.Queue): File des événements pour l'interface
+    """
+
+    thread_name = "ProcessMonitor"
+
+    def __init__(self, heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 wakeup: Optional[Callable[[], None]] = None):
+        """
+        Initialise le moniteur.
+
+        Args:
+            heartbeat_interval (float): Intervalle entre deux battements (secondes)
+            poll_interval (float): Intervalle du mode dégradé par scrutation (secondes)
+            wakeup (Optional[Callable[[], None]]): Appelée après chaque dépôt dans `events`
+                (réveil de l'interface)
+        """
+        super().__init__()
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.wakeup = wakeup
+        self.events = queue.Queue()
+        self._listeners: List[Callable[[Dict], None]] = []
+        self._watched: Dict[int, Dict] = {}
+
+    def add_listener(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Ajoute un écouteur appelé dans le thread du moniteur pour chaque événement.
+
+        Args:
+            callback (Callable[[Dict], None]): Fonction recevant l'événement
+        """
+        self._listeners.append(callback)
+
+    def watch(self, pid: int, tag=None, process=None) -> None:
+        """
+        Commence la surveillance d'un processus.
+
+        Args:
+            pid (int): PID du processus
+            tag: Étiquette renvoyée dans les événements
+            process: Objet `subprocess.Popen` éventuel, utilisé pour récupérer le code de retour
+        """
+        self._send(('watch', pid, tag, process))
+
+    def unwatch(self, pid: int) -> None:
+        """
+        Arrête la surveillance d'un processus sans émettre d'événement.
+
+        Args:
+            pid (int): PID du processus
+        """
+        self._send(('unwatch', pid, None, None), start=False)
+
+    def _create_backend(self):
+        return _create_backend(self.poll_interval)
+
+    def _handle_command(self, command) -> None:
+        action, pid, tag, process = command
+        if action == 'watch':
+            now = time.monotonic()
+            # Une surveillance réinscrite (nouveau mécanisme d'attente) garde son dernier battement
+            previous = self._watched.get(pid)
+            last_beat = previous['last_beat'] if previous else now
+            self._watched[pid] = {'tag': tag, 'process': process, 'last_beat': last_beat}
+            try:
+                self._backend.add(pid, process)
+            except Exception as e:
+                logger.info(f"Processus {pid} introuvable à l'enregistrement: {e}")
+                self._emit_exit(pid, now)
+        elif action == 'unwatch' and pid in self._watched:
+            self._backend.remove(pid)
+            del self._watched[pid]
+
+    def _active_commands(self):
+        return [('watch', pid, info['tag'], info['process']) for pid, info in self._watched.items()]
+
+    def _on_exit(self) -> None:
+        self._watched.clear()
+
+    def _emit(self, event: Dict) -> None:
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Erreur dans un écouteur du moniteur de processus: {e}")
+        self.events.put(event)
+        if self.wakeup:
+            self.wakeup()
+
+    def _emit_exit(self, pid: int, now: float) -> None:
+        info = self._watched.pop(pid, None)
+        if info is None:
+            return
+        self._backend.remove(pid)
+        returncode = None
+        process = info['process']
+        if process is not None and hasattr(process, 'poll'):
+            # Récupère le code de retour et évite un processus zombie
+            returncode = process.poll()
+        self._emit({'type': 'exit', 'pid': pid, 'tag': info['tag'],
+                    'elapsed': now - info['last_beat'], 'returncode': returncode})
+
+    def _next_timeout(self, now: float) -> Optional[float]:
+        if not self._watched:
+            return None
+        next_beat = min(info['last_beat'] for info in self._watched.values()) + self.heartbeat_interval
+        return max(0.0, next_beat - now)
+
+    def _iterate(self) -> None:
+        """Attend le prochain événement et le traite."""
+        self._apply_commands()
+        exited = self._backend.wait(self._next_timeout(time.monotonic()))
+        now = time.monotonic()
+        for pid in exited:
+            self._emit_exit(pid, now)
+        for pid, info in list(self._watched.items()):
+            if now - info['last_beat'] >= self.heartbeat_interval:
+                elapsed = now - info['last_beat']
+                info['last_beat'] = now
+                self._emit({'type': 'heartbeat', 'pid': pid, 'tag': info['tag'],
+                            'elapsed': elapsed, 'returncode': None})
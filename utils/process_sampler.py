@@ -0,0 +1,99 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CpuMeter:
+    """
+    Utilisation CPU d'un processus entre deux échantillons successifs.
+
+    psutil ne fournit que le temps CPU cumulé ; le pourcentage est calculé
+    à partir de l'écart avec l'échantillon précédent.
+    """
+
+    def __init__(self):
+        self._cpu_time = None
+        self._sampled_at = None
+
+    def update(self, cpu_times, now: float) -> Optional[float]:
+        """
+        Enregistre un échantillon.
+
+        Args:
+            cpu_times: Résultat de `Process.cpu_times()`
+            now (float): Instant de l'échantillon (time.monotonic)
+
+        Returns:
+            Optional[float]: Pourcentage d'un cœur utilisé depuis l'échantillon
+                précédent, None pour le premier échantillon (référence)
+        """
+        cpu_time = cpu_times.user + cpu_times.system
+        cpu = None
+        if self._cpu_time is not None and now > self._sampled_at:
+            cpu = (cpu_time - self._cpu_time) / (now - self._sampled_at) * 100
+        self._cpu_time, self._sampled_at = cpu_time, now
+        return cpu
+
+
+class PeriodicSampler(ABC):
+    """
+    Thread d'échantillonnage périodique démarré à la demande.
+
+    Le thread est lancé par le premier élément suivi et s'arrête de lui-même
+    dès qu'il n'y a plus rien à échantillonner ; le suivi suivant le relance.
+
+    Les sous-classes implémentent les méthodes abstraites _items et _sample_all.
+
+    Attributes:
+        interval (float): Intervalle entre deux échantillons
+    """
+
+    thread_name = "PeriodicSampler"
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @abstractmethod
+    def _items(self) -> List:
+        """Retourne les éléments à échantillonner (appelé sous le verrou)."""
+
+    @abstractmethod
+    def _sample_all(self, psutil, items: List) -> None:
+        """Relève un échantillon de chaque élément."""
+
+    def _ensure_running(self) -> None:
+        """Démarre le thread s'il ne tourne pas (à appeler sous le verrou)."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._thread.start()
+
+    def _stop_thread(self, timeout: float = 2.0) -> None:
+        """Arrête le thread et attend sa fin."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        with self._lock:
+            self._thread = None
+
+    def _run(self) -> None:
+        # Import différé : psutil n'est pas nécessaire au démarrage
+        import psutil
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                items = self._items()
+                if not items:
+                    # Le thread est relancé par le prochain élément suivi
+                    self._thread = None
+                    return
+            try:
+                self._sample_all(psutil, items)
+            except Exception as e:
+                logger.error(f"Erreur dans {self.thread_name}: {e}")
@@ -1,6 +1,6 @@
-import psutil
-
 def is_wow_running(pid):
+    # Import différé : psutil n'est pas nécessaire au démarrage
+    import psutil
     try:
         process = psutil.Process(pid)
         return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
@@ -0,0 +1,211 @@
+import os
+import re
+import heapq
+import logging
+import zipfile
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Taille des lectures et des écritures vers l'archive (octets)
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+# Nombre de variables les plus lourdes conservées dans le rapport
+DEFAULT_TOP_VARIABLES = 20
+# Addons intégrés au client : leurs SavedVariables ne sont jamais orphelines
+BUILTIN_PREFIX = 'blizzard_'
+
+# Affectation d'une variable globale en début de ligne : « NomVariable = {»
+_ASSIGNMENT_RE = re.compile(rb'^([A-Za-z_][A-Za-z0-9_]*)\s*=')
+
+
+def format_size(size: int) -> str:
+    """Formate une taille en octets pour l'affichage (Ko, Mo, Go)."""
+    for unit in ('o', 'Ko', 'Mo'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'o' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Go"
+
+
+def _subdirs(path: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def iter_saved_variable_files(wtf_dir: str):
+    """
+    Parcourt les fichiers SavedVariables d'un dossier WTF.
+
+    Produit des tuples (chemin, addon, compte, personnage) où personnage vaut
+    None pour les fichiers de compte (`Account/<Compte>/SavedVariables`) et
+    « Royaume/Personnage » pour `Account/<Compte>/<Royaume>/<Personnage>/SavedVariables`.
+
+    Args:
+        wtf_dir (str): Dossier WTF de l'installation
+    """
+    def lua_files(folder):
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.lua.bak'):
+                        yield entry, name[:-8]
+                    elif name.endswith('.lua'):
+                        yield entry, name[:-4]
+        except OSError:
+            return
+
+    for account in _subdirs(os.path.join(wtf_dir, 'Account')):
+        for entry, addon in lua_files(os.path.join(account.path, 'SavedVariables')):
+            yield entry, addon, account.name, None
+        for realm in _subdirs(account.path):
+            if realm.name.lower() == 'savedvariables':
+                continue
+            for character in _subdirs(realm.path):
+                for entry, addon in lua_files(os.path.join(character.path, 'SavedVariables')):
+                    yield entry, addon, account.name, f"{realm.name}/{character.name}"
+
+
+class SavedVariablesAnalyzer:
+    """
+    Analyse et archive les SavedVariables d'une installation en une passe.
+
+    Chaque fichier est lu une seule fois, ligne par ligne et sans être chargé
+    entièrement : la taille de chaque variable globale (`Nom = {...}`) est
+    mesurée au fil de la lecture et, si une archive est demandée, les mêmes
+    octets sont compressés dans le zip au passage. La mémoire utilisée ne
+    dépend pas de la taille du dossier WTF.
+
+    Attributes:
+        wtf_dir (str): Dossier WTF analysé
+    """
+
+    def __init__(self, wtf_dir: str):
+        """
+        Initialise l'analyseur.
+
+        Args:
+            wtf_dir (str): Dossier WTF de l'installation
+        """
+        self.wtf_dir = wtf_dir
+
+    @staticmethod
+    def is_orphan(addon: str, installed: Iterable[str]) -> bool:
+        """Indique si un fichier SavedVariables n'appartient à aucun addon installé."""
+        return not addon.lower().startswith(BUILTIN_PREFIX) and addon.lower() not in installed
+
+    def analyze(self, installed_addons: Iterable[str], archive_path: Optional[str] = None,
+                archive_orphans_only: bool = True, trim: bool = False,
+                top_variables: int = DEFAULT_TOP_VARIABLES,
+                progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Analyse le dossier WTF et archive éventuellement les fichiers.
+
+        Args:
+            installed_addons (Iterable[str]): Noms des addons installés
+            archive_path (Optional[str]): Archive zip à créer si des fichiers sont archivés (None : analyse seule)
+            archive_orphans_only (bool): N'archiver que les SavedVariables orphelines
+            trim (bool): Supprimer les fichiers archivés une fois l'archive fermée
+            top_variables (int): Nombre de variables les plus lourdes à rapporter
+            progress (Optional[Callable[[int, int], None]]): Appelée avec (fichiers lus, octets lus)
+
+        Returns:
+            Dict: total, files, by_addon, by_account, by_character, top_variables,
+                orphans (chemins), orphan_bytes, archived (chemins archivés) et removed
+        """
+        installed = {name.lower() for name in installed_addons}
+        report = {
+            'total': 0, 'files': 0,
+            'by_addon': {}, 'by_account': {}, 'by_character': {},
+            'top_variables': [], 'orphans': [], 'orphan_bytes': 0,
+            'archived': [], 'removed': 0
+        }
+        variables: Dict[tuple, int] = {}
+        # L'archive n'est créée qu'au premier fichier à archiver
+        archive = None
+        try:
+            for entry, addon, account, character in iter_saved_variable_files(self.wtf_dir):
+                orphan = self.is_orphan(addon, installed)
+                arcname = None
+                if archive_path and (orphan or not archive_orphans_only):
+                    if archive is None:
+                        archive = zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED)
+                    arcname = os.path.relpath(entry.path, self.wtf_dir).replace(os.sep, '/')
+                try:
+                    size = self._scan_file(entry.path, addon, variables, archive, arcname)
+                except OSError as e:
+                    logger.warning(f"Lecture impossible de {entry.path}: {e}")
+                    continue
+
+                report['files'] += 1
+                report['total'] += size
+                report['by_addon'][addon] = report['by_addon'].get(addon, 0) + size
+                report['by_account'][account] = report['by_account'].get(account, 0) + size
+                if character is not None:
+                    key = f"{account}/{character}"
+                    report['by_character'][key] = report['by_character'].get(key, 0) + size
+                if orphan:
+                    report['orphans'].append(entry.path)
+                    report['orphan_bytes'] += size
+                if arcname is not None:
+                    report['archived'].append(entry.path)
+                if progress:
+                    progress(report['files'], report['total'])
+        finally:
+            if archive is not None:
+                archive.close()
+
+        if trim and archive is not None:
+            for path in report['archived']:
+                try:
+                    os.remove(path)
+                    report['removed'] += 1
+                except OSError as e:
+                    logger.warning(f"Suppression impossible de {path}: {e}")
+
+        report['top_variables'] = [
+            {'addon': addon, 'variable': name, 'size': size}
+            for (addon, name), size in heapq.nlargest(top_variables, variables.items(), key=lambda item: item[1])
+        ]
+        logger.info(f"SavedVariables de {self.wtf_dir}: {report['files']} fichiers, {report['total']} octets, "
+                    f"{len(report['orphans'])} orphelins, {len(report['archived'])} archivés")
+        return report
+
+    @staticmethod
+    def _scan_file(path: str, addon: str, variables: Dict[tuple, int],
+                   archive: Optional[zipfile.ZipFile], arcname: Optional[str]) -> int:
+        """Lit un fichier une fois : taille par variable et copie éventuelle dans l'archive."""
+        size = 0
+        current = None
+        with open(path, 'rb') as source:
+            destination = archive.open(arcname, 'w', force_zip64=True) if arcname is not None else None
+            try:
+                pending = []
+                pending_size = 0
+                line_start = True
+                # Lecture bornée : une ligne géante est traitée par morceaux
+                for line in iter(lambda: source.readline(ARCHIVE_CHUNK_SIZE), b''):
+                    length = len(line)
+                    size += length
+                    match = _ASSIGNMENT_RE.match(line) if line_start else None
+                    line_start = line.endswith(b'\n')
+                    if match:
+                        current = (addon, match.group(1).decode('ascii'))
+                    if current is not None:
+                        variables[current] = variables.get(current, 0) + length
+                    if destination is not None:
+                        pending.append(line)
+                        pending_size += length
+                        if pending_size >= ARCHIVE_CHUNK_SIZE:
+                            destination.write(b''.join(pending))
+                            pending = []
+                            pending_size = 0
+                if destination is not None and pending:
+                    destination.write(b''.join(pending))
+            finally:
+                if destination is not None:
+                    destination.close()
+        return size
@@ -0,0 +1,381 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from .persistence import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Version du format du journal et de l'instantané
+JOURNAL_SCHEMA = 1
+# Nombre d'enregistrements ajoutés avant une compaction en arrière-plan
+DEFAULT_COMPACT_THRESHOLD = 5000
+
+
+class SessionJournal:
+    """
+    Journal append-only des sessions de jeu.
+
+    Chaque événement (début, battement, fin de session) est ajouté en une
+    ligne JSON à la fin du fichier : l'ajout est en O(1) et un crash ne peut
+    corrompre au pire que la dernière ligne, ignorée à la relecture.
+
+    Une compaction en arrière-plan replie régulièrement le journal dans un
+    instantané (totaux par version et sessions encore ouvertes) puis repart
+    d'un journal réduit ; le temps de chargement reste donc constant quelle
+    que soit l'ancienneté de l'historique. Chaque instantané indique la
+    génération du journal qu'il couvre (reprise dans l'en-tête du journal)
+    et la position jusqu'à laquelle il le couvre : après un crash pendant la
+    compaction, seule la suite du journal est rejouée.
+
+    Les totaux initiaux (`seed_totals`) ne sont utilisés qu'à la création du
+    journal : ils sont inscrits dans son en-tête et relus depuis celui-ci,
+    jamais repris des paramètres lors des démarrages suivants.
+
+    Attributes:
+        journal_file (str): Chemin du journal
+        snapshot_file (str): Chemin de l'instantané
+        totals (dict): Temps total par version des sessions terminées
+        open_sessions (dict): Sessions en cours, indexées par identifiant
+    """
+
+    def __init__(self, data_dir: str, journal_file: str = "sessions.journal",
+                 snapshot_file: str = "sessions_snapshot.json",
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+                 seed_totals: Optional[Dict[str, int]] = None):
+        """
+        Initialise le journal et reconstruit l'état à partir du disque.
+
+        Args:
+            data_dir (str): Dossier des données
+            journal_file (str): Nom du fichier journal
+            snapshot_file (str): Nom du fichier d'instantané
+            compact_threshold (int): Nombre d'ajouts déclenchant une compaction
+            seed_totals (Optional[Dict[str, int]]): Totaux initiaux, retenus à la création du journal
+        """
+        self.data_dir = data_dir
+        self.journal_file = os.path.join(data_dir, journal_file)
+        self.snapshot_file = os.path.join(data_dir, snapshot_file)
+        self.compact_threshold = compact_threshold
+        self.totals: Dict[str, int] = {}
+        self.session_counts: Dict[str, int] = {}
+        self.open_sessions: Dict[str, Dict] = {}
+        self.generation = 0
+        self._appended = 0
+        self._lock = threading.RLock()
+        self._compact_thread = None
+        self._handle = None
+        self._stale_journal = False
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._load(seed_totals or {})
+        self._open_journal()
+
+    # --- Chargement -----------------------------------------------------
+
+    def _load(self, seed_totals: Dict[str, int]) -> None:
+        """Charge l'instantané puis rejoue la partie du journal qu'il ne couvre pas."""
+        snapshot = None
+        if os.path.exists(self.snapshot_file):
+            try:
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+            except Exception as e:
+                logger.error(f"Instantané de sessions illisible, reconstruction depuis le journal: {e}")
+
+        if snapshot:
+            self.generation = snapshot.get('generation', 0) + 1
+            self.totals = {k: int(v) for k, v in snapshot.get('totals', {}).items()}
+            self.session_counts = {k: int(v) for k, v in snapshot.get('sessions', {}).items()}
+            self.open_sessions = snapshot.get('open_sessions', {})
+
+        if not os.path.exists(self.journal_file) or os.path.getsize(self.journal_file) == 0:
+            if not snapshot:
+                # Nouveau journal : les totaux initiaux seront inscrits dans son en-tête
+                self.totals = {k: int(v) for k, v in seed_totals.items()}
+            return
+
+        replayed = 0
+        with open(self.journal_file, 'rb') as f:
+            header = self._parse(f.readline()) or {}
+            if header.get('t') != 'header':
+                header = {}
+                f.seek(0)
+            journal_generation = header.get('gen', 0)
+            if snapshot:
+                snapshot_generation = snapshot.get('generation', 0)
+                if journal_generation < snapshot_generation:
+                    # Journal déjà replié dans l'instantané (crash pendant la compaction) :
+                    # il sera remplacé par un journal vide de la génération suivante
+                    logger.info("Journal de sessions obsolète ignoré")
+                    self._stale_journal = True
+                    return
+                if journal_generation == snapshot_generation:
+                    # Crash avant le remplacement du journal : seule la fin reste à rejouer
+                    f.seek(max(f.tell(), snapshot.get('offset', 0)))
+            else:
+                # Totaux de départ inscrits à la création du journal
+                self.totals = {k: int(v) for k, v in header.get('base', {}).items()}
+            self.generation = journal_generation
+            for line in f:
+                record = self._parse(line)
+                if record is None or record.get('t') == 'header':
+                    continue
+                self._apply(record)
+                replayed += 1
+        self._appended = replayed
+        logger.info(f"Journal de sessions rejoué: {replayed} enregistrements")
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[Dict]:
+        """Décode une ligne du journal ; None si elle est vide ou tronquée."""
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            # Dernière ligne tronquée par un crash
+            logger.warning(f"Enregistrement de journal ignoré: {line[:80]!r}")
+            return None
+
+    def _apply(self, record: Dict) -> None:
+        """Applique un enregistrement à l'état en mémoire."""
+        kind = record.get('t')
+        session_id = record.get('id')
+        if kind == 'start':
+            self.open_sessions[session_id] = {
+                'version': record['v'],
+                'start': record['ts'],
+                'elapsed': 0,
+                'pid': record.get('pid'),
+                'base': record.get('b')
+            }
+        elif kind == 'beat':
+            session = self.open_sessions.get(session_id)
+            if session:
+                session['elapsed'] = max(session['elapsed'], int(record['e']))
+        elif kind == 'stop':
+            session = self.open_sessions.pop(session_id, None)
+            if session:
+                version = session['version']
+                elapsed = max(session['elapsed'], int(record['e']))
+                self.totals[version] = self.totals.get(version, 0) + elapsed
+                self.session_counts[version] = self.session_counts.get(version, 0) + 1
+
+    # --- Écriture -------------------------------------------------------
+
+    def _open_journal(self) -> None:
+        new_file = (self._stale_journal or not os.path.exists(self.journal_file)
+                    or os.path.getsize(self.journal_file) == 0)
+        torn_tail = False
+        if not new_file:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn_tail = f.read(1) != b'\n'
+        # Un journal obsolète est tronqué : y ajouter des enregistrements les perdrait au prochain chargement
+        self._handle = open(self.journal_file, 'w' if new_file else 'a', encoding='utf-8')
+        self._stale_journal = False
+        if new_file:
+            self._write_line({'t': 'header', 'gen': self.generation, 'schema': JOURNAL_SCHEMA,
+                              'base': self.totals}, sync=True)
+        elif torn_tail:
+            # Isoler la ligne tronquée pour ne pas y coller le prochain enregistrement
+            self._handle.write('\n')
+            self._handle.flush()
+
+    def _write_line(self, record: Dict, sync: bool = False) -> None:
+        self._handle.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._handle.flush()
+        if sync:
+            os.fsync(self._handle.fileno())
+
+    def _append(self, record: Dict, sync: bool = False) -> None:
+        """Ajoute un enregistrement au journal et l'applique."""
+        with self._lock:
+            if self._handle is None:
+                return
+            self._write_line(record, sync)
+            self._apply(record)
+            self._appended += 1
+            if self._appended >= self.compact_threshold:
+                self._schedule_compaction()
+
+    def start_session(self, version: str, pid: Optional[int] = None, base: Optional[int] = None) -> str:
+        """
+        Enregistre le début d'une session.
+
+        Args:
+            version (str): Version du jeu
+            pid (Optional[int]): PID du processus du jeu
+            base (Optional[int]): Temps de jeu déjà crédité à la version au début de la session
+
+        Returns:
+            str: Identifiant de la session
+        """
+        session_id = uuid.uuid4().hex
+        try:
+            self._append({'t': 'start', 'id': session_id, 'v': version, 'ts': int(time.time()), 'pid': pid,
+                          'b': base}, sync=True)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'écriture du début de session pour {version}: {e}")
+        return session_id
+
+    def heartbeat(self, session_id: str, elapsed: int) -> None:
+        """
+        Enregistre le temps écoulé d'une session en cours.
+
+        Args:
+            session_id (str): Identifiant de la session
+            elapsed (int): Temps de jeu de la session (secondes)
+        """
+        try:
+            self._append({'t': 'beat', 'id': session_id, 'e': int(elapsed)})
+        except Exception as e:
+            logger.error(f"Erreur lors de l'écriture du battement de session {session_id}: {e}")
+
+    def stop_session(self, session_id: str, elapsed: int) -> None:
+        """
+        Enregistre la fin d'une session.
+
+        Args:
+            session_id (str): Identifiant de la session
+            elapsed (int): Temps de jeu total de la session (secondes)
+        """
+        try:
+            self._append({'t': 'stop', 'id': session_id, 'e': int(elapsed), 'ts': int(time.time())}, sync=True)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'écriture de fin de session {session_id}: {e}")
+
+    def recover(self) -> List[Dict]:
+        """
+        Clôt les sessions restées ouvertes après un crash.
+
+        Leur temps est crédité jusqu'au dernier battement enregistré.
+
+        Returns:
+            List[Dict]: Sessions récupérées (id, version, start, elapsed et base, le temps
+                de jeu de la version au début de la session ou None s'il est inconnu)
+        """
+        with self._lock:
+            orphans = list(self.open_sessions.items())
+        recovered = []
+        for session_id, session in orphans:
+            self.stop_session(session_id, session['elapsed'])
+            recovered.append({'id': session_id, 'version': session['version'], 'start': session['start'],
+                              'elapsed': session['elapsed'], 'base': session.get('base')})
+            logger.info(f"Session {session['version']} récupérée après crash: {session['elapsed']}s")
+        return recovered
+
+    # --- Lecture --------------------------------------------------------
+
+    def get_total(self, version: str) -> int:
+        """
+        Retourne le temps total d'une version, sessions en cours comprises.
+
+        Args:
+            version (str): Version du jeu
+
+        Returns:
+            int: Temps total en secondes
+        """
+        with self._lock:
+            total = self.totals.get(version, 0)
+            for session in self.open_sessions.values():
+                if session['version'] == version:
+                    total += session['elapsed']
+            return total
+
+    # --- Compaction -----------------------------------------------------
+
+    def _schedule_compaction(self) -> None:
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            return
+        self._compact_thread = threading.Thread(target=self.compact, name="SessionJournalCompaction", daemon=True)
+        self._compact_thread.start()
+
+    def compact(self) -> None:
+        """
+        Replie le journal dans un nouvel instantané et repart d'un journal réduit.
+
+        Le verrou n'est tenu que pour copier l'état et pour échanger les
+        fichiers : l'écriture de l'instantané et du nouveau journal ne bloque
+        pas les battements et fins de session.
+        """
+        tmp_path = self.journal_file + '.tmp'
+        try:
+            with self._lock:
+                if self._handle is None:
+                    return
+                generation = self.generation
+                offset = self._journal_size()
+                snapshot = {
+                    'schema': JOURNAL_SCHEMA,
+                    'generation': generation,
+                    'offset': offset,
+                    'totals': dict(self.totals),
+                    'sessions': dict(self.session_counts),
+                    'open_sessions': {k: dict(v) for k, v in self.open_sessions.items()}
+                }
+            # L'instantané couvre le journal courant jusqu'à `offset` : après un
+            # crash, seule la suite du journal est rejouée.
+            atomic_write_json(self.snapshot_file, snapshot)
+
+            # Nouveau journal : en-tête de la génération suivante, puis
+            # enregistrements ajoutés depuis la copie de l'état
+            with self._lock:
+                copied = self._journal_size()
+            header = json.dumps({'t': 'header', 'gen': generation + 1, 'schema': JOURNAL_SCHEMA}) + '\n'
+            tail = self._read_journal(offset, copied)
+            with open(tmp_path, 'wb') as f:
+                f.write(header.encode('utf-8') + tail)
+                f.flush()
+                os.fsync(f.fileno())
+
+            with self._lock:
+                if self._handle is None:
+                    os.remove(tmp_path)
+                    return
+                end = self._journal_size()
+                if end > copied:
+                    # Quelques enregistrements ajoutés pendant l'écriture du nouveau journal
+                    extra = self._read_journal(copied, end)
+                    tail += extra
+                    with open(tmp_path, 'ab') as f:
+                        f.write(extra)
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._handle.close()
+                os.replace(tmp_path, self.journal_file)
+                self._handle = open(self.journal_file, 'a', encoding='utf-8')
+                self.generation = generation + 1
+                self._appended = tail.count(b'\n')
+            logger.info(f"Journal de sessions compacté (génération {generation + 1})")
+        except Exception as e:
+            logger.error(f"Erreur lors de la compaction du journal de sessions: {e}")
+            with self._lock:
+                if self._handle is not None and self._handle.closed:
+                    self._handle = open(self.journal_file, 'a', encoding='utf-8')
+
+    def _journal_size(self) -> int:
+        """Retourne la taille du journal courant, écritures en attente comprises (sous le verrou)."""
+        self._handle.flush()
+        return os.fstat(self._handle.fileno()).st_size
+
+    def _read_journal(self, start: int, end: int) -> bytes:
+        with open(self.journal_file, 'rb') as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def close(self) -> None:
+        """Attend la fin d'une compaction éventuelle et ferme le journal."""
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join(timeout=5)
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
@@ -0,0 +1,353 @@
+import os
+import math
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Version du schéma de la base de sessions
+STORE_SCHEMA = 3
+
+VERSIONS = ('vanilla', 'tbc', 'wotlk')
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    source TEXT NOT NULL DEFAULT 'live'
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_version_start ON sessions (version, start);
+CREATE INDEX IF NOT EXISTS idx_sessions_version_duration ON sessions (version, duration);
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    popen REAL NOT NULL,
+    to_window REAL,
+    to_idle REAL,
+    window_source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_launches_version_start ON launches (version, start);
+CREATE TABLE IF NOT EXISTS telemetry (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    peak_rss INTEGER NOT NULL,
+    mean_cpu REAL NOT NULL,
+    read_bytes INTEGER NOT NULL,
+    write_bytes INTEGER NOT NULL,
+    peak_threads INTEGER NOT NULL,
+    peak_handles INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_telemetry_version_start ON telemetry (version, start);
+"""
+
+# Requêtes d'agrégation. Les chaînes sont constantes : sqlite3 garde les
+# instructions compilées dans son cache et ne les prépare qu'une fois.
+INSERT_SESSION_SQL = "INSERT INTO sessions (version, start, duration, source) VALUES (?, ?, ?, ?)"
+
+INSERT_LAUNCH_SQL = """
+INSERT INTO launches (version, start, popen, to_window, to_idle, window_source)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Derniers lancements de chaque version, du plus récent au plus ancien
+RECENT_LAUNCHES_SQL = """
+SELECT version, popen, to_window, to_idle
+FROM (
+    SELECT version, popen, to_window, to_idle,
+           ROW_NUMBER() OVER (PARTITION BY version ORDER BY start DESC) AS rank
+    FROM launches
+)
+WHERE rank <= ?
+"""
+
+TELEMETRY_COLUMNS = ('start', 'duration', 'samples', 'peak_rss', 'mean_cpu', 'read_bytes', 'write_bytes',
+                     'peak_threads', 'peak_handles')
+
+INSERT_TELEMETRY_SQL = (f"INSERT INTO telemetry (version, {', '.join(TELEMETRY_COLUMNS)}) "
+                        f"VALUES (?{', ?' * len(TELEMETRY_COLUMNS)})")
+
+# Statistiques de toutes les versions en une requête. Chaque agrégat est
+# une recherche indexée par version : dernière session et plus longue
+# session par (version, start) et (version, duration), totaux de la
+# semaine et du mois par une plage de (version, start), dernière
+# télémétrie par (version, start). Les séries de jours consécutifs sont
+# calculées par la méthode « gaps and islands » : deux jours consécutifs
+# ont le même écart entre leur date et leur rang.
+VERSION_STATS_SQL = f"""
+WITH versions(version) AS (VALUES {', '.join(f"('{version}')" for version in VERSIONS)}),
+days AS (
+    SELECT DISTINCT s.version, date(s.start, 'unixepoch', 'localtime') AS day
+    FROM versions v JOIN sessions s ON s.version = v.version
+    WHERE s.source = 'live'
+),
+islands AS (
+    SELECT version, day, julianday(day) - ROW_NUMBER() OVER (PARTITION BY version ORDER BY day) AS grp
+    FROM days
+),
+runs AS (
+    SELECT version, MAX(day) AS last_day, COUNT(*) AS length
+    FROM islands
+    GROUP BY version, grp
+),
+streaks AS (
+    SELECT version, MAX(CASE WHEN last_day >= :yesterday THEN length END) AS current, MAX(length) AS best
+    FROM runs
+    GROUP BY version
+)
+SELECT v.version,
+       (SELECT MAX(start) FROM sessions WHERE version = v.version),
+       (SELECT duration FROM sessions WHERE version = v.version AND source = 'live'
+        ORDER BY duration DESC LIMIT 1),
+       (SELECT SUM(duration) FROM sessions WHERE version = v.version AND source = 'live' AND start >= :week),
+       (SELECT SUM(duration) FROM sessions WHERE version = v.version AND source = 'live' AND start >= :month),
+       streaks.current,
+       streaks.best,
+       {', '.join('t.' + column for column in TELEMETRY_COLUMNS)}
+FROM versions v
+LEFT JOIN streaks ON streaks.version = v.version
+LEFT JOIN telemetry t ON t.id = (SELECT id FROM telemetry WHERE version = v.version ORDER BY start DESC LIMIT 1)
+"""
+
+
+
+def _percentiles(values: List[Optional[float]]) -> Tuple[Optional[float], Optional[float]]:
+    """Retourne (p50, p95) par la méthode du rang le plus proche, en ignorant les mesures absentes."""
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None, None
+
+    def rank(percent):
+        return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+    return rank(50), rank(95)
+
+
+class SessionStore:
+    """
+    Historique des sessions de jeu stocké dans SQLite.
+
+    Chaque session terminée est une ligne (version, début, durée). Les index
+    sur (version, start) et (version, duration) permettent de calculer les
+    statistiques de toutes les versions (totaux de la semaine et du mois,
+    plus longue session, séries de jours consécutifs, dernière télémétrie)
+    par une seule requête indexée.
+
+    Attributes:
+        db_file (str): Chemin de la base SQLite
+    """
+
+    def __init__(self, data_dir: str, db_file: str = "sessions.db"):
+        """
+        Ouvre (ou crée) la base de sessions.
+
+        Args:
+            data_dir (str): Dossier des données
+            db_file (str): Nom du fichier de base
+        """
+        self.data_dir = data_dir
+        self.db_file = os.path.join(data_dir, db_file)
+        self._lock = threading.Lock()
+        os.makedirs(data_dir, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=64)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA_SQL)
+            # Les tables ajoutées depuis sont créées par le script ci-dessus
+            schema = self._get_meta('schema')
+            if schema != str(STORE_SCHEMA):
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (str(STORE_SCHEMA),))
+                if schema is not None:
+                    logger.info(f"Schéma de la base de sessions mis à jour: {schema} -> {STORE_SCHEMA}")
+        logger.info(f"SessionStore initialisé avec la base: {self.db_file}")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def record_session(self, version: str, start: float, duration: int, source: str = 'live') -> None:
+        """
+        Enregistre une session terminée.
+
+        Args:
+            version (str): Version du jeu
+            start (float): Début de la session (timestamp Unix)
+            duration (int): Durée de la session (secondes)
+            source (str): Origine de la ligne ('live' ou 'import')
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(INSERT_SESSION_SQL, (version, int(start), int(duration), source))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'enregistrement de la session {version}: {e}")
+
+    def record_launch(self, version: str, start: float, popen: float, to_window: Optional[float],
+                      to_idle: Optional[float], window_source: Optional[str] = None) -> None:
+        """
+        Enregistre la chronologie d'un lancement.
+
+        Args:
+            version (str): Version du jeu
+            start (float): Instant du lancement (timestamp Unix)
+            popen (float): Durée de l'appel à Popen (secondes)
+            to_window (Optional[float]): Délai avant la fenêtre du client (secondes, None si non atteint)
+            to_idle (Optional[float]): Délai avant la fin du chargement (secondes, None si non atteint)
+            window_source (Optional[str]): 'window' (fenêtre détectée) ou 'rss' (seuil de mémoire)
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(INSERT_LAUNCH_SQL, (version, int(start), popen, to_window, to_idle, window_source))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'enregistrement du lancement {version}: {e}")
+
+    def get_launch_stats(self, limit: int = 50) -> Dict[str, Dict]:
+        """
+        Retourne les percentiles des délais de lancement de chaque version.
+
+        Seuls les `limit` derniers lancements de chaque version sont pris en
+        compte, pour que l'effet d'un changement (préchargement, purge du
+        cache, profil) apparaisse rapidement.
+
+        Args:
+            limit (int): Nombre de lancements récents par version
+
+        Returns:
+            Dict[str, Dict]: Par version : count, puis popen, window et idle sous forme
+                de couples (p50, p95) en secondes (None sans mesure)
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(RECENT_LAUNCHES_SQL, (limit,)).fetchall()
+        except Exception as e:
+            logger.error(f"Erreur lors du calcul des délais de lancement: {e}")
+            return {}
+        samples: Dict[str, List[Tuple]] = {}
+        for version, *values in rows:
+            samples.setdefault(version, []).append(values)
+        return {
+            version: {
+                'count': len(values),
+                'popen': _percentiles([row[0] for row in values]),
+                'window': _percentiles([row[1] for row in values]),
+                'idle': _percentiles([row[2] for row in values])
+            }
+            for version, values in samples.items()
+        }
+
+    def record_telemetry(self, version: str, summary: Dict) -> None:
+        """
+        Enregistre le résumé de télémétrie d'une session de client.
+
+        Args:
+            version (str): Version du jeu
+            summary (Dict): Résumé produit par la télémétrie (start, duration, samples, peak_rss,
+                mean_cpu, read_bytes, write_bytes, peak_threads, peak_handles)
+        """
+        try:
+            values = [int(summary[column]) if column != 'mean_cpu' else float(summary[column])
+                      for column in TELEMETRY_COLUMNS]
+            with self._lock, self._conn:
+                self._conn.execute(INSERT_TELEMETRY_SQL, (version, *values))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'enregistrement de la télémétrie {version}: {e}")
+
+    def import_totals(self, game_time: Dict, stats: Dict) -> bool:
+        """
+        Importe une seule fois les totaux historiques des sections JSON.
+
+        Les sections `game_time` et `stats` du magasin de données ne
+        contiennent que des cumuls : chaque version est importée comme une
+        ligne 'import' qui conserve le temps total et la date de dernière
+        utilisation, sans fausser les agrégats par période qui ne portent que
+        sur les sessions réelles.
+
+        Args:
+            game_time (Dict): Section temps de jeu (times, last_used, launches)
+            stats (Dict): Section statistiques par version
+
+        Returns:
+            bool: True si un import a eu lieu
+        """
+        try:
+            with self._lock:
+                if self._get_meta('json_imported'):
+                    return False
+
+                rows = []
+                for version in VERSIONS:
+                    version_stats = stats.get(version, {}) or {}
+                    total = max(int(game_time.get('times', {}).get(version) or 0),
+                                int(version_stats.get('total_time') or 0))
+                    last_used = game_time.get('last_used', {}).get(version) or version_stats.get('last_session')
+                    if not total and not last_used:
+                        continue
+                    start = datetime.strptime(last_used, "%Y-%m-%d %H:%M:%S").timestamp() if last_used else time.time()
+                    rows.append((version, int(start), total, 'import'))
+
+                with self._conn:
+                    self._conn.executemany(INSERT_SESSION_SQL, rows)
+                    self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)",
+                                       (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+            logger.info(f"Historique JSON importé: {len(rows)} versions")
+            return True
+        except Exception as e:
+            logger.error(f"Erreur lors de l'import des fichiers JSON: {e}")
+            return False
+
+    def get_version_stats(self) -> Dict[str, Dict]:
+        """
+        Retourne les statistiques de chaque version en une requête.
+
+        Returns:
+            Dict[str, Dict]: Par version : last_start (None sans session), longest, week,
+                month, streaks ({'current': jours, 'best': jours}) et telemetry (résumé
+                de la dernière session mesurée, None si aucune)
+        """
+        now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today - timedelta(days=now.weekday())
+        month_start = today.replace(day=1)
+        params = {
+            'yesterday': (today - timedelta(days=1)).date().isoformat(),
+            'week': int(week_start.timestamp()),
+            'month': int(month_start.timestamp())
+        }
+        try:
+            with self._lock:
+                rows = self._conn.execute(VERSION_STATS_SQL, params).fetchall()
+        except Exception as e:
+            logger.error(f"Erreur lors du calcul des statistiques des sessions: {e}")
+            return {}
+        stats = {}
+        for version, last_start, longest, week, month, current, best, *telemetry in rows:
+            stats[version] = {
+                'last_start': last_start,
+                'longest': longest or 0,
+                'week': week or 0,
+                'month': month or 0,
+                'streaks': {'current': current or 0, 'best': best or 0},
+                'telemetry': dict(zip(TELEMETRY_COLUMNS, telemetry)) if telemetry[0] is not None else None
+            }
+        return stats
+
+    def close(self) -> None:
+        """Ferme la connexion à la base."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture de la base de sessions: {e}")
@@ -1,28 +1,18 @@
-import os
-import json
+from .data_store import get_default_store
+from .config_wtf import PERFORMANCE_PROFILES
+from .launch_profiles import DEFAULT_LAUNCH_PROFILE
 
 class SettingsManager:
-    def __init__(self):
-        self.data_dir = "data"
-        self.settings_file = os.path.join(self.data_dir, "settings.json")
-        self.settings = self._load_settings()
-
-    def _load_settings(self):
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-        
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                return {'paths': {'vanilla': '', 'tbc': '', 'wotlk': ''}}
-        return {'paths': {'vanilla': '', 'tbc': '', 'wotlk': ''}}
+    def __init__(self, store=None):
+        self.store = store or get_default_store()
+        self.settings = self.store.section('settings')
+        if 'paths' not in self.settings:
+            self.settings['paths'] = {'vanilla': '', 'tbc': '', 'wotlk': ''}
 
     def save_settings(self):
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            self.store.mark_dirty('settings')
+            self.store.save()
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des paramètres: {e}")
 
@@ -30,7 +20,79 @@ class SettingsManager:
         return self.settings['paths'].get(version, '')
 
     def set_path(self, version, path):
-        if 'paths' not in self.settings:
-            self.settings['paths'] = {}
-        self.settings['paths'][version] = path
-        self.save_settings() 
\ No newline at end of file
+        with self.store.lock:
+            if 'paths' not in self.settings:
+                self.settings['paths'] = {}
+            self.settings['paths'][version] = path
+        self.store.mark_dirty('settings')
+
+    def get_cache_policy(self, version):
+        """Retourne la politique de cache d'une version (auto_clear, max_age_days, max_size_mb)."""
+        policy = {'auto_clear': False, 'max_age_days': None, 'max_size_mb': None}
+        policy.update(self.settings.get('cache', {}).get(version, {}))
+        return policy
+
+    def set_cache_policy(self, version, policy):
+        with self.store.lock:
+            self.settings.setdefault('cache', {})[version] = dict(policy)
+        self.store.mark_dirty('settings')
+
+    def get_config_profiles(self):
+        """Retourne les profils Config.wtf : profils intégrés puis profils personnalisés des paramètres."""
+        profiles = dict(PERFORMANCE_PROFILES)
+        profiles.update(self.settings.get('config_profiles', {}))
+        return profiles
+
+    def get_config_profile(self, version):
+        """Retourne l'identifiant du profil Config.wtf appliqué au lancement ('' pour aucun)."""
+        profile = self.settings.get('config_profile', {}).get(version, '')
+        return profile if profile in self.get_config_profiles() else ''
+
+    def set_config_profile(self, version, profile):
+        with self.store.lock:
+            self.settings.setdefault('config_profile', {})[version] = profile
+        self.store.mark_dirty('settings')
+
+    def get_prefetch_policy(self, version):
+        """Retourne la politique de préchargement d'une version (enabled, budget_mb)."""
+        policy = {'enabled': False, 'budget_mb': 2048}
+        policy.update(self.settings.get('prefetch', {}).get(version, {}))
+        return policy
+
+    def set_prefetch_policy(self, version, policy):
+        with self.store.lock:
+            self.settings.setdefault('prefetch', {})[version] = dict(policy)
+        self.store.mark_dirty('settings')
+
+    def get_launch_profile(self, version):
+        """Retourne le profil de lancement d'une version (affinity, priority, io_priority)."""
+        profile = dict(DEFAULT_LAUNCH_PROFILE)
+        profile.update(self.settings.get('launch_profiles', {}).get(version, {}))
+        return profile
+
+    def set_launch_profile(self, version, profile):
+        with self.store.lock:
+            self.settings.setdefault('launch_profiles', {})[version] = dict(profile)
+        self.store.mark_dirty('settings')
+
+    def get_telemetry(self):
+        """Retourne les réglages de télémétrie des clients (enabled, interval en secondes)."""
+        telemetry = {'enabled': False, 'interval': 2.0}
+        telemetry.update(self.settings.get('telemetry', {}))
+        return telemetry
+
+    def set_telemetry(self, telemetry):
+        with self.store.lock:
+            self.settings['telemetry'] = dict(telemetry)
+        self.store.mark_dirty('settings')
+
+    def get_multibox(self, version):
+        """Retourne le lancement multiple d'une version (clients, stagger en secondes entre deux démarrages)."""
+        multibox = {'clients': 1, 'stagger': 10}
+        multibox.update(self.settings.get('multibox', {}).get(version, {}))
+        return multibox
+
+    def set_multibox(self, version, multibox):
+        with self.store.lock:
+            self.settings.setdefault('multibox', {})[version] = dict(multibox)
+        self.store.mark_dirty('settings')
@@ -0,0 +1,182 @@
+import os
+import sys
+import json
+import socket
+import secrets
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from .persistence import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Délai maximal d'échange avec l'instance déjà lancée (secondes)
+DEFAULT_IPC_TIMEOUT = 1.0
+
+
+class SingleInstance:
+    """
+    Garantit une seule instance du launcher et relaie les commandes des suivantes.
+
+    La première instance verrouille `launcher.lock` (verrou système libéré
+    automatiquement si le processus meurt) puis écoute sur un port local
+    publié dans `launcher.instance.json` avec un jeton aléatoire. Une instance
+    suivante n'obtient pas le verrou : elle envoie sa commande (« show »,
+    « launch wotlk »…) à la première instance puis se termine.
+
+    L'écoute démarre dès l'obtention du verrou, avant la construction de
+    l'interface : les commandes reçues avant que `set_handler` soit appelé
+    sont mises en attente puis transmises dans l'ordre.
+
+    Attributes:
+        lock_file (str): Chemin du fichier verrou
+        info_file (str): Chemin du fichier décrivant l'instance active
+    """
+
+    def __init__(self, data_dir: str):
+        """
+        Initialise le garde d'instance unique.
+
+        Args:
+            data_dir (str): Dossier des données
+        """
+        self.data_dir = data_dir
+        self.lock_file = os.path.join(data_dir, 'launcher.lock')
+        self.info_file = os.path.join(data_dir, 'launcher.instance.json')
+        self._lock_handle = None
+        self._server = None
+        self._token = None
+        self._handler: Optional[Callable[[str], None]] = None
+        self._pending = []
+        self._handler_lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """
+        Tente de devenir l'instance principale.
+
+        Returns:
+            bool: True si le verrou a été obtenu
+        """
+        os.makedirs(self.data_dir, exist_ok=True)
+        handle = open(self.lock_file, 'a+')
+        try:
+            if sys.platform == 'win32':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._lock_handle = handle
+        return True
+
+    def serve(self, handler: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Écoute les commandes des instances suivantes.
+
+        Args:
+            handler (Optional[Callable[[str], None]]): Fonction appelée (dans le thread d'écoute)
+                pour chaque commande ; peut être fournie plus tard par `set_handler`
+        """
+        if handler is not None:
+            self.set_handler(handler)
+        self._token = secrets.token_hex(16)
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(4)
+        atomic_write_json(self.info_file, {
+            'pid': os.getpid(),
+            'port': self._server.getsockname()[1],
+            'token': self._token
+        })
+        thread = threading.Thread(target=self._accept_loop, args=(self._server,),
+                                  name="SingleInstanceServer", daemon=True)
+        thread.start()
+
+    def set_handler(self, handler: Callable[[str], None]) -> None:
+        """
+        Définit la fonction qui traite les commandes et lui transmet celles en attente.
+
+        Args:
+            handler (Callable[[str], None]): Fonction appelée pour chaque commande
+        """
+        with self._handler_lock:
+            self._handler = handler
+            pending, self._pending = self._pending, []
+        for command in pending:
+            handler(command)
+
+    def _dispatch(self, command: str) -> None:
+        with self._handler_lock:
+            handler = self._handler
+            if handler is None:
+                # Interface pas encore prête : la commande sera transmise par set_handler
+                self._pending.append(command)
+                return
+        handler(command)
+
+    def _accept_loop(self, server: socket.socket) -> None:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            try:
+                with conn:
+                    conn.settimeout(DEFAULT_IPC_TIMEOUT)
+                    data = conn.makefile('r', encoding='utf-8').readline().strip()
+                    token, _, command = data.partition(' ')
+                    if not secrets.compare_digest(token, self._token):
+                        logger.warning("Commande d'instance rejetée: jeton invalide")
+                        continue
+                    conn.sendall(b'ok\n')
+                self._dispatch(command)
+            except Exception as e:
+                logger.error(f"Erreur lors de la réception d'une commande d'instance: {e}")
+
+    def send(self, command: str, timeout: float = DEFAULT_IPC_TIMEOUT) -> bool:
+        """
+        Transmet une commande à l'instance principale.
+
+        Args:
+            command (str): Commande à transmettre (ex: "show", "launch wotlk")
+            timeout (float): Délai maximal de l'échange
+
+        Returns:
+            bool: True si l'instance principale a accusé réception
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with open(self.info_file, 'r', encoding='utf-8') as f:
+                    info = json.load(f)
+                with socket.create_connection(('127.0.0.1', info['port']), timeout=timeout) as conn:
+                    conn.sendall(f"{info['token']} {command}\n".encode('utf-8'))
+                    return conn.makefile('r', encoding='utf-8').readline().strip() == 'ok'
+            except (OSError, ValueError, KeyError) as e:
+                # L'instance principale peut être en train de publier son port
+                if time.monotonic() >= deadline:
+                    logger.error(f"Impossible de joindre l'instance principale: {e}")
+                    return False
+                time.sleep(0.05)
+
+    def release(self) -> None:
+        """Arrête l'écoute et libère le verrou."""
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
+        if self._lock_handle is not None:
+            try:
+                os.remove(self.info_file)
+            except OSError:
+                pass
+            self._lock_handle.close()
+            self._lock_handle = None
@@ -0,0 +1,84 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """
+    Chronologie du démarrage du launcher.
+
+    Chaque étape est enregistrée avec son décalage depuis l'origine, sa durée
+    et le thread qui l'a exécutée, ce qui distingue le chemin critique
+    (thread principal) des initialisations différées.
+
+    Attributes:
+        enabled (bool): True si le rapport doit être produit
+        origin (float): Instant de référence (time.perf_counter)
+    """
+
+    def __init__(self, enabled: bool = False, origin: Optional[float] = None):
+        """
+        Initialise le profileur.
+
+        Args:
+            enabled (bool): Active le rapport de démarrage
+            origin (Optional[float]): Instant de référence, par défaut maintenant
+        """
+        self.enabled = enabled
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.stages: List[Tuple[str, float, float, str]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Enregistre une étape déjà mesurée.
+
+        Args:
+            name (str): Nom de l'étape
+            start (float): Début (time.perf_counter)
+            end (float): Fin (time.perf_counter)
+        """
+        with self._lock:
+            self.stages.append((name, start - self.origin, end - start, threading.current_thread().name))
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Mesure le bloc `with` comme une étape du démarrage.
+
+        Args:
+            name (str): Nom de l'étape
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name: str) -> None:
+        """
+        Enregistre un jalon instantané (ex: premier affichage).
+
+        Args:
+            name (str): Nom du jalon
+        """
+        now = time.perf_counter()
+        self.record(name, now, now)
+
+    def report(self) -> str:
+        """
+        Produit le rapport texte de la chronologie.
+
+        Returns:
+            str: Une ligne par étape, triées par instant de début
+        """
+        with self._lock:
+            stages = sorted(self.stages, key=lambda stage: stage[1])
+        lines = ["Chronologie du démarrage (ms) :"]
+        for name, offset, duration, thread_name in stages:
+            lines.append(f"  {offset * 1000:8.1f}  +{duration * 1000:7.1f}  {name:<24} [{thread_name}]")
+        return '\n'.join(lines)
@@ -1,29 +1,14 @@
-import os
-import json
 from datetime import datetime
+from .data_store import get_default_store
 
 class StatsManager:
-    def __init__(self):
-        self.data_dir = "data"
-        self.stats_file = os.path.join(self.data_dir, "stats.json")
-        self.stats = self._load_stats()
-
-    def _load_stats(self):
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-        
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                return {'vanilla': {}, 'tbc': {}, 'wotlk': {}}
-        return {'vanilla': {}, 'tbc': {}, 'wotlk': {}}
+    def __init__(self, store=None):
+        self.store = store or get_default_store()
+        self.stats = self.store.section('stats')
 
     def _save_stats(self):
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=4)
+            self.store.mark_dirty('stats')
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des statistiques: {e}")
 
@@ -31,16 +16,17 @@ class StatsManager:
         return self.stats.get(version, {})
 
     def update_stats(self, version, session_time):
-        if version not in self.stats:
-            self.stats[version] = {
-                'sessions': 0,
-                'last_session': None,
-                'total_time': 0
-            }
-        
-        self.stats[version]['sessions'] = self.stats[version].get('sessions', 0) + 1
-        self.stats[version]['last_session'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.stats[version]['total_time'] = self.stats[version].get('total_time', 0) + session_time
+        with self.store.lock:
+            if version not in self.stats:
+                self.stats[version] = {
+                    'sessions': 0,
+                    'last_session': None,
+                    'total_time': 0
+                }
+            
+            self.stats[version]['sessions'] = self.stats[version].get('sessions', 0) + 1
+            self.stats[version]['last_session'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.stats[version]['total_time'] = self.stats[version].get('total_time', 0) + session_time
         self._save_stats()
 
     def get_launches(self, version):
@@ -0,0 +1,250 @@
+import sys
+import time
+import logging
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .process_sampler import CpuMeter, PeriodicSampler
+
+logger = logging.getLogger(__name__)
+
+# Intervalle par défaut entre deux échantillons (secondes)
+DEFAULT_SAMPLE_INTERVAL = 2.0
+# Nombre d'échantillons conservés par processus (30 minutes à 2 secondes)
+DEFAULT_CAPACITY = 900
+
+# Mesures relevées à chaque échantillon
+METRICS = ('cpu', 'rss', 'threads', 'read_bytes', 'write_bytes', 'handles')
+
+
+class RingBuffer:
+    """
+    Tampon circulaire de nombres à taille fixe.
+
+    Les valeurs sont stockées dans un `array` alloué une fois pour toutes :
+    une fois plein, chaque ajout remplace la plus ancienne valeur, et la
+    mémoire utilisée ne dépend pas de la durée de la session.
+
+    Attributes:
+        capacity (int): Nombre maximal de valeurs conservées
+    """
+
+    def __init__(self, capacity: int, typecode: str = 'd'):
+        self.capacity = max(1, capacity)
+        self._data = array(typecode, [0]) * self.capacity
+        self._next = 0
+        self._count = 0
+
+    def append(self, value) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def values(self) -> List:
+        """Retourne les valeurs conservées, de la plus ancienne à la plus récente."""
+        if self._count < self.capacity:
+            return self._data[:self._count].tolist()
+        return (self._data[self._next:] + self._data[:self._next]).tolist()
+
+
+class ProcessTelemetry:
+    """
+    Télémétrie d'un processus : tampons circulaires et cumuls de la session.
+
+    Les tampons gardent les derniers échantillons de chaque mesure ; le
+    résumé de la session (pic mémoire, CPU moyen, E/S totales) est tenu à
+    jour par des cumuls, sans relire les tampons.
+    """
+
+    def __init__(self, version: str, pid: int, capacity: int):
+        self.version = version
+        self.pid = pid
+        self.start = datetime.now().timestamp()
+        self.started_at = time.monotonic()
+        self.buffers = {metric: RingBuffer(capacity) for metric in METRICS}
+        self.timestamps = RingBuffer(capacity)
+        self.process = None
+        self.samples = 0
+        self.cpu_sum = 0.0
+        self.peak_rss = 0
+        self.peak_threads = 0
+        self.peak_handles = 0
+        self.read_bytes = 0
+        self.write_bytes = 0
+        self._cpu = CpuMeter()
+
+    def sample(self, psutil) -> None:
+        """Relève un échantillon par un seul appel psutil `oneshot()`."""
+        if self.process is None:
+            self.process = psutil.Process(self.pid)
+        process = self.process
+        with process.oneshot():
+            cpu_times = process.cpu_times()
+            rss = process.memory_info().rss
+            threads = process.num_threads()
+            try:
+                io = process.io_counters()
+            except (AttributeError, psutil.AccessDenied):
+                io = None
+            try:
+                handles = process.num_handles() if sys.platform == 'win32' else process.num_fds()
+            except (AttributeError, psutil.AccessDenied):
+                handles = 0
+        now = time.monotonic()
+
+        cpu = self._cpu.update(cpu_times, now)
+        if cpu is None:
+            # Le premier échantillon sert de référence au calcul du CPU
+            return
+
+        # Les compteurs d'E/S sont cumulés depuis le démarrage du processus
+        if io is not None:
+            self.read_bytes, self.write_bytes = io.read_bytes, io.write_bytes
+        values = {'cpu': cpu, 'rss': rss, 'threads': threads, 'read_bytes': self.read_bytes,
+                  'write_bytes': self.write_bytes, 'handles': handles}
+        for metric, value in values.items():
+            self.buffers[metric].append(value)
+        self.timestamps.append(now - self.started_at)
+
+        self.samples += 1
+        self.cpu_sum += cpu
+        self.peak_rss = max(self.peak_rss, rss)
+        self.peak_threads = max(self.peak_threads, threads)
+        self.peak_handles = max(self.peak_handles, handles)
+
+    def summary(self) -> Dict:
+        """
+        Retourne le résumé de la session.
+
+        Returns:
+            Dict: start, duration (secondes), samples, peak_rss, mean_cpu, read_bytes,
+                write_bytes, peak_threads et peak_handles
+        """
+        return {
+            'start': self.start,
+            'duration': int(time.monotonic() - self.started_at),
+            'samples': self.samples,
+            'peak_rss': self.peak_rss,
+            'mean_cpu': self.cpu_sum / self.samples if self.samples else 0.0,
+            'read_bytes': self.read_bytes,
+            'write_bytes': self.write_bytes,
+            'peak_threads': self.peak_threads,
+            'peak_handles': self.peak_handles
+        }
+
+
+class TelemetrySampler(PeriodicSampler):
+    """
+    Échantillonne la télémétrie des clients en cours depuis un seul thread.
+
+    Chaque processus suivi a ses tampons circulaires de taille fixe (CPU,
+    mémoire de travail, threads, octets lus et écrits, handles ou
+    descripteurs ouverts), remplis par un appel psutil `oneshot()` par
+    échantillon. À la fin du processus (événement 'exit' du ProcessMonitor,
+    ou processus disparu lors d'un échantillon), le résumé de la session
+    est enregistré dans l'historique. Le thread s'arrête dès qu'aucun
+    processus n'est suivi. Les sessions encore en cours à l'arrêt du
+    launcher ne sont pas enregistrées : leur résumé serait partiel.
+
+    Attributes:
+        interval (float): Intervalle entre deux échantillons
+        capacity (int): Nombre d'échantillons conservés par processus
+    """
+
+    thread_name = "TelemetrySampler"
+
+    def __init__(self, session_store=None, monitor=None, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialise l'échantillonneur.
+
+        Args:
+            session_store: Historique des sessions où enregistrer les résumés
+            monitor: ProcessMonitor signalant la fin des processus
+            interval (float): Intervalle entre deux échantillons (secondes)
+            capacity (int): Nombre d'échantillons conservés par processus
+        """
+        super().__init__(interval)
+        self.session_store = session_store
+        self.capacity = capacity
+        self._processes: Dict[int, ProcessTelemetry] = {}
+        if monitor is not None:
+            monitor.add_listener(self._on_process_event)
+
+    def watch(self, version: str, pid: int) -> None:
+        """
+        Commence l'échantillonnage d'un processus.
+
+        Args:
+            version (str): Version du jeu
+            pid (int): PID du client
+        """
+        with self._lock:
+            self._processes[pid] = ProcessTelemetry(version, pid, self.capacity)
+            self._ensure_running()
+
+    def unwatch(self, pid: int, record: bool = True) -> Optional[Dict]:
+        """
+        Arrête l'échantillonnage d'un processus et enregistre le résumé de sa session.
+
+        Args:
+            pid (int): PID du client
+            record (bool): False pour ne pas enregistrer le résumé (session inachevée)
+
+        Returns:
+            Optional[Dict]: Résumé de la session, None si le processus n'était pas suivi
+        """
+        with self._lock:
+            telemetry = self._processes.pop(pid, None)
+        if telemetry is None:
+            return None
+        summary = telemetry.summary()
+        logger.info(f"Télémétrie {telemetry.version} (PID: {pid}): {summary['samples']} échantillons, "
+                    f"pic mémoire {summary['peak_rss']} octets, CPU moyen {summary['mean_cpu']:.1f}%")
+        if record and self.session_store and summary['samples']:
+            self.session_store.record_telemetry(telemetry.version, summary)
+        return summary
+
+    def get_series(self, pid: int) -> Optional[Dict[str, List]]:
+        """
+        Retourne les derniers échantillons d'un processus.
+
+        Returns:
+            Optional[Dict[str, List]]: Mesure -> valeurs (plus 'time', secondes depuis le début
+                du suivi), None si le processus n'est pas suivi
+        """
+        with self._lock:
+            telemetry = self._processes.get(pid)
+            if telemetry is None:
+                return None
+            series = {metric: buffer.values() for metric, buffer in telemetry.buffers.items()}
+            series['time'] = telemetry.timestamps.values()
+        return series
+
+    def stop(self) -> None:
+        """Arrête l'échantillonnage ; les sessions en cours ne sont pas enregistrées."""
+        self._stop_thread()
+        with self._lock:
+            pids = list(self._processes)
+        for pid in pids:
+            self.unwatch(pid, record=False)
+
+    def _on_process_event(self, event: Dict) -> None:
+        """Clôt la télémétrie d'un processus terminé (appelé dans le thread du moniteur)."""
+        if event['type'] == 'exit':
+            self.unwatch(event['pid'])
+
+    def _items(self) -> List[ProcessTelemetry]:
+        return list(self._processes.values())
+
+    def _sample_all(self, psutil, processes: List[ProcessTelemetry]) -> None:
+        for telemetry in processes:
+            try:
+                telemetry.sample(psutil)
+            except psutil.Error:
+                # Processus terminé entre deux échantillons
+                self.unwatch(telemetry.pid)
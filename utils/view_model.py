@@ -0,0 +1,54 @@
+from typing import Any, Dict, Hashable
+
+
+class ViewModel:
+    """
+    État affiché par l'interface, avec suivi des champs modifiés.
+
+    Les valeurs sont comparées à la dernière valeur connue : seuls les
+    champs réellement modifiés sont renvoyés par `pop_changes`, ce qui permet
+    de ne reconfigurer que les widgets dont l'affichage change.
+
+    Attributes:
+        values (dict): Dernière valeur de chaque champ
+    """
+
+    def __init__(self):
+        self.values: Dict[Hashable, Any] = {}
+        self._dirty = set()
+
+    def set(self, key: Hashable, value: Any) -> bool:
+        """
+        Met à jour un champ.
+
+        Args:
+            key (Hashable): Identifiant du champ
+            value (Any): Nouvelle valeur
+
+        Returns:
+            bool: True si la valeur a changé
+        """
+        if key in self.values and self.values[key] == value:
+            return False
+        self.values[key] = value
+        self._dirty.add(key)
+        return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retourne la valeur courante d'un champ."""
+        return self.values.get(key, default)
+
+    def invalidate(self) -> None:
+        """Marque tous les champs comme modifiés (ex: widgets recréés)."""
+        self._dirty.update(self.values)
+
+    def pop_changes(self) -> Dict[Hashable, Any]:
+        """
+        Retourne les champs modifiés depuis le dernier appel et les marque comme appliqués.
+
+        Returns:
+            Dict[Hashable, Any]: Champs modifiés et leurs valeurs
+        """
+        changes = {key: self.values[key] for key in self._dirty}
+        self._dirty.clear()
+        return changes